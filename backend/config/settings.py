@@ -65,6 +65,7 @@ INSTALLED_APPS = [
 ]
 
 MIDDLEWARE = [
+    'interviews.timing.ServerTimingMiddleware',
     'corsheaders.middleware.CorsMiddleware',
     'django.middleware.security.SecurityMiddleware',
     'whitenoise.middleware.WhiteNoiseMiddleware',
@@ -97,13 +98,129 @@ TEMPLATES = [
 WSGI_APPLICATION = 'config.wsgi.application'
 
 # Database configuration
+# Serverless instances (api/index.py) freeze and multiply, so persistent
+# connections there only pin server slots; prefer DB_POOL or an external pooler.
+IS_SERVERLESS = bool(os.getenv('VERCEL') or os.getenv('AWS_LAMBDA_FUNCTION_NAME'))
+
 DATABASES = {
     'default': dj_database_url.config(
         default=f'sqlite:///{BASE_DIR}/db.sqlite3',
-        conn_max_age=600
+        conn_max_age=int(os.getenv('DB_CONN_MAX_AGE', '0' if IS_SERVERLESS else '600')),
+        conn_health_checks=True,
     )
 }
 
+if DATABASES['default']['ENGINE'] == 'django.db.backends.postgresql':
+    DATABASES['default'].setdefault('OPTIONS', {})
+
+    # Django's built-in psycopg pool (psycopg[pool]); one pool per process.
+    # conn_health_checks above makes the pool check connections on checkout.
+    if os.getenv('DB_POOL', 'False').lower() == 'true':
+        DATABASES['default']['CONN_MAX_AGE'] = 0  # the pool owns connection lifetime
+        DATABASES['default']['OPTIONS']['pool'] = {
+            'min_size': int(os.getenv('DB_POOL_MIN_SIZE', '1' if IS_SERVERLESS else '2')),
+            'max_size': int(os.getenv('DB_POOL_MAX_SIZE', '5' if IS_SERVERLESS else '10')),
+            'timeout': float(os.getenv('DB_POOL_TIMEOUT', '10')),
+            'max_idle': float(os.getenv('DB_POOL_MAX_IDLE', '60' if IS_SERVERLESS else '600')),
+        }
+
+    # Behind a transaction-mode pooler (PgBouncer, Supavisor, RDS Proxy) a
+    # session is not pinned to one server connection: no server-side cursors
+    # and no server-side prepared statements.
+    if os.getenv('DB_TRANSACTION_POOLER', 'False').lower() == 'true':
+        DATABASES['default']['DISABLE_SERVER_SIDE_CURSORS'] = True
+        DATABASES['default']['OPTIONS']['prepare_threshold'] = None
+
+# Cache: Redis when REDIS_URL is set (shared across instances), else per-process memory
+if os.getenv('REDIS_URL'):
+    CACHES = {
+        'default': {
+            'BACKEND': 'django.core.cache.backends.redis.RedisCache',
+            'LOCATION': os.getenv('REDIS_URL'),
+        }
+    }
+else:
+    CACHES = {
+        'default': {
+            'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+        }
+    }
+
+# Public share-link token resolution (seconds). Without REDIS_URL the cache is
+# per process, so SHARE_LINK_CACHE_TTL is capped at the memory TTL.
+SHARE_LINK_CACHE_TTL = int(os.getenv('SHARE_LINK_CACHE_TTL', '300'))
+SHARE_LINK_MEMORY_CACHE_TTL = int(os.getenv('SHARE_LINK_MEMORY_CACHE_TTL', '10'))
+# Cache-Control max-age on the public share-link response
+SHARE_LINK_PUBLIC_MAX_AGE = int(os.getenv('SHARE_LINK_PUBLIC_MAX_AGE', '60'))
+
+# `manage.py archive_interviews` moves interviews completed longer ago than
+# this into the archive tables
+INTERVIEW_ARCHIVE_AFTER_DAYS = int(os.getenv('INTERVIEW_ARCHIVE_AFTER_DAYS', '180'))
+
+# Local question bank (`manage.py build_question_bank`): interviews without a
+# resume are served from it when each question type has at least
+# POOL_FACTOR x the needed questions whose role/skill tags cover MIN_MATCH of
+# the interview's role and skill terms; otherwise the LLM generates them.
+QUESTION_BANK_ENABLED = os.getenv('QUESTION_BANK_ENABLED', 'True').lower() == 'true'
+QUESTION_BANK_MIN_MATCH = float(os.getenv('QUESTION_BANK_MIN_MATCH', '0.5'))
+QUESTION_BANK_POOL_FACTOR = int(os.getenv('QUESTION_BANK_POOL_FACTOR', '2'))
+QUESTION_BANK_REFRESH_SECONDS = int(os.getenv('QUESTION_BANK_REFRESH_SECONDS', '300'))
+
+# Skills taxonomy JSON used by the resume parser; empty means the bundled
+# interviews/data/skills_taxonomy.json
+SKILLS_TAXONOMY_PATH = os.getenv('SKILLS_TAXONOMY_PATH', '')
+
+# Resume text extraction limits. Extraction stops early with partial text at
+# MAX_PAGES pages, MAX_CHARS characters or EXTRACT_TIMEOUT seconds. With
+# EXTRACT_WORKERS > 0 it runs in a process pool whose workers are capped at
+# EXTRACT_MEMORY_MB of address space and killed if they overrun the timeout
+# (counted from when a worker picks the upload up). At most EXTRACT_QUEUE
+# uploads wait for a free worker; the rest come back truncated as 'busy'.
+# Serverless functions can't host a process pool, so there it runs in-process
+# under the platform's own time and memory limits; elsewhere in-process
+# extraction (EXTRACT_WORKERS=0) has no hard bound and is for DEBUG only.
+# Uploads larger than MAX_UPLOAD_MB are rejected before they are read.
+RESUME_MAX_UPLOAD_MB = float(os.getenv('RESUME_MAX_UPLOAD_MB', '10'))
+RESUME_MAX_PAGES = int(os.getenv('RESUME_MAX_PAGES', '30'))
+RESUME_MAX_CHARS = int(os.getenv('RESUME_MAX_CHARS', '100000'))
+RESUME_EXTRACT_TIMEOUT = float(os.getenv('RESUME_EXTRACT_TIMEOUT', '10'))
+RESUME_EXTRACT_WORKERS = int(os.getenv('RESUME_EXTRACT_WORKERS', '0' if IS_SERVERLESS else '2'))
+RESUME_EXTRACT_MEMORY_MB = int(os.getenv('RESUME_EXTRACT_MEMORY_MB', '512'))
+RESUME_EXTRACT_QUEUE = int(os.getenv('RESUME_EXTRACT_QUEUE', '8'))
+if RESUME_EXTRACT_WORKERS <= 0 and not (DEBUG or IS_SERVERLESS):
+    from django.core.exceptions import ImproperlyConfigured
+
+    raise ImproperlyConfigured(
+        'RESUME_EXTRACT_WORKERS=0 extracts resumes in the web process without a hard time or '
+        'memory limit; it is only allowed with DEBUG=True or on serverless platforms.'
+    )
+
+# Extracted resume text and parses are cached by file SHA-256; least recently
+# used entries are evicted once the cached payloads exceed CACHE_MAX_MB
+RESUME_CACHE_ENABLED = os.getenv('RESUME_CACHE_ENABLED', 'True').lower() == 'true'
+RESUME_CACHE_MAX_MB = int(os.getenv('RESUME_CACHE_MAX_MB', '256'))
+
+# Resumes are parsed in memory; set this to also keep interview uploads
+# under MEDIA_ROOT/resumes
+RESUME_PERSIST_UPLOADS = os.getenv('RESUME_PERSIST_UPLOADS', 'False').lower() == 'true'
+
+# Per-request timing (interviews.timing): Server-Timing headers and a log line
+# per request; requests slower than SLOW_MS are logged as warnings with their
+# slowest SQL
+REQUEST_TIMING_ENABLED = os.getenv('REQUEST_TIMING_ENABLED', 'True').lower() == 'true'
+REQUEST_SLOW_MS = float(os.getenv('REQUEST_SLOW_MS', '1000'))
+
+# SQLite production profile: WAL, busy timeout, synchronous=NORMAL and mmap on
+# every connection, BEGIN IMMEDIATE transactions, and a single writer thread
+# for background writes.
+SQLITE_TUNING = os.getenv('SQLITE_TUNING', 'True').lower() == 'true'
+SQLITE_BUSY_TIMEOUT_MS = int(os.getenv('SQLITE_BUSY_TIMEOUT_MS', '5000'))
+SQLITE_MMAP_SIZE = int(os.getenv('SQLITE_MMAP_SIZE', str(256 * 1024 * 1024)))
+SQLITE_SERIALIZE_BACKGROUND_WRITES = os.getenv('SQLITE_SERIALIZE_BACKGROUND_WRITES', 'True').lower() == 'true'
+
+if SQLITE_TUNING and DATABASES['default']['ENGINE'] == 'django.db.backends.sqlite3':
+    DATABASES['default']['ENGINE'] = 'interviews.backends.sqlite3'
+
 # Logging configuration for Render
 LOGGING = {
     'version': 1,
@@ -167,8 +284,18 @@ REST_FRAMEWORK = {
     'DEFAULT_AUTHENTICATION_CLASSES': [],
     'DEFAULT_PERMISSION_CLASSES': [],
     'DEFAULT_RENDERER_CLASSES': [
-        'rest_framework.renderers.JSONRenderer',
+        'interviews.renderers.FastJSONRenderer',
     ],
+    'DEFAULT_PARSER_CLASSES': [
+        'interviews.renderers.FastJSONParser',
+        'rest_framework.parsers.FormParser',
+        'rest_framework.parsers.MultiPartParser',
+    ],
+    'DEFAULT_PAGINATION_CLASS': 'interviews.pagination.CreatedAtCursorPagination',
+    'PAGE_SIZE': int(os.getenv('API_PAGE_SIZE', '50')),
 }
 
+# Upper bound for the `page_size` query param on cursor-paginated endpoints
+API_MAX_PAGE_SIZE = int(os.getenv('API_MAX_PAGE_SIZE', '200'))
+
 OPENAI_API_KEY = os.getenv('OPENAI_API_KEY', '')
@@ -0,0 +1,102 @@
+import logging
+from datetime import timedelta
+
+from django.conf import settings
+from django.db import models, transaction
+from django.utils import timezone
+
+from .models import ArchivedInterview, Interview, Question
+from .results import (
+    build_results_payload, get_results_snapshot, payload_etag, review_is_final,
+)
+from .serializers import InterviewSerializer
+
+logger = logging.getLogger(__name__)
+
+
+def archive_cutoff(days=None):
+    """Interviews completed and untouched since this time are archivable."""
+    if days is None:
+        days = settings.INTERVIEW_ARCHIVE_AFTER_DAYS
+    return timezone.now() - timedelta(days=days)
+
+
+def archivable_interviews(cutoff):
+    return Interview.objects.filter(status='completed', updated_at__lt=cutoff).order_by('updated_at', 'id')
+
+
+def _archive_row(interview) -> ArchivedInterview:
+    questions = list(interview.questions.all())
+    detail = InterviewSerializer(interview).data
+
+    snapshot = get_results_snapshot(interview) if review_is_final(interview) else None
+    if snapshot is not None:
+        results, results_etag = snapshot.payload, snapshot.etag
+    else:
+        results = build_results_payload(interview, questions)
+        results_etag = payload_etag(results)
+
+    return ArchivedInterview(
+        interview_id=interview.pk,
+        clerk_user_id=interview.clerk_user_id,
+        share_link_id=interview.share_link_id,
+        job_title=interview.job_title,
+        difficulty=interview.difficulty,
+        status=interview.status,
+        overall_score=interview.overall_score,
+        ai_final_score=interview.ai_final_score,
+        ai_review_generated_at=interview.ai_review_generated_at,
+        created_at=interview.created_at,
+        updated_at=interview.updated_at,
+        completed_at=interview.completed_at,
+        detail=detail,
+        # Same ETags as the live endpoints, so cached copies stay valid.
+        detail_etag=payload_etag(detail),
+        results=results,
+        results_etag=results_etag,
+    )
+
+
+def archive_batch_queryset(cutoff, batch_size):
+    """The next batch of archivable interviews, locked, with their snapshots and questions.
+
+    Only the interview rows are locked: Postgres refuses FOR UPDATE on the
+    nullable side of the snapshot's outer join.
+    """
+    return (
+        archivable_interviews(cutoff)
+        .select_for_update(of=('self',))
+        .select_related('results_snapshot')
+        .prefetch_related(models.Prefetch(
+            'questions',
+            queryset=Question.objects.select_related('answer').order_by('order'),
+        ))[:batch_size]
+    )
+
+
+def archive_batch(cutoff, batch_size) -> int:
+    """Archive up to `batch_size` interviews in one transaction.
+
+    Archived interviews are deleted from the hot tables in the same
+    transaction, so an interrupted run loses no work and simply continues
+    with the next batch when restarted.
+    """
+    with transaction.atomic():
+        interviews = list(archive_batch_queryset(cutoff, batch_size))
+        if not interviews:
+            return 0
+        ArchivedInterview.objects.bulk_create([_archive_row(interview) for interview in interviews])
+        Interview.objects.filter(pk__in=[interview.pk for interview in interviews]).delete()
+    logger.info(f"Archived {len(interviews)} interviews")
+    return len(interviews)
+
+
+def get_archived_interview(pk, clerk_user_id=None):
+    """Look up an archived interview by its original primary key."""
+    qs = ArchivedInterview.objects.all()
+    if clerk_user_id:
+        qs = qs.filter(clerk_user_id=clerk_user_id)
+    try:
+        return qs.get(interview_id=int(pk))
+    except (ArchivedInterview.DoesNotExist, TypeError, ValueError):
+        return None
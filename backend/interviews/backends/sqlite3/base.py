@@ -0,0 +1,22 @@
+from django.db.backends.sqlite3 import base
+
+from interviews.db import sqlite_pragmas
+
+
+class DatabaseWrapper(base.DatabaseWrapper):
+    """SQLite backend for the production profile (see `SQLITE_TUNING`).
+
+    Applies `sqlite_pragmas()` to every new connection and starts
+    transactions with BEGIN IMMEDIATE, so a transaction that reads before it
+    writes waits on busy_timeout for the write lock instead of failing with
+    "database is locked" when it tries to upgrade.
+    """
+
+    def get_new_connection(self, conn_params):
+        conn = super().get_new_connection(conn_params)
+        for pragma in sqlite_pragmas():
+            conn.execute(pragma)
+        return conn
+
+    def _start_transaction_under_autocommit(self):
+        self.cursor().execute('BEGIN IMMEDIATE')
@@ -0,0 +1,97 @@
+import queue
+import threading
+from concurrent.futures import Future
+
+from django.conf import settings
+from django.db import close_old_connections, connection
+
+
+def iter_keyset(qs, chunk_size=500):
+    """Yield rows of `qs` in primary-key order, `chunk_size` rows per query.
+
+    Keyset batches keep memory flat on every backend, including Postgres
+    behind a transaction pooler where server-side cursors are disabled.
+    """
+    last_pk = None
+    while True:
+        batch = qs.order_by('pk')
+        if last_pk is not None:
+            batch = batch.filter(pk__gt=last_pk)
+        batch = list(batch[:chunk_size])
+        if not batch:
+            return
+        yield from batch
+        last_pk = batch[-1].pk
+
+
+def sqlite_pragmas() -> list[str]:
+    """PRAGMAs applied to every connection by the tuned SQLite backend.
+
+    WAL lets readers proceed while a writer commits, busy_timeout makes
+    writers wait for the lock instead of failing with "database is locked",
+    and synchronous=NORMAL is durable under WAL except on power loss.
+    """
+    return [
+        'PRAGMA journal_mode=WAL',
+        f'PRAGMA busy_timeout={int(settings.SQLITE_BUSY_TIMEOUT_MS)}',
+        'PRAGMA synchronous=NORMAL',
+        f'PRAGMA mmap_size={int(settings.SQLITE_MMAP_SIZE)}',
+    ]
+
+
+class SerialWriter:
+    """Runs database writes from background threads on one dedicated thread.
+
+    SQLite allows a single writer at a time; funnelling the question
+    generation and AI review writes through one thread keeps them from
+    contending with each other for the lock.
+    """
+
+    def __init__(self):
+        self._queue: queue.Queue = queue.Queue()
+        self._thread: threading.Thread | None = None
+        self._lock = threading.Lock()
+
+    def _ensure_started(self):
+        with self._lock:
+            if self._thread is None or not self._thread.is_alive():
+                self._thread = threading.Thread(target=self._run, name='db-writer', daemon=True)
+                self._thread.start()
+
+    def _run(self):
+        while True:
+            future, fn, args, kwargs = self._queue.get()
+            if not future.set_running_or_notify_cancel():
+                continue
+            close_old_connections()
+            try:
+                future.set_result(fn(*args, **kwargs))
+            except BaseException as e:
+                future.set_exception(e)
+
+    def submit(self, fn, *args, **kwargs) -> Future:
+        self._ensure_started()
+        future: Future = Future()
+        self._queue.put((future, fn, args, kwargs))
+        return future
+
+    def is_writer_thread(self) -> bool:
+        return threading.current_thread() is self._thread
+
+
+_writer = SerialWriter()
+
+
+def run_write(fn, *args, **kwargs):
+    """Run `fn(*args, **kwargs)` as a serialized background write and return its result.
+
+    Only SQLite needs serialization; other backends (and nested calls from
+    the writer thread itself) run the write inline.
+    """
+    if (
+        connection.vendor != 'sqlite'
+        or not getattr(settings, 'SQLITE_SERIALIZE_BACKGROUND_WRITES', True)
+        or _writer.is_writer_thread()
+    ):
+        return fn(*args, **kwargs)
+    return _writer.submit(fn, *args, **kwargs).result()
@@ -0,0 +1,98 @@
+import csv
+import json
+
+from django.core.serializers.json import DjangoJSONEncoder
+
+from .db import iter_keyset
+
+EXPORT_FORMATS = ('csv', 'jsonl')
+EXPORT_CHUNK_SIZE = 500
+
+CSV_COLUMNS = [
+    'interview_id', 'clerk_user_id', 'status', 'archived',
+    'overall_score', 'ai_final_score', 'hire_recommendation', 'review_status',
+    'started_at', 'ai_review_generated_at', 'question_scores',
+]
+
+
+def _attempt_row(*, interview_id, clerk_user_id, status, archived, overall_score,
+                 ai_final_score, created_at, ai_review_generated_at, review):
+    review = review if isinstance(review, dict) else {}
+    final = review.get('final') if isinstance(review.get('final'), dict) else {}
+    per_question = sorted(
+        (item for item in review.get('per_question') or [] if isinstance(item, dict)),
+        key=lambda item: int(item.get('order') or 0),
+    )
+    return {
+        'interview_id': interview_id,
+        'clerk_user_id': clerk_user_id,
+        'status': status,
+        'archived': archived,
+        'overall_score': overall_score,
+        'ai_final_score': ai_final_score,
+        'hire_recommendation': final.get('hire_recommendation'),
+        'review_status': review.get('status'),
+        'started_at': created_at,
+        'ai_review_generated_at': ai_review_generated_at,
+        'questions': [{'order': item.get('order'), 'score': item.get('score')} for item in per_question],
+    }
+
+
+def iter_attempt_rows(link, chunk_size=EXPORT_CHUNK_SIZE):
+    """Yield one export row per attempt on `link`, archived attempts first."""
+    archived = link.archived_attempts.defer('detail')
+    for attempt in iter_keyset(archived, chunk_size):
+        yield _attempt_row(
+            interview_id=attempt.interview_id,
+            clerk_user_id=attempt.clerk_user_id,
+            status=attempt.status,
+            archived=True,
+            overall_score=attempt.overall_score,
+            ai_final_score=attempt.ai_final_score,
+            created_at=attempt.created_at,
+            ai_review_generated_at=attempt.ai_review_generated_at,
+            review=(attempt.results.get('interview') or {}).get('ai_review'),
+        )
+
+    live = link.interview_attempts.defer('job_description', 'resume_text')
+    for attempt in iter_keyset(live, chunk_size):
+        yield _attempt_row(
+            interview_id=attempt.pk,
+            clerk_user_id=attempt.clerk_user_id,
+            status=attempt.status,
+            archived=False,
+            overall_score=attempt.overall_score,
+            ai_final_score=attempt.ai_final_score,
+            created_at=attempt.created_at,
+            ai_review_generated_at=attempt.ai_review_generated_at,
+            review=attempt.ai_review,
+        )
+
+
+class _Echo:
+    """File-like object whose write() returns the value, for csv.writer."""
+
+    def write(self, value):
+        return value
+
+
+def _csv_value(value):
+    if value is None:
+        return ''
+    if hasattr(value, 'isoformat'):
+        return value.isoformat()
+    return value
+
+
+def stream_csv(rows):
+    """Yield CSV lines; the header goes out before the first query runs."""
+    writer = csv.writer(_Echo())
+    yield writer.writerow(CSV_COLUMNS)
+    for row in rows:
+        scores = ' '.join(f"Q{q['order']}={q['score']}" for q in row['questions'])
+        yield writer.writerow([_csv_value(row[column]) for column in CSV_COLUMNS[:-1]] + [scores])
+
+
+def stream_jsonl(rows):
+    for row in rows:
+        yield json.dumps(row, cls=DjangoJSONEncoder, ensure_ascii=False) + '\n'
@@ -0,0 +1,345 @@
+"""Bounded text extraction for uploaded resumes.
+
+PDF and DOCX text is extracted with a page cap, a character cap and a soft
+deadline checked between pages, so a huge or malformed file yields partial
+text instead of tying up a request worker. When RESUME_EXTRACT_WORKERS > 0
+extraction also runs in a separate process pool, where each worker has an
+address-space limit (RESUME_EXTRACT_MEMORY_MB) and is killed if it overruns
+the deadline; pages it sent back before that are kept. At most
+RESUME_EXTRACT_QUEUE uploads wait for a free worker; further ones are turned
+away. Serverless deployments default to in-process extraction. Files over
+RESUME_MAX_UPLOAD_MB are refused before they are read.
+
+Results are dicts: `text`, `truncated`, `reason` (None, 'pages', 'chars',
+'timeout', 'memory', 'error', 'crashed', 'busy' or 'size') and `pages`
+(pages or paragraphs read).
+"""
+import io
+import logging
+import multiprocessing
+import os
+import threading
+import time
+
+from django.conf import settings
+
+logger = logging.getLogger(__name__)
+
+# Extra time a pool worker gets past its soft deadline before it is killed.
+HARD_TIMEOUT_GRACE = 2.0
+# Time a new worker gets to start up and pick up its first job.
+WORKER_START_TIMEOUT = 30.0
+# Paragraphs between deadline checks while reading a DOCX.
+DOCX_CHECK_EVERY = 200
+
+
+def _result(parts, truncated=False, reason=None, pages=0, max_chars=None):
+    text = ''.join(parts)
+    if max_chars is not None and len(text) > max_chars:
+        text = text[:max_chars]
+    return {'text': text, 'truncated': truncated, 'reason': reason, 'pages': pages}
+
+
+def extract_pdf(source, max_pages, max_chars, timeout, progress=None):
+    import PyPDF2
+
+    deadline = time.monotonic() + timeout
+    parts, size, read = [], 0, 0
+    try:
+        reader = PyPDF2.PdfReader(source)
+        for page in reader.pages:
+            if read >= max_pages:
+                return _result(parts, True, 'pages', read, max_chars)
+            page_text = page.extract_text() or ''
+            parts.append(page_text)
+            size += len(page_text)
+            read += 1
+            if progress:
+                progress(page_text, read)
+            if size >= max_chars:
+                return _result(parts, True, 'chars', read, max_chars)
+            if time.monotonic() > deadline:
+                return _result(parts, True, 'timeout', read, max_chars)
+    except MemoryError:
+        return _result(parts, True, 'memory', read, max_chars)
+    except Exception as e:
+        logger.error(f"Error extracting PDF text: {e}")
+        return _result(parts, bool(parts), 'error', read, max_chars)
+    return _result(parts, pages=read)
+
+
+def extract_docx(source, max_pages, max_chars, timeout, progress=None):
+    import docx
+
+    deadline = time.monotonic() + timeout
+    parts, size, read, reported = [], 0, 0, 0
+    try:
+        document = docx.Document(source)
+        for paragraph in document.paragraphs:
+            line = paragraph.text + '\n'
+            parts.append(line)
+            size += len(line)
+            read += 1
+            if size >= max_chars:
+                return _result(parts, True, 'chars', read, max_chars)
+            if read % DOCX_CHECK_EVERY == 0:
+                if time.monotonic() > deadline:
+                    return _result(parts, True, 'timeout', read, max_chars)
+                if progress:
+                    progress(''.join(parts[reported:]), read)
+                    reported = read
+    except MemoryError:
+        return _result(parts, True, 'memory', read, max_chars)
+    except Exception as e:
+        logger.error(f"Error extracting DOCX text: {e}")
+        return _result(parts, bool(parts), 'error', read, max_chars)
+    return _result(parts, pages=read)
+
+
+EXTRACTORS = {'.pdf': extract_pdf, '.docx': extract_docx}
+# Leading bytes of each format, for buffers without a file name.
+MAGIC = {b'%PDF': '.pdf', b'PK\x03\x04': '.docx'}
+
+
+def source_name(source):
+    if isinstance(source, (str, os.PathLike)):
+        return str(source)
+    return getattr(source, 'name', None) or ''
+
+
+def detect_format(source, name=None):
+    """'.pdf', '.docx' or None, from the file name or else the leading bytes."""
+    name = (name or source_name(source)).lower()
+    for suffix in EXTRACTORS:
+        if name.endswith(suffix):
+            return suffix
+    if isinstance(source, (bytes, bytearray, memoryview)):
+        head = bytes(source[:4])
+    elif hasattr(source, 'read') and hasattr(source, 'seek'):
+        head = source.read(4)
+        source.seek(0)
+    else:
+        return None
+    return MAGIC.get(head)
+
+
+def extract_document(source, fmt, max_pages, max_chars, timeout, progress=None):
+    """Extract a path, byte buffer or binary file object within the given limits.
+
+    Runs in the caller or in a pool worker. `progress(text, pages)` is called
+    with the text read since the previous call as extraction goes.
+    """
+    if isinstance(source, (bytes, bytearray, memoryview)):
+        source = io.BytesIO(source)
+    return EXTRACTORS[fmt](source, max_pages, max_chars, timeout, progress)
+
+
+def source_size(source):
+    """Size in bytes of a path, byte buffer or (uploaded) file object, or None if unknown."""
+    if isinstance(source, (bytes, bytearray, memoryview)):
+        return len(source)
+    if isinstance(source, (str, os.PathLike)):
+        return os.path.getsize(source)
+    size = getattr(source, 'size', None)
+    if size is None and hasattr(source, 'seek') and hasattr(source, 'tell'):
+        position = source.tell()
+        size = source.seek(0, os.SEEK_END)
+        source.seek(position)
+    return size
+
+
+def _init_worker(memory_mb):
+    try:
+        import resource
+    except ImportError:  # not available on Windows
+        return
+    limit = memory_mb * 1024 * 1024
+    resource.setrlimit(resource.RLIMIT_AS, (limit, limit))
+
+
+def _worker_main(conn, memory_mb):
+    """Pool worker loop: acknowledge each job when it is picked up, then send its outcome."""
+    _init_worker(memory_mb)
+    while True:
+        try:
+            fn, args, with_progress = conn.recv()
+        except (EOFError, OSError):  # the server process went away
+            return
+        conn.send(('started', None))
+        kwargs = {'progress': lambda *item: conn.send(('progress', item))} if with_progress else {}
+        try:
+            outcome = ('done', fn(*args, **kwargs))
+        except Exception as e:
+            outcome = ('raised', e)
+        conn.send(outcome)
+
+
+class PoolBusy(Exception):
+    """Every worker is busy and RESUME_EXTRACT_QUEUE jobs are already waiting."""
+
+
+class WorkerCrashed(Exception):
+    """The worker running the job died before sending a result."""
+
+
+class _Worker:
+    def __init__(self, context, memory_mb):
+        self.conn, child = context.Pipe()
+        # Spawned workers don't inherit the server's threads, locks or DB connections.
+        self.process = context.Process(
+            target=_worker_main, args=(child, memory_mb), name='resume-extract', daemon=True,
+        )
+        self.process.start()
+        child.close()
+
+    def stop(self):
+        self.process.terminate()
+        self.process.join(1)
+        self.conn.close()
+
+
+class ExtractionPool:
+    """A fixed set of worker processes, each running one job at a time.
+
+    A job's deadline starts when its worker picks it up, so time spent
+    waiting for a free worker doesn't count against it. A job that overruns
+    has its own worker killed and replaced; the other workers carry on.
+    At most `queue` jobs wait for a worker, and `run` raises PoolBusy
+    beyond that.
+    """
+
+    def __init__(self, workers, queue, memory_mb):
+        self._context = multiprocessing.get_context('spawn')
+        self._memory_mb = memory_mb
+        self._idle: list[_Worker] = []
+        self._lock = threading.Lock()
+        self._free = threading.Semaphore(workers)
+        self._admitted = threading.Semaphore(workers + queue)
+
+    def run(self, fn, args, timeout, progress=None):
+        """Return `fn(*args)` run in a worker, killing the worker after `timeout` seconds.
+
+        With `progress`, `fn` also gets a `progress` callback, and each call
+        to it in the worker is relayed to `progress` here as it happens.
+        Raises TimeoutError, PoolBusy, WorkerCrashed or whatever `fn` raised.
+        """
+        if not self._admitted.acquire(blocking=False):
+            raise PoolBusy
+        try:
+            with self._free:
+                with self._lock:
+                    worker = self._idle.pop() if self._idle else None
+                if worker is None:
+                    worker = _Worker(self._context, self._memory_mb)
+                outcome = self._run_on(worker, fn, args, timeout, progress)
+                with self._lock:
+                    self._idle.append(worker)
+        finally:
+            self._admitted.release()
+        kind, value = outcome
+        if kind == 'raised':
+            raise value
+        return value
+
+    def _run_on(self, worker, fn, args, timeout, progress):
+        try:
+            worker.conn.send((fn, args, progress is not None))
+            # A new worker acknowledges once it has started up and read the job.
+            if not worker.conn.poll(WORKER_START_TIMEOUT):
+                raise WorkerCrashed
+            worker.conn.recv()
+            deadline = time.monotonic() + timeout
+            while True:
+                if not worker.conn.poll(max(0.0, deadline - time.monotonic())):
+                    worker.stop()
+                    raise TimeoutError
+                kind, value = worker.conn.recv()
+                if kind != 'progress':
+                    return kind, value
+                progress(*value)
+        except TimeoutError:
+            raise
+        except (EOFError, OSError, WorkerCrashed):
+            worker.stop()
+            raise WorkerCrashed from None
+
+    def close(self):
+        with self._lock:
+            idle, self._idle = self._idle, []
+        for worker in idle:
+            worker.stop()
+
+
+_pool = None
+_pool_lock = threading.Lock()
+
+
+def _get_pool():
+    global _pool
+    with _pool_lock:
+        if _pool is None:
+            _pool = ExtractionPool(
+                settings.RESUME_EXTRACT_WORKERS, settings.RESUME_EXTRACT_QUEUE, settings.RESUME_EXTRACT_MEMORY_MB,
+            )
+        return _pool
+
+
+def extract_bounded(source, name=None):
+    """Extract resume text from a path, byte buffer or uploaded file within the configured limits.
+
+    Uploads are read where Django left them (memory or its temp file);
+    nothing is copied to MEDIA_ROOT. Returns None for unsupported formats.
+    When a limit is hit, the result holds the text read so far with
+    `truncated` set.
+    """
+    limits = (settings.RESUME_MAX_PAGES, settings.RESUME_MAX_CHARS, settings.RESUME_EXTRACT_TIMEOUT)
+    name = name or source_name(source) or 'upload'
+    size = source_size(source)
+    if size is not None and size > settings.RESUME_MAX_UPLOAD_MB * 1024 * 1024:
+        logger.warning(f"Resume not extracted, {size} bytes is over RESUME_MAX_UPLOAD_MB: {name}")
+        return _result([], True, 'size')
+    fmt = detect_format(source, name)
+    if fmt is None:
+        logger.error(f"Unsupported file format: {name}")
+        return None
+    if settings.RESUME_EXTRACT_WORKERS <= 0:
+        result = extract_document(source, fmt, *limits)
+    else:
+        # File objects can't cross the process boundary; paths and bytes can.
+        if hasattr(source, 'temporary_file_path'):
+            payload = source.temporary_file_path()
+        elif hasattr(source, 'read'):
+            payload = source.read()
+            source.seek(0)
+        else:
+            payload = source
+        result = _extract_in_pool(payload, fmt, name, limits)
+    if result['truncated']:
+        logger.warning(f"Resume extraction stopped early ({result['reason']}) after {result['pages']} pages/paragraphs: {name}")
+    return result
+
+
+def _extract_in_pool(payload, fmt, name, limits):
+    # Text the worker reported so far, kept if it has to be killed.
+    parts, read = [], [0]
+
+    def progress(text, pages):
+        parts.append(text)
+        read[0] = pages
+
+    try:
+        return _get_pool().run(
+            extract_document, (payload, fmt, *limits), settings.RESUME_EXTRACT_TIMEOUT + HARD_TIMEOUT_GRACE, progress,
+        )
+    except TimeoutError:
+        logger.error(f"Resume extraction worker killed after {settings.RESUME_EXTRACT_TIMEOUT}s: {name}")
+        return _result(parts, True, 'timeout', read[0], limits[1])
+    except PoolBusy:
+        logger.warning(f"Resume extraction queue full, not extracting: {name}")
+        return _result([], True, 'busy')
+    except MemoryError:
+        # Raised before the extractor could collect anything (e.g. while importing it).
+        return _result([], True, 'memory')
+    except WorkerCrashed:
+        # The worker died on this file, e.g. past its memory limit.
+        return _result(parts, True, 'crashed', read[0], limits[1])
@@ -0,0 +1,164 @@
+import json
+import zlib
+
+from django.conf import settings
+from django.core.serializers.json import DjangoJSONEncoder
+from django.db import models
+from django.db.models.query_utils import DeferredAttribute
+
+try:
+    import zstandard
+except ImportError:  # pragma: no cover - optional codec
+    zstandard = None
+
+# Stored blobs start with a 2-byte header: format version, codec id.
+FORMAT_VERSION = 1
+CODEC_RAW = 0
+CODEC_ZLIB = 1
+CODEC_ZSTD = 2
+
+# Below this size compression overhead outweighs the savings.
+MIN_COMPRESS_SIZE = 128
+
+
+def compress(data: bytes) -> bytes:
+    codec = CODEC_RAW
+    if len(data) >= MIN_COMPRESS_SIZE:
+        if getattr(settings, 'COMPRESSED_FIELD_CODEC', 'zlib') == 'zstd' and zstandard is not None:
+            packed, codec = zstandard.ZstdCompressor(level=3).compress(data), CODEC_ZSTD
+        else:
+            packed, codec = zlib.compress(data, 6), CODEC_ZLIB
+        if len(packed) >= len(data):
+            codec = CODEC_RAW
+        else:
+            data = packed
+    return bytes((FORMAT_VERSION, codec)) + data
+
+
+def decompress(blob: bytes) -> bytes:
+    if len(blob) < 2 or blob[0] != FORMAT_VERSION:
+        raise ValueError('Unknown compressed field format')
+    codec, body = blob[1], blob[2:]
+    if codec == CODEC_RAW:
+        return body
+    if codec == CODEC_ZLIB:
+        return zlib.decompress(body)
+    if codec == CODEC_ZSTD:
+        if zstandard is None:
+            raise ValueError('zstd-compressed value but zstandard is not installed')
+        return zstandard.ZstdDecompressor().decompress(body)
+    raise ValueError(f'Unknown compression codec {codec}')
+
+
+class _Packed:
+    """Raw column value held on the instance until the attribute is read."""
+
+    __slots__ = ('blob',)
+
+    def __init__(self, blob: bytes):
+        self.blob = blob
+
+
+class CompressedDescriptor(DeferredAttribute):
+    """Decompresses on first attribute access and caches the result."""
+
+    def __get__(self, instance, cls=None):
+        if instance is None:
+            return self
+        value = super().__get__(instance, cls)
+        if isinstance(value, _Packed):
+            value = self.field.decode(value.blob)
+            instance.__dict__[self.field.attname] = value
+        return value
+
+    def __set__(self, instance, value):
+        instance.__dict__[self.field.attname] = value
+
+
+class _CompressedField(models.BinaryField):
+    """Base for fields stored as a versioned, compressed blob.
+
+    Values are decoded lazily: rows loaded from the database keep the raw
+    blob until the attribute is read, so list queries that never touch the
+    field pay no decompression cost. Only `isnull` lookups are meaningful.
+    """
+
+    descriptor_class = CompressedDescriptor
+
+    def __init__(self, *args, **kwargs):
+        kwargs.setdefault('editable', True)
+        super().__init__(*args, **kwargs)
+
+    def encode(self, value) -> bytes:
+        raise NotImplementedError
+
+    def decode(self, blob: bytes):
+        raise NotImplementedError
+
+    def from_db_value(self, value, expression, connection):
+        if value is None:
+            return None
+        return _Packed(bytes(value))
+
+    def to_python(self, value):
+        if isinstance(value, _Packed):
+            return self.decode(value.blob)
+        return value
+
+    def pre_save(self, model_instance, add):
+        # Write back an untouched blob as-is instead of decoding and re-encoding it.
+        value = model_instance.__dict__.get(self.attname)
+        if isinstance(value, _Packed):
+            return value
+        return super().pre_save(model_instance, add)
+
+    def get_prep_value(self, value):
+        if isinstance(value, _Packed):
+            return value.blob
+        if value is None:
+            return None
+        return compress(self.encode(value))
+
+    def value_from_object(self, obj):
+        return getattr(obj, self.attname)
+
+    def value_to_string(self, obj):
+        value = self.value_from_object(obj)
+        return value if isinstance(value, str) else json.dumps(value, cls=DjangoJSONEncoder)
+
+
+class CompressedTextField(_CompressedField):
+    """Drop-in for a `TextField(blank=True)` holding large documents."""
+
+    def get_default(self):
+        if not self.has_default() and not self.null:
+            return ''
+        return super().get_default()
+
+    def encode(self, value) -> bytes:
+        if isinstance(value, (bytes, bytearray, memoryview)):
+            return bytes(value)
+        return str(value).encode('utf-8')
+
+    def decode(self, blob: bytes):
+        return decompress(blob).decode('utf-8')
+
+
+class CompressedJSONField(_CompressedField):
+    """Drop-in for a `JSONField` whose payload is read whole, never queried into."""
+
+    def __init__(self, *args, encoder=DjangoJSONEncoder, **kwargs):
+        self.encoder = encoder
+        super().__init__(*args, **kwargs)
+
+    def deconstruct(self):
+        name, path, args, kwargs = super().deconstruct()
+        if self.encoder is not DjangoJSONEncoder:
+            kwargs['encoder'] = self.encoder
+        return name, path, args, kwargs
+
+    def encode(self, value) -> bytes:
+        return json.dumps(value, cls=self.encoder, ensure_ascii=False, separators=(',', ':')).encode('utf-8')
+
+    def decode(self, blob: bytes):
+        return json.loads(decompress(blob))
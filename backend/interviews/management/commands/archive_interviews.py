@@ -0,0 +1,44 @@
+import time
+
+from django.conf import settings
+from django.core.management.base import BaseCommand
+
+from interviews.archive import archivable_interviews, archive_batch, archive_cutoff
+
+
+class Command(BaseCommand):
+    help = (
+        'Move interviews completed more than --days ago (default '
+        'INTERVIEW_ARCHIVE_AFTER_DAYS) with their questions, answers and review '
+        'into the archive. Runs in batches; safe to interrupt and re-run.'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--days', type=int, default=None)
+        parser.add_argument('--batch-size', type=int, default=200)
+        parser.add_argument('--max-batches', type=int, default=None, help='Stop after this many batches')
+        parser.add_argument('--sleep', type=float, default=0.0, help='Seconds to pause between batches')
+        parser.add_argument('--dry-run', action='store_true', help='Only report how many interviews would move')
+
+    def handle(self, *args, **options):
+        days = options['days'] if options['days'] is not None else settings.INTERVIEW_ARCHIVE_AFTER_DAYS
+        cutoff = archive_cutoff(days)
+        pending = archivable_interviews(cutoff).count()
+        self.stdout.write(f'{pending} completed interviews older than {days} days (before {cutoff:%Y-%m-%d %H:%M})')
+        if options['dry_run'] or not pending:
+            return
+
+        archived = batches = 0
+        start = time.monotonic()
+        while options['max_batches'] is None or batches < options['max_batches']:
+            moved = archive_batch(cutoff, options['batch_size'])
+            if not moved:
+                break
+            archived += moved
+            batches += 1
+            self.stdout.write(f'batch {batches}: {archived}/{pending} archived')
+            if options['sleep']:
+                time.sleep(options['sleep'])
+
+        elapsed = time.monotonic() - start
+        self.stdout.write(self.style.SUCCESS(f'Archived {archived} interviews in {batches} batches ({elapsed:.1f}s)'))
@@ -0,0 +1,141 @@
+import json
+import os
+import statistics
+import subprocess
+import sys
+from collections import defaultdict
+from pathlib import Path
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+
+# Modules a health check must not load; they belong to resume parsing and AI calls.
+LAZY_MODULES = (
+    'PyPDF2', 'docx', 'interviews.services', 'interviews.question_bank', 'interviews.resume_parser',
+    'interviews.extraction', 'interviews.resume_cache', 'interviews.skills',
+)
+
+# Run in a fresh interpreter: import the serverless entry point, then serve
+# GET /health/ through its WSGI application. Prints one JSON line.
+CHILD = r'''
+import json, sys, time
+start = time.perf_counter()
+import importlib.util
+spec = importlib.util.spec_from_file_location('serverless_entry', sys.argv[1])
+entry = importlib.util.module_from_spec(spec)
+spec.loader.exec_module(entry)
+ready = time.perf_counter()
+
+from io import BytesIO
+from wsgiref.util import setup_testing_defaults
+from django.conf import settings
+host = next((h.lstrip('.') for h in settings.ALLOWED_HOSTS if h and h != '*'), 'localhost')
+environ = {
+    'REQUEST_METHOD': 'GET', 'PATH_INFO': '/health/', 'HTTP_HOST': host, 'SERVER_NAME': host,
+    'wsgi.url_scheme': 'https', 'HTTPS': 'on', 'wsgi.input': BytesIO(),
+}
+setup_testing_defaults(environ)
+status = []
+b''.join(entry.application(environ, lambda s, headers, exc_info=None: status.append(s)))
+done = time.perf_counter()
+print(json.dumps({
+    'setup_ms': (ready - start) * 1000,
+    'first_response_ms': (done - start) * 1000,
+    'status': status[0],
+    'modules': len(sys.modules),
+    'lazy_loaded': [name for name in sys.argv[2].split(',') if name and name in sys.modules],
+}))
+'''
+
+
+def run_child(entry, lazy_modules, importtime=False):
+    """One cold start; returns the child's JSON report and its stderr."""
+    args = [sys.executable] + (['-X', 'importtime'] if importtime else [])
+    proc = subprocess.run(
+        args + ['-c', CHILD, str(entry), ','.join(lazy_modules)],
+        capture_output=True, text=True, cwd=Path(entry).parent.parent, env=os.environ.copy(),
+    )
+    if proc.returncode != 0:
+        raise CommandError(f'Cold start failed:\n{proc.stderr[-2000:]}')
+    return json.loads(proc.stdout.strip().splitlines()[-1]), proc.stderr
+
+
+def parse_importtime(stderr):
+    """(self_us, cumulative_us, module) rows from `python -X importtime` output."""
+    rows = []
+    for line in stderr.splitlines():
+        if not line.startswith('import time:') or 'self [us]' in line:
+            continue
+        own, cumulative, name = line[len('import time:'):].split('|')
+        rows.append((int(own), int(cumulative), name.strip()))
+    return rows
+
+
+class Command(BaseCommand):
+    help = (
+        'Measure serverless cold start: time from importing api/index.py to the first health/ '
+        'response, in fresh interpreters. Fails when the median exceeds --budget-ms or when a '
+        'module that should load lazily is imported. --profile prints an import-time profile.'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--runs', type=int, default=5)
+        parser.add_argument('--budget-ms', type=float, default=float(os.getenv('COLD_START_BUDGET_MS', '1200')))
+        parser.add_argument('--entry', default=str(Path(settings.BASE_DIR).parent / 'api' / 'index.py'))
+        parser.add_argument('--lazy-modules', default=','.join(LAZY_MODULES))
+        parser.add_argument('--profile', action='store_true', help='Print the slowest imports and time per package')
+        parser.add_argument('--top', type=int, default=25)
+
+    def handle(self, *args, **options):
+        entry = Path(options['entry'])
+        if not entry.exists():
+            raise CommandError(f'Entry point not found: {entry}')
+        lazy_modules = [m for m in options['lazy_modules'].split(',') if m]
+
+        # The first run writes bytecode caches where the environment allows it.
+        run_child(entry, lazy_modules)
+        reports = [run_child(entry, lazy_modules)[0] for _ in range(options['runs'])]
+
+        setup_ms = statistics.median(r['setup_ms'] for r in reports)
+        first_ms = statistics.median(r['first_response_ms'] for r in reports)
+        last = reports[-1]
+        self.stdout.write(f'entry: {entry}')
+        self.stdout.write(f"bytecode cache writes: {'off' if os.getenv('PYTHONDONTWRITEBYTECODE') else 'on'}")
+        self.stdout.write(f"runs: {len(reports)}, modules loaded: {last['modules']}, status: {last['status']}")
+        self.stdout.write(f'django.setup + WSGI app: {setup_ms:8.1f} ms (median)')
+        self.stdout.write(f'first health/ response:  {first_ms:8.1f} ms (median, budget {options["budget_ms"]:.0f} ms)')
+        self.stdout.write(f"min/max: {min(r['first_response_ms'] for r in reports):.1f}/"
+                          f"{max(r['first_response_ms'] for r in reports):.1f} ms")
+
+        if options['profile']:
+            self._profile(entry, lazy_modules, options['top'])
+
+        problems = []
+        if not last['status'].startswith('200'):
+            problems.append(f"health/ returned {last['status']}")
+        if last['lazy_loaded']:
+            problems.append(f"loaded at startup: {', '.join(last['lazy_loaded'])}")
+        if first_ms > options['budget_ms']:
+            problems.append(f"first response took {first_ms:.1f} ms, over the {options['budget_ms']:.0f} ms budget")
+        if problems:
+            raise CommandError('Cold start regressed: ' + '; '.join(problems))
+        self.stdout.write(self.style.SUCCESS('Cold start within budget'))
+
+    def _profile(self, entry, lazy_modules, top):
+        _, stderr = run_child(entry, lazy_modules, importtime=True)
+        rows = parse_importtime(stderr)
+        total = sum(own for own, _, _ in rows)
+        self.stdout.write(f'\nimports: {len(rows)} modules, {total / 1000:.1f} ms total self time')
+
+        self.stdout.write(f"\n{'self ms':>9}{'cumul ms':>10}  module")
+        for own, cumulative, name in sorted(rows, reverse=True)[:top]:
+            self.stdout.write(f'{own / 1000:>9.1f}{cumulative / 1000:>10.1f}  {name}')
+
+        packages = defaultdict(lambda: [0, 0])
+        for own, _, name in rows:
+            package = packages[name.split('.')[0]]
+            package[0] += own
+            package[1] += 1
+        self.stdout.write(f"\n{'self ms':>9}{'modules':>9}  package")
+        for name, (own, count) in sorted(packages.items(), key=lambda item: -item[1][0])[:top]:
+            self.stdout.write(f'{own / 1000:>9.1f}{count:>9}  {name}')
@@ -0,0 +1,56 @@
+import statistics
+import time
+
+from django.core.management.base import BaseCommand
+from django.db import close_old_connections, connection
+
+
+class Command(BaseCommand):
+    help = (
+        'Measure per-request database connect overhead: a fresh connection per '
+        'request versus the configured mode (persistent connection or DB_POOL).'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--requests', type=int, default=200)
+
+    def _simulate_request(self):
+        # What Django does around every request: close_old_connections() on
+        # request_started/request_finished, with one query in between.
+        close_old_connections()
+        start = time.perf_counter()
+        with connection.cursor() as cursor:
+            cursor.execute('SELECT 1')
+            cursor.fetchone()
+        elapsed = time.perf_counter() - start
+        close_old_connections()
+        return elapsed
+
+    def _run(self, n, fresh):
+        samples = []
+        for _ in range(n):
+            if fresh:
+                connection.close()
+            samples.append(self._simulate_request())
+        return samples
+
+    def handle(self, *args, **options):
+        n = options['requests']
+        settings_dict = connection.settings_dict
+        pool = (settings_dict.get('OPTIONS') or {}).get('pool')
+        if pool:
+            configured = f"pool (min={pool.get('min_size')}, max={pool.get('max_size')})"
+        else:
+            configured = f"CONN_MAX_AGE={settings_dict.get('CONN_MAX_AGE')}"
+
+        self.stdout.write(f'vendor: {connection.vendor}, configured: {configured}, {n} requests')
+        self.stdout.write(f"{'mode':<28}{'mean ms':>10}{'p50 ms':>10}{'p95 ms':>10}")
+        self._run(5, fresh=False)  # warm up
+        for label, fresh in (('fresh connection/request', True), ('configured', False)):
+            samples = sorted(self._run(n, fresh))
+            p95 = samples[min(len(samples) - 1, int(len(samples) * 0.95))]
+            self.stdout.write(
+                f'{label:<28}{statistics.mean(samples) * 1000:>10.3f}'
+                f'{statistics.median(samples) * 1000:>10.3f}{p95 * 1000:>10.3f}'
+            )
+        connection.close()
@@ -0,0 +1,125 @@
+import io
+import random
+import string
+import time
+import uuid
+from datetime import timedelta
+from decimal import Decimal
+
+from django.core.management.base import BaseCommand
+from django.utils import timezone
+from rest_framework.parsers import JSONParser
+from rest_framework.renderers import JSONRenderer
+
+from interviews.renderers import FastJSONParser, FastJSONRenderer, orjson
+
+
+def _text(rng, words):
+    return ' '.join(
+        ''.join(rng.choices(string.ascii_lowercase, k=rng.randint(2, 10))) for _ in range(words)
+    )
+
+
+def build_results_payload(rng, questions=15):
+    """A `results` response shaped like InterviewViewSet.results output."""
+    now = timezone.now()
+    per_question = []
+    question_data = []
+    for order in range(1, questions + 1):
+        review = {
+            'order': order,
+            'score': rng.randint(1, 10),
+            'ai_answer': _text(rng, 250),
+            'strategy_to_improve': _text(rng, 80),
+            'improvements_needed': [_text(rng, 12) for _ in range(4)],
+        }
+        per_question.append(review)
+        question_data.append({
+            'id': order,
+            'question_text': _text(rng, 30),
+            'question_type': 'technical' if order > 5 else 'basic',
+            'order': order,
+            'answer': {
+                'id': order,
+                'answer_text': _text(rng, 150),
+                'feedback': '',
+                'score': review['score'],
+                'created_at': now - timedelta(minutes=questions - order),
+                'updated_at': now,
+            },
+            'created_at': now - timedelta(hours=1),
+            'ai_answer': review['ai_answer'],
+            'strategy_to_improve': review['strategy_to_improve'],
+            'improvements_needed': review['improvements_needed'],
+            'ai_score': review['score'],
+        })
+
+    return {
+        'interview': {
+            'id': 1,
+            'share_token': uuid.uuid4(),
+            'job_title': 'Senior Backend Engineer',
+            'difficulty': 'advanced',
+            'status': 'completed',
+            'overall_score': 6,
+            'ai_final_score': Decimal('6.40'),
+            'ai_review_generated_at': now,
+            'ai_review': {
+                'status': 'completed',
+                'current_step': None,
+                'per_question': per_question,
+                'final': {
+                    'final_score': 6.4,
+                    'overall_review': _text(rng, 200),
+                    'key_strengths': [_text(rng, 10) for _ in range(5)],
+                    'key_gaps': [_text(rng, 10) for _ in range(5)],
+                    'hire_recommendation': 'yes',
+                },
+                'error': None,
+            },
+            'created_at': now - timedelta(hours=1),
+        },
+        'questions': question_data,
+        'summary': {'total_questions': questions, 'total_answered': questions, 'average_score': 6.4},
+    }
+
+
+def _time(fn, iterations):
+    start = time.perf_counter()
+    for _ in range(iterations):
+        fn()
+    return (time.perf_counter() - start) / iterations
+
+
+class Command(BaseCommand):
+    help = 'Micro-benchmark the stock DRF JSON renderer/parser against FastJSONRenderer/FastJSONParser.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--iterations', type=int, default=500)
+        parser.add_argument('--questions', type=int, default=15)
+        parser.add_argument('--seed', type=int, default=42)
+
+    def handle(self, *args, **options):
+        iterations = options['iterations']
+        payload = build_results_payload(random.Random(options['seed']), options['questions'])
+
+        stock, fast = JSONRenderer(), FastJSONRenderer()
+        stock_bytes = stock.render(payload)
+        fast_bytes = fast.render(payload)
+        if stock_bytes != fast_bytes:
+            self.stderr.write(self.style.WARNING('FastJSONRenderer output differs from JSONRenderer'))
+
+        self.stdout.write(f"backend: {'orjson ' + orjson.__version__ if orjson else 'stdlib json (orjson not installed)'}")
+        self.stdout.write(f'payload: {len(stock_bytes) / 1024:.1f} KiB, {iterations} iterations')
+
+        rows = [
+            ('render', _time(lambda: stock.render(payload), iterations),
+             _time(lambda: fast.render(payload), iterations)),
+            ('parse', _time(lambda: JSONParser().parse(io.BytesIO(stock_bytes)), iterations),
+             _time(lambda: FastJSONParser().parse(io.BytesIO(stock_bytes)), iterations)),
+        ]
+        self.stdout.write(f"{'op':<8}{'stock ms':>12}{'fast ms':>12}{'speedup':>10}")
+        for name, stock_s, fast_s in rows:
+            self.stdout.write(
+                f'{name:<8}{stock_s * 1000:>12.3f}{fast_s * 1000:>12.3f}{stock_s / fast_s:>9.1f}x'
+            )
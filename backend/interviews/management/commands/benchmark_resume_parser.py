@@ -0,0 +1,314 @@
+import io
+import json
+import os
+import platform
+import random
+import statistics
+import time
+import tracemalloc
+
+from django.core.management.base import BaseCommand, CommandError
+from django.test import override_settings
+
+from interviews.extraction import extract_document
+from interviews.resume_parser import ResumeParser
+from interviews.skills import get_skill_matcher
+
+LAYOUTS = ('single', 'columns', 'table')
+LINES_PER_PAGE = 55
+# Timing differences below this are noise for --baseline comparisons.
+MIN_REGRESSION_MS = 5
+FILLER = (
+    'delivered owned designed improved reduced latency across teams shipped features for customers '
+    'migrated legacy services collaborated with product and design on roadmap planning reviews '
+    'mentored engineers wrote documentation automated releases monitored production incidents'
+).split()
+SUBJECTS = ['Computer Science', 'Physics', 'Mathematics', 'Electrical Engineering', 'Economics']
+COMPANIES = ['Acme Corp', 'Globex', 'Initech', 'Umbrella Labs', 'Hooli', 'Stark Industries']
+PLACES = ['Toronto', 'Melbourne', 'Lisbon', 'Pune', 'Denver']
+
+
+# Corpus ------------------------------------------------------------------
+
+def build_document(rng, pages, skill_pool):
+    """Lines of a synthetic resume plus the facts planted in it.
+
+    Facts are spread over the first three pages; the remaining pages are
+    filler, so long documents measure extraction cost and limits rather
+    than recall.
+    """
+    skills = rng.sample(skill_pool, 12)
+    years = rng.randint(2, 15)
+    company = rng.choice(COMPANIES)
+    subject = rng.choice(SUBJECTS)
+    place = rng.choice(PLACES)
+    facts = [
+        f'{years} years of experience building software',
+        f'Worked at {company}.',
+        f'Bachelor of Science in {subject}.',
+        f'University of {place}.',
+    ] + [f'Skills: {skill}.' for skill in skills]
+    expected = {
+        'skills': skills,
+        'experience': [str(years), company],
+        'education': [subject, place],
+    }
+
+    total = pages * LINES_PER_PAGE
+    lines = [' '.join(rng.choices(FILLER, k=rng.randint(6, 11))) + '.' for _ in range(total)]
+    spread = min(total, 3 * LINES_PER_PAGE)
+    for fact, slot in zip(facts, rng.sample(range(spread), len(facts))):
+        lines[slot] = fact
+    return [lines[i:i + LINES_PER_PAGE] for i in range(0, total, LINES_PER_PAGE)], expected
+
+
+def _pdf_string(text):
+    return '(' + text.replace('\\', '\\\\').replace('(', '\\(').replace(')', '\\)') + ')'
+
+
+def _pdf_page_content(lines, layout):
+    """Text-showing operators for one page; `columns` and `table` place text by coordinates."""
+    ops = ['BT /F1 9 Tf']
+    if layout == 'single':
+        for row, line in enumerate(lines):
+            ops.append(f'1 0 0 1 40 {760 - row * 13} Tm {_pdf_string(line)} Tj')
+    elif layout == 'columns':
+        half = (len(lines) + 1) // 2
+        for column, x in ((lines[:half], 40), (lines[half:], 316)):
+            for row, line in enumerate(column):
+                ops.append(f'1 0 0 1 {x} {760 - row * 26} Tm {_pdf_string(line[:60])} Tj')
+                if len(line) > 60:
+                    ops.append(f'1 0 0 1 {x} {747 - row * 26} Tm {_pdf_string(line[60:])} Tj')
+    else:
+        for row in range(0, len(lines), 3):
+            for col, line in enumerate(lines[row:row + 3]):
+                ops.append(f'1 0 0 1 {40 + col * 185} {760 - row // 3 * 40} Tm {_pdf_string(line[:40])} Tj')
+                if len(line) > 40:
+                    ops.append(f'1 0 0 1 {40 + col * 185} {748 - row // 3 * 40} Tm {_pdf_string(line[40:])} Tj')
+    ops.append('ET')
+    return '\n'.join(ops).encode('latin-1')
+
+
+def build_pdf(pages, layout):
+    """A minimal PDF 1.4 file with Helvetica text, no external dependencies."""
+    objects = {
+        1: b'<< /Type /Catalog /Pages 2 0 R >>',
+        3: b'<< /Type /Font /Subtype /Type1 /BaseFont /Helvetica /Encoding /WinAnsiEncoding >>',
+    }
+    kids = []
+    number = 4
+    for lines in pages:
+        content = _pdf_page_content(lines, layout)
+        objects[number] = b'<< /Length %d >>\nstream\n%s\nendstream' % (len(content), content)
+        objects[number + 1] = (
+            b'<< /Type /Page /Parent 2 0 R /MediaBox [0 0 612 792] /Contents %d 0 R '
+            b'/Resources << /Font << /F1 3 0 R >> >> >>' % number
+        )
+        kids.append(number + 1)
+        number += 2
+    objects[2] = b'<< /Type /Pages /Kids [%s] /Count %d >>' % (
+        b' '.join(b'%d 0 R' % kid for kid in kids), len(kids),
+    )
+
+    out = bytearray(b'%PDF-1.4\n')
+    offsets = {}
+    for key in sorted(objects):
+        offsets[key] = len(out)
+        out += b'%d 0 obj\n%s\nendobj\n' % (key, objects[key])
+    xref = len(out)
+    out += b'xref\n0 %d\n0000000000 65535 f \n' % number
+    out += b''.join(b'%010d 00000 n \n' % offsets[key] for key in range(1, number))
+    out += b'trailer\n<< /Size %d /Root 1 0 R >>\nstartxref\n%d\n%%%%EOF\n' % (number, xref)
+    return bytes(out)
+
+
+def build_docx(pages, layout):
+    import docx
+    from docx.oxml.ns import qn
+
+    document = docx.Document()
+    if layout == 'columns':
+        section = document.sections[0]._sectPr
+        cols = section.find(qn('w:cols'))
+        if cols is None:
+            cols = section.makeelement(qn('w:cols'), {})
+            section.append(cols)
+        cols.set(qn('w:num'), '2')
+    for number, lines in enumerate(pages):
+        if number:
+            document.add_page_break()
+        if layout == 'table':
+            table = document.add_table(rows=(len(lines) + 2) // 3, cols=3)
+            for i, line in enumerate(lines):
+                table.cell(i // 3, i % 3).text = line
+        else:
+            for line in lines:
+                document.add_paragraph(line)
+    buffer = io.BytesIO()
+    document.save(buffer)
+    return buffer.getvalue()
+
+
+BUILDERS = {'pdf': build_pdf, 'docx': build_docx}
+
+
+# Measurements ------------------------------------------------------------
+
+def _median_ms(fn, iterations):
+    samples = []
+    for _ in range(iterations):
+        start = time.perf_counter()
+        fn()
+        samples.append((time.perf_counter() - start) * 1000)
+    return round(statistics.median(samples), 2)
+
+
+def _peak_kib(fn):
+    tracemalloc.start()
+    try:
+        fn()
+        return round(tracemalloc.get_traced_memory()[1] / 1024, 1)
+    finally:
+        tracemalloc.stop()
+
+
+def _recall(found, needles):
+    found = [f.lower() for f in found]
+    hits = sum(1 for needle in needles if any(needle.lower() in item for item in found))
+    return round(hits / len(needles), 3) if needles else 1.0
+
+
+def score(parsed, expected):
+    return {
+        'skills': _recall(parsed.get('skills', []), expected['skills']),
+        'experience': _recall([e['description'] for e in parsed.get('experience', [])], expected['experience']),
+        'education': _recall([e['description'] for e in parsed.get('education', [])], expected['education']),
+    }
+
+
+class Command(BaseCommand):
+    help = (
+        'Benchmark ResumeParser on a generated corpus of PDF and DOCX resumes: extraction and '
+        'parse time, peak Python memory and skill/experience/education recall. Writes JSON '
+        'results with --output and fails with --baseline when they regress.'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--pages', default='1,2,5,10,25,50')
+        parser.add_argument('--formats', default='pdf,docx')
+        parser.add_argument('--layouts', default=','.join(LAYOUTS))
+        parser.add_argument('--iterations', type=int, default=5)
+        parser.add_argument('--seed', type=int, default=42)
+        parser.add_argument('--output', help='Write results as JSON to this path')
+        parser.add_argument('--corpus-dir', help='Also write the generated documents here')
+        parser.add_argument('--baseline', help='Earlier --output file to compare against')
+        parser.add_argument(
+            '--tolerance', type=float, default=1.0,
+            help='Allowed relative slowdown against --baseline (1.0 = twice as slow)',
+        )
+
+    def handle(self, *args, **options):
+        pages_list = [int(p) for p in options['pages'].split(',')]
+        formats = options['formats'].split(',')
+        layouts = options['layouts'].split(',')
+        for fmt in formats:
+            if fmt not in BUILDERS:
+                raise CommandError(f'Unknown format {fmt!r}; choose from {", ".join(BUILDERS)}')
+        for layout in layouts:
+            if layout not in LAYOUTS:
+                raise CommandError(f'Unknown layout {layout!r}; choose from {", ".join(LAYOUTS)}')
+        if options['corpus_dir']:
+            os.makedirs(options['corpus_dir'], exist_ok=True)
+
+        skill_pool = [s for s in get_skill_matcher().skills if s.replace(' ', '').isalnum()]
+        iterations = options['iterations']
+        parser = ResumeParser()
+        results = []
+
+        # In-process and uncached, so every run measures the extractors themselves.
+        with override_settings(RESUME_EXTRACT_WORKERS=0, RESUME_CACHE_ENABLED=False):
+            from django.conf import settings
+            limits = (settings.RESUME_MAX_PAGES, settings.RESUME_MAX_CHARS, settings.RESUME_EXTRACT_TIMEOUT)
+            self.stdout.write(
+                f"{'document':<22}{'KiB':>8}{'extract ms':>12}{'text ms':>10}{'parse ms':>10}"
+                f"{'peak KiB':>10}{'skills':>8}{'exp':>6}{'edu':>6}  truncated"
+            )
+            for fmt in formats:
+                for layout in layouts:
+                    for pages in pages_list:
+                        name = f'{fmt}-{layout}-{pages}p.{fmt}'
+                        # Seeded per document so any subset of the corpus matches a full run.
+                        rng = random.Random(f"{options['seed']}:{name}")
+                        lines, expected = build_document(rng, pages, skill_pool)
+                        data = BUILDERS[fmt](lines, layout)
+                        if options['corpus_dir']:
+                            with open(os.path.join(options['corpus_dir'], name), 'wb') as f:
+                                f.write(data)
+
+                        extracted = extract_document(data, f'.{fmt}', *limits)
+                        parsed = parser.parse_resume(data, name)
+                        row = {
+                            'document': name,
+                            'format': fmt,
+                            'layout': layout,
+                            'pages': pages,
+                            'bytes': len(data),
+                            'extract_ms': _median_ms(lambda: extract_document(data, f'.{fmt}', *limits), iterations),
+                            'extract_text_ms': _median_ms(lambda: parser._extract_text(data, name), iterations),
+                            'parse_ms': _median_ms(lambda: parser.parse_resume(data, name), iterations),
+                            'peak_kib': _peak_kib(lambda: parser.parse_resume(data, name)),
+                            'chars': len(extracted['text']),
+                            'truncated': extracted['reason'] if extracted['truncated'] else None,
+                            'recall': score(parsed, expected),
+                        }
+                        results.append(row)
+                        self.stdout.write(
+                            f"{name:<22}{len(data) / 1024:>8.0f}{row['extract_ms']:>12.1f}"
+                            f"{row['extract_text_ms']:>10.1f}{row['parse_ms']:>10.1f}{row['peak_kib']:>10.0f}"
+                            f"{row['recall']['skills']:>8.2f}{row['recall']['experience']:>6.2f}"
+                            f"{row['recall']['education']:>6.2f}  {row['truncated'] or ''}"
+                        )
+
+        report = {
+            'environment': self._environment(),
+            'limits': {'max_pages': limits[0], 'max_chars': limits[1], 'timeout': limits[2]},
+            'seed': options['seed'],
+            'iterations': iterations,
+            'results': results,
+        }
+        if options['output']:
+            with open(options['output'], 'w') as f:
+                json.dump(report, f, indent=2)
+                f.write('\n')
+            self.stdout.write(f"Results written to {options['output']}")
+        if options['baseline']:
+            self._compare(results, options['baseline'], options['tolerance'])
+
+    def _environment(self):
+        import docx
+        import PyPDF2
+
+        return {
+            'python': platform.python_version(),
+            'platform': platform.platform(),
+            'PyPDF2': PyPDF2.__version__,
+            'python-docx': getattr(docx, '__version__', 'unknown'),
+        }
+
+    def _compare(self, results, path, tolerance):
+        with open(path) as f:
+            baseline = {row['document']: row for row in json.load(f)['results']}
+        problems = []
+        for row in results:
+            before = baseline.get(row['document'])
+            if before is None:
+                continue
+            for metric in ('extract_ms', 'parse_ms'):
+                if row[metric] > before[metric] * (1 + tolerance) and row[metric] - before[metric] > MIN_REGRESSION_MS:
+                    problems.append(f"{row['document']}: {metric} {before[metric]} -> {row[metric]}")
+            for field, value in row['recall'].items():
+                if value < before['recall'].get(field, 0):
+                    problems.append(f"{row['document']}: {field} recall {before['recall'][field]} -> {value}")
+        if problems:
+            raise CommandError('Regressions against baseline:\n' + '\n'.join(problems))
+        self.stdout.write(self.style.SUCCESS(f'No regressions against {path}'))
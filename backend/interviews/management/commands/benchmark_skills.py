@@ -0,0 +1,88 @@
+import random
+import string
+import time
+
+from django.core.management.base import BaseCommand
+
+from interviews.skills import SkillMatcher, get_skill_matcher, normalize
+
+
+def _word(rng):
+    return ''.join(rng.choices(string.ascii_lowercase, k=rng.randint(3, 9)))
+
+
+def build_taxonomy(rng, size, aliases=2):
+    """`size` synthetic skills of one to three words, each with `aliases` aliases."""
+    names = set()
+    while len(names) < size:
+        names.add(' '.join(_word(rng) for _ in range(rng.randint(1, 3))))
+    return [
+        {'name': name, 'aliases': [f'{name}{suffix}' for suffix in ('.js', ' framework', ' lang')[:aliases]]}
+        for name in sorted(names)
+    ]
+
+
+def build_resume(rng, taxonomy, chars, planted=40):
+    """Random prose of about `chars` characters with `planted` taxonomy skills mixed in."""
+    skills = rng.sample([entry['name'] for entry in taxonomy], planted)
+    words = []
+    length = 0
+    while length < chars:
+        word = _word(rng)
+        words.append(word)
+        length += len(word) + 1
+    for skill in skills:
+        words.insert(rng.randrange(len(words)), f'{skill},')
+    return ' '.join(words), set(skills)
+
+
+def _substring_scan(patterns, text):
+    """The previous approach: one `in` scan of the whole text per keyword."""
+    text = text.lower()
+    return [p for p in patterns if p in text]
+
+
+def _time(fn, iterations):
+    start = time.perf_counter()
+    for _ in range(iterations):
+        fn()
+    return (time.perf_counter() - start) / iterations
+
+
+class Command(BaseCommand):
+    help = 'Benchmark the Aho-Corasick skill matcher against per-keyword substring scans on synthetic taxonomies.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--taxonomy-sizes', default='1000,10000')
+        parser.add_argument('--resume-chars', default='5000,50000')
+        parser.add_argument('--iterations', type=int, default=5)
+        parser.add_argument('--seed', type=int, default=42)
+
+    def handle(self, *args, **options):
+        rng = random.Random(options['seed'])
+        iterations = options['iterations']
+        sizes = [int(s) for s in options['taxonomy_sizes'].split(',')]
+        lengths = [int(s) for s in options['resume_chars'].split(',')]
+
+        bundled = get_skill_matcher()
+        self.stdout.write(f'bundled taxonomy: {len(bundled.skills)} skills, {bundled.patterns} patterns')
+        self.stdout.write(
+            f"{'skills':>8}{'patterns':>10}{'build ms':>10}{'chars':>9}"
+            f"{'scan ms':>10}{'matcher ms':>12}{'speedup':>9}{'recall':>8}"
+        )
+        for size in sizes:
+            taxonomy = build_taxonomy(rng, size)
+            start = time.perf_counter()
+            matcher = SkillMatcher(taxonomy)
+            build_ms = (time.perf_counter() - start) * 1000
+            patterns = [normalize(p) for entry in taxonomy for p in (entry['name'], *entry['aliases'])]
+
+            for chars in lengths:
+                text, planted = build_resume(rng, taxonomy, chars)
+                recall = len(planted & set(matcher.find(text))) / len(planted)
+                scan_s = _time(lambda: _substring_scan(patterns, text), iterations)
+                matcher_s = _time(lambda: matcher.find(text), iterations)
+                self.stdout.write(
+                    f'{size:>8}{matcher.patterns:>10}{build_ms:>10.0f}{len(text):>9}'
+                    f'{scan_s * 1000:>10.2f}{matcher_s * 1000:>12.2f}{scan_s / matcher_s:>8.1f}x{recall:>8.0%}'
+                )
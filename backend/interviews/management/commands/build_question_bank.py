@@ -0,0 +1,51 @@
+import time
+
+from django.core.management.base import BaseCommand
+from django.db import models
+
+from interviews.db import iter_keyset
+from interviews.models import BankQuestion, Interview, Question
+from interviews.question_bank import bank_entries_for, reset_bank_index
+
+
+class Command(BaseCommand):
+    help = (
+        'Build the local question bank from previously generated questions of '
+        'interviews without a resume, deduplicated by normalized text.'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--rebuild', action='store_true', help='Empty the bank first')
+        parser.add_argument('--batch-size', type=int, default=200)
+
+    def handle(self, *args, **options):
+        start = time.monotonic()
+        if options['rebuild']:
+            BankQuestion.objects.all().delete()
+        before = BankQuestion.objects.count()
+
+        interviews = (
+            Interview.objects.filter(questions__isnull=False).distinct()
+            .defer('job_description', 'ai_review')
+            .prefetch_related(models.Prefetch('questions', queryset=Question.objects.order_by('order')))
+        )
+        scanned = 0
+        for interview in iter_keyset(interviews, options['batch_size']):
+            scanned += 1
+            if interview.resume_text:
+                continue
+            entries = bank_entries_for(interview, interview.questions.all())
+            if entries:
+                BankQuestion.objects.bulk_create(entries, ignore_conflicts=True)
+        reset_bank_index()
+
+        added = BankQuestion.objects.count() - before
+        by_partition = (
+            BankQuestion.objects.values('difficulty', 'question_type')
+            .annotate(count=models.Count('id')).order_by('difficulty', 'question_type')
+        )
+        for row in by_partition:
+            self.stdout.write(f"  {row['difficulty']:<14}{row['question_type']:<12}{row['count']:>6}")
+        self.stdout.write(self.style.SUCCESS(
+            f'Scanned {scanned} interviews, added {added} questions in {time.monotonic() - start:.1f}s'
+        ))
@@ -0,0 +1,78 @@
+import re
+
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection, transaction
+
+from interviews.models import Interview, InterviewShareLink, Question
+from interviews.views import _with_attempt_counts
+
+# SQLite: "SCAN <table>" reads the whole table, also when it walks an index
+# ("SCAN t USING INDEX i" for ORDER BY); only "SEARCH" seeks on an index.
+SQLITE_FULL_SCAN = re.compile(r'\bSCAN (?!CONSTANT ROW)(\w+)')
+# Postgres: "Seq Scan on <table>".
+POSTGRES_FULL_SCAN = re.compile(r'Seq Scan on (\w+)')
+
+
+def query_shapes():
+    """The hot access paths, built the same way the views build them."""
+    return {
+        'interviews by user, newest first': (
+            Interview.objects.filter(clerk_user_id='user').order_by('-created_at', 'id')[:50]
+        ),
+        'attempt counts by share link and status': (
+            Interview.objects.filter(share_link_id=1, status='completed')
+        ),
+        'attempts for a share link, newest first': (
+            Interview.objects.filter(share_link_id=1).order_by('-created_at', 'id')[:50]
+        ),
+        'questions of an interview in order': (
+            Question.objects.filter(interview_id=1).order_by('order')
+        ),
+        'share links by creator, newest first': (
+            InterviewShareLink.objects.filter(created_by_clerk_user_id='user').order_by('-created_at', 'id')[:50]
+        ),
+        'share links by creator with attempt counts': (
+            _with_attempt_counts(
+                InterviewShareLink.objects.filter(created_by_clerk_user_id='user')
+            ).order_by('-created_at', 'id')[:50]
+        ),
+    }
+
+
+def full_scan_plan(qs):
+    """EXPLAIN `qs` and return (tables read by a full scan, the plan)."""
+    vendor = connection.vendor
+    if vendor == 'sqlite':
+        pattern = SQLITE_FULL_SCAN
+    elif vendor == 'postgresql':
+        pattern = POSTGRES_FULL_SCAN
+    else:
+        raise CommandError(f'Unsupported database vendor: {vendor}')
+    with transaction.atomic():
+        if vendor == 'postgresql':
+            # Small tables make seq scans cheaper than any index; only
+            # check that an index path exists.
+            with connection.cursor() as cursor:
+                cursor.execute('SET LOCAL enable_seqscan = off')
+        plan = qs.explain()
+    return sorted(set(pattern.findall(plan))), plan
+
+
+class Command(BaseCommand):
+    help = 'EXPLAIN the hot query shapes and fail if any of them falls back to a full table scan.'
+
+    def handle(self, *args, **options):
+        failures = []
+        for name, qs in query_shapes().items():
+            full_scans, plan = full_scan_plan(qs)
+            if full_scans:
+                failures.append(name)
+                self.stdout.write(self.style.ERROR(f"FULL SCAN  {name}: {', '.join(full_scans)}"))
+                self.stdout.write(plan)
+            else:
+                self.stdout.write(self.style.SUCCESS(f'ok         {name}'))
+            if options['verbosity'] > 1:
+                self.stdout.write(plan)
+
+        if failures:
+            raise CommandError(f'{len(failures)} query shape(s) fall back to a full scan')
@@ -0,0 +1,14 @@
+from django.core.management.base import BaseCommand
+
+from interviews.rollups import rebuild_rollups
+
+
+class Command(BaseCommand):
+    help = 'Recompute the per-share-link and per-creator attempt analytics rollups from scratch.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--batch-size', type=int, default=500)
+
+    def handle(self, *args, **options):
+        links, creators = rebuild_rollups(options['batch_size'])
+        self.stdout.write(self.style.SUCCESS(f'Rebuilt {links} share-link and {creators} creator rollups'))
@@ -0,0 +1,154 @@
+import json
+import multiprocessing
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from datetime import datetime, time as dt_time
+
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connections, models
+from django.utils import timezone
+from django.utils.dateparse import parse_date
+
+from interviews.models import Interview
+from interviews.ratelimit import SharedRateLimiter
+from interviews.reevaluation import init_worker, reevaluate_interview
+
+# Checkpointed interviews with these outcomes are skipped on resume.
+FINISHED = ('done', 'missing')
+
+
+def _format_eta(seconds):
+    seconds = int(seconds)
+    hours, rest = divmod(seconds, 3600)
+    minutes, seconds = divmod(rest, 60)
+    return f'{hours}h{minutes:02d}m' if hours else f'{minutes}m{seconds:02d}s'
+
+
+class Command(BaseCommand):
+    help = (
+        'Re-run the full AI review of completed interviews across a process pool, '
+        'with a global upstream rate limit. Progress is checkpointed so an '
+        'interrupted run resumes where it stopped.'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--ids', help='Comma-separated interview ids')
+        parser.add_argument('--share-link', type=int, help='Only attempts of this share link')
+        parser.add_argument('--user', help='Only interviews of this clerk_user_id')
+        parser.add_argument('--difficulty')
+        parser.add_argument('--completed-after', help='YYYY-MM-DD')
+        parser.add_argument('--completed-before', help='YYYY-MM-DD')
+        parser.add_argument('--limit', type=int)
+        parser.add_argument('--workers', type=int, default=4)
+        parser.add_argument('--rate', type=float, default=2.0, help='Upstream requests per second, across all workers')
+        parser.add_argument('--checkpoint', default='reevaluate-checkpoint.jsonl')
+        parser.add_argument('--restart', action='store_true', help='Ignore an existing checkpoint')
+        parser.add_argument('--dry-run', action='store_true')
+
+    def _selected(self, options):
+        qs = Interview.objects.filter(status='completed')
+        if options['ids']:
+            try:
+                qs = qs.filter(pk__in=[int(i) for i in options['ids'].split(',') if i.strip()])
+            except ValueError:
+                raise CommandError('--ids must be comma-separated integers')
+        if options['share_link']:
+            qs = qs.filter(share_link_id=options['share_link'])
+        if options['user']:
+            qs = qs.filter(clerk_user_id=options['user'])
+        if options['difficulty']:
+            qs = qs.filter(difficulty=options['difficulty'])
+        for option, lookup in (('completed_after', 'completed_at__gte'), ('completed_before', 'completed_at__lt')):
+            if options[option]:
+                day = parse_date(options[option])
+                if day is None:
+                    raise CommandError(f'--{option.replace("_", "-")} must be YYYY-MM-DD')
+                qs = qs.filter(**{lookup: timezone.make_aware(datetime.combine(day, dt_time.min))})
+        return qs.order_by('pk')
+
+    def _read_checkpoint(self, path):
+        finished = set()
+        if not os.path.exists(path):
+            return finished
+        with open(path) as f:
+            for line in f:
+                try:
+                    entry = json.loads(line)
+                except ValueError:
+                    continue  # torn final line from an interrupted run
+                if entry.get('status') in FINISHED:
+                    finished.add(entry['id'])
+                else:
+                    finished.discard(entry['id'])
+        return finished
+
+    def handle(self, *args, **options):
+        if options['rate'] <= 0 or options['workers'] <= 0:
+            raise CommandError('--rate and --workers must be positive')
+        qs = self._selected(options)
+        ids = list(qs.values_list('pk', flat=True))
+        if options['limit']:
+            ids = ids[:options['limit']]
+
+        checkpoint = options['checkpoint']
+        if options['restart'] and os.path.exists(checkpoint):
+            os.remove(checkpoint)
+        finished = self._read_checkpoint(checkpoint)
+        pending = [pk for pk in ids if pk not in finished]
+
+        # Every answered question is one upstream call, plus one for the summary.
+        calls = (
+            Interview.objects.filter(pk__in=pending)
+            .annotate(answered=models.Count('questions__answer'))
+            .aggregate(total=models.Sum('answered'))['total'] or 0
+        ) + len(pending)
+        self.stdout.write(
+            f'{len(ids)} interviews selected, {len(ids) - len(pending)} already done, {len(pending)} to evaluate '
+            f'(~{calls} upstream calls, at least {_format_eta(calls / options["rate"])} at {options["rate"]:g}/s)'
+        )
+        if options['dry_run'] or not pending:
+            if options['dry_run'] and pending:
+                self.stdout.write('First ids: ' + ', '.join(str(pk) for pk in pending[:20]))
+            return
+
+        # Spawned workers set up Django themselves; don't share this process's connections.
+        connections.close_all()
+        context = multiprocessing.get_context('spawn')
+        limiter = SharedRateLimiter(options['rate'], context=context)
+        counts = {'done': 0, 'partial': 0, 'failed': 0, 'missing': 0}
+        start = time.monotonic()
+        with open(checkpoint, 'a') as log, ProcessPoolExecutor(
+            max_workers=options['workers'], mp_context=context,
+            initializer=init_worker, initargs=(limiter,),
+        ) as pool:
+            futures = [pool.submit(reevaluate_interview, pk) for pk in pending]
+            try:
+                for n, future in enumerate(as_completed(futures), start=1):
+                    pk, status, seconds, detail = future.result()
+                    counts[status] += 1
+                    log.write(json.dumps({
+                        'id': pk, 'status': status, 'seconds': round(seconds, 2),
+                        'detail': detail, 'at': timezone.now().isoformat(),
+                    }) + '\n')
+                    log.flush()
+
+                    elapsed = time.monotonic() - start
+                    per_minute = n / elapsed * 60 if elapsed else 0
+                    eta = (len(pending) - n) * elapsed / n
+                    line = (
+                        f'[{n}/{len(pending)}] #{pk} {status} in {seconds:.1f}s | '
+                        f'{per_minute:.1f}/min | ETA {_format_eta(eta)}'
+                    )
+                    self.stdout.write(line + (f' ({detail})' if detail else ''))
+            except KeyboardInterrupt:
+                pool.shutdown(wait=True, cancel_futures=True)
+                self.stderr.write('Interrupted; re-run the same command to resume from the checkpoint.')
+                raise
+
+        elapsed = time.monotonic() - start
+        summary = ', '.join(f'{count} {status}' for status, count in counts.items() if count)
+        self.stdout.write(self.style.SUCCESS(
+            f'Re-evaluated {len(pending)} interviews in {_format_eta(elapsed)} ({summary}). '
+            f'Checkpoint: {checkpoint}'
+        ))
@@ -0,0 +1,157 @@
+import os
+import sqlite3
+import tempfile
+import threading
+import time
+
+from django.core.management.base import BaseCommand
+
+from interviews.db import SerialWriter, sqlite_pragmas
+
+SCHEMA = """
+CREATE TABLE interview (id INTEGER PRIMARY KEY, ai_review TEXT);
+CREATE TABLE question (id INTEGER PRIMARY KEY, interview_id INTEGER, question_text TEXT, "order" INTEGER);
+CREATE INDEX question_interview ON question (interview_id, "order");
+"""
+
+
+class Workload:
+    """Request threads read (and occasionally write) while background
+    threads insert questions and rewrite the AI review blob, mirroring
+    generate_questions_async / evaluate_interview_async."""
+
+    def __init__(self, path, tuned):
+        self.path = path
+        self.tuned = tuned
+        self.local = threading.local()
+        self.writer = SerialWriter() if tuned else None
+        self.lock = threading.Lock()
+        self.ops = {'read': 0, 'request_write': 0, 'background_write': 0}
+        self.errors = 0
+
+    def conn(self):
+        c = getattr(self.local, 'conn', None)
+        if c is None:
+            # Python's sqlite3 default: 5 second timeout, rollback journal.
+            c = sqlite3.connect(self.path, timeout=5.0, isolation_level=None, check_same_thread=False)
+            if self.tuned:
+                for pragma in sqlite_pragmas():
+                    c.execute(pragma)
+            self.local.conn = c
+        return c
+
+    def _count(self, kind):
+        with self.lock:
+            self.ops[kind] += 1
+
+    def _error(self):
+        with self.lock:
+            self.errors += 1
+
+    def read(self, interview_id):
+        self.conn().execute(
+            'SELECT q.id, q.question_text, i.ai_review FROM question q JOIN interview i ON i.id = q.interview_id '
+            'WHERE q.interview_id = ? ORDER BY q."order"', (interview_id,),
+        ).fetchall()
+
+    def begin(self, c):
+        # The tuned backend starts every transaction with BEGIN IMMEDIATE;
+        # stock Django issues a deferred BEGIN.
+        c.execute('BEGIN IMMEDIATE' if self.tuned else 'BEGIN')
+
+    def request_write(self, interview_id):
+        # Reads, then writes: with a deferred BEGIN this has to upgrade its lock.
+        c = self.conn()
+        self.begin(c)
+        try:
+            c.execute('SELECT COUNT(*) FROM question WHERE interview_id = ?', (interview_id,)).fetchone()
+            c.execute('UPDATE interview SET ai_review = ai_review WHERE id = ?', (interview_id,))
+            c.execute('COMMIT')
+        except Exception:
+            c.execute('ROLLBACK')
+            raise
+
+    def background_write(self, interview_id, n):
+        c = self.conn()
+        self.begin(c)
+        try:
+            c.executemany(
+                'INSERT INTO question (interview_id, question_text, "order") VALUES (?, ?, ?)',
+                [(interview_id, 'q' * 200, n * 100 + i) for i in range(15)],
+            )
+            c.execute('UPDATE interview SET ai_review = ? WHERE id = ?', ('{"per_question": []}' * 50, interview_id))
+            c.execute('COMMIT')
+        except Exception:
+            c.execute('ROLLBACK')
+            raise
+
+    def run_thread(self, kind, deadline, seed):
+        n = 0
+        while time.monotonic() < deadline:
+            n += 1
+            interview_id = (seed + n) % 50 + 1
+            try:
+                if kind == 'request':
+                    # Request threads mostly read; every tenth request writes.
+                    if n % 10:
+                        self.read(interview_id)
+                        kind_done = 'read'
+                    else:
+                        self.request_write(interview_id)
+                        kind_done = 'request_write'
+                    self._count(kind_done)
+                    continue
+                elif self.writer is not None:
+                    self.writer.submit(self.background_write, interview_id, seed * 100000 + n).result()
+                else:
+                    self.background_write(interview_id, seed * 100000 + n)
+                self._count('background_write')
+            except sqlite3.OperationalError:
+                self._error()
+
+
+class Command(BaseCommand):
+    help = 'Concurrency stress test: SQLite defaults vs the production profile (WAL, pragmas, BEGIN IMMEDIATE, serial writer).'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--seconds', type=float, default=5.0)
+        parser.add_argument('--request-threads', type=int, default=8)
+        parser.add_argument('--background-threads', type=int, default=4)
+
+    def run_mode(self, tuned, options):
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, 'stress.sqlite3')
+            setup = sqlite3.connect(path)
+            setup.executescript(SCHEMA)
+            setup.executemany('INSERT INTO interview (id, ai_review) VALUES (?, ?)', [(i, '{}') for i in range(1, 51)])
+            setup.commit()
+            setup.close()
+
+            workload = Workload(path, tuned)
+            deadline = time.monotonic() + options['seconds']
+            threads = []
+            for kind, count in (
+                ('request', options['request_threads']),
+                ('background', options['background_threads']),
+            ):
+                for i in range(count):
+                    threads.append(threading.Thread(target=workload.run_thread, args=(kind, deadline, len(threads) + i)))
+            start = time.monotonic()
+            for t in threads:
+                t.start()
+            for t in threads:
+                t.join()
+            elapsed = time.monotonic() - start
+        return workload, elapsed
+
+    def handle(self, *args, **options):
+        self.stdout.write(
+            f"{'mode':<10}{'reads/s':>10}{'req w/s':>10}{'bg w/s':>10}{'locked errors':>15}"
+        )
+        for label, tuned in (('default', False), ('tuned', True)):
+            workload, elapsed = self.run_mode(tuned, options)
+            ops = workload.ops
+            self.stdout.write(
+                f"{label:<10}{ops['read'] / elapsed:>10.0f}{ops['request_write'] / elapsed:>10.0f}"
+                f"{ops['background_write'] / elapsed:>10.0f}{workload.errors:>15}"
+            )
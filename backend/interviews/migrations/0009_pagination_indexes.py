@@ -0,0 +1,39 @@
+# Generated by Django 5.0.1 on 2026-10-19 08:55
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('interviews', '0008_interview_share_link'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='answer',
+            index=models.Index(fields=['-created_at', 'id'], name='answer_created_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='interview',
+            index=models.Index(fields=['-created_at', 'id'], name='interview_created_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='interview',
+            index=models.Index(fields=['clerk_user_id', '-created_at', 'id'], name='interview_user_created_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='interview',
+            index=models.Index(fields=['share_link', '-created_at', 'id'], name='interview_link_created_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='interviewsharelink',
+            index=models.Index(fields=['-created_at', 'id'], name='sharelink_created_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='interviewsharelink',
+            index=models.Index(fields=['created_by_clerk_user_id', '-created_at', 'id'], name='sharelink_creator_created_idx'),
+        ),
+    ]
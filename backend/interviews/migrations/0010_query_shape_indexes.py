@@ -0,0 +1,45 @@
+# Generated by Django 5.0.1 on 2026-10-19 08:56
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+def renumber_duplicate_question_orders(apps, schema_editor):
+    """Make (interview, order) unique before the constraint is added.
+
+    Interviews whose questions were generated more than once can hold
+    duplicate orders; renumber those sequentially by (order, id).
+    """
+    Question = apps.get_model('interviews', 'Question')
+    duplicated = (
+        Question.objects.values('interview_id', 'order')
+        .annotate(n=models.Count('id'))
+        .filter(n__gt=1)
+        .values_list('interview_id', flat=True)
+        .distinct()
+    )
+    for interview_id in list(duplicated):
+        questions = list(Question.objects.filter(interview_id=interview_id).order_by('order', 'id'))
+        for idx, question in enumerate(questions, start=1):
+            question.order = idx
+        Question.objects.bulk_update(questions, ['order'])
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('interviews', '0009_pagination_indexes'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='interview',
+            index=models.Index(fields=['share_link', 'status'], name='interview_link_status_idx'),
+        ),
+        migrations.RunPython(renumber_duplicate_question_orders, migrations.RunPython.noop),
+        migrations.AddConstraint(
+            model_name='question',
+            constraint=models.UniqueConstraint(fields=('interview', 'order'), name='question_interview_order_uniq'),
+        ),
+    ]
@@ -0,0 +1,18 @@
+# Generated by Django 5.0.1 on 2026-10-19 08:57
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('interviews', '0010_query_shape_indexes'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='interview',
+            name='current_question_order',
+            field=models.PositiveIntegerField(default=0, help_text='All questions before this order are answered; drives next_question'),
+        ),
+    ]
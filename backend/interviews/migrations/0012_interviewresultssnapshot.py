@@ -0,0 +1,25 @@
+# Generated by Django 5.0.1 on 2026-10-19 08:58
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('interviews', '0011_interview_question_cursor'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='InterviewResultsSnapshot',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('version', models.PositiveIntegerField(help_text='Payload format version')),
+                ('payload', models.JSONField()),
+                ('etag', models.CharField(max_length=64)),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('interview', models.OneToOneField(on_delete=django.db.models.deletion.CASCADE, related_name='results_snapshot', to='interviews.interview')),
+            ],
+        ),
+    ]
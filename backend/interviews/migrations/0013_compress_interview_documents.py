@@ -0,0 +1,83 @@
+from django.db import migrations
+
+import interviews.fields
+
+# (field, temporary column) pairs moved to compressed storage.
+FIELDS = [
+    ('job_description', 'job_description_z'),
+    ('resume_text', 'resume_text_z'),
+    ('ai_review', 'ai_review_z'),
+]
+BATCH_SIZE = 500
+
+
+def _copy(apps, source_of, target_of):
+    Interview = apps.get_model('interviews', 'Interview')
+    sources = [source_of(name, tmp) for name, tmp in FIELDS]
+    targets = [target_of(name, tmp) for name, tmp in FIELDS]
+    batch = []
+    for interview in Interview.objects.only('id', *sources).iterator(chunk_size=BATCH_SIZE):
+        for source, target in zip(sources, targets):
+            setattr(interview, target, getattr(interview, source))
+        batch.append(interview)
+        if len(batch) >= BATCH_SIZE:
+            Interview.objects.bulk_update(batch, targets)
+            batch = []
+    if batch:
+        Interview.objects.bulk_update(batch, targets)
+
+
+def compress_existing(apps, schema_editor):
+    _copy(apps, lambda name, tmp: name, lambda name, tmp: tmp)
+
+
+def decompress_existing(apps, schema_editor):
+    _copy(apps, lambda name, tmp: tmp, lambda name, tmp: name)
+
+
+class Migration(migrations.Migration):
+    """Move Interview's large documents to compressed blobs.
+
+    Done as add/copy/remove/rename rather than AlterField: Postgres can't
+    cast jsonb to bytea, and the copy runs the values through the field's
+    compressor.
+    """
+
+    dependencies = [
+        ('interviews', '0012_interviewresultssnapshot'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='interview',
+            name='job_description_z',
+            field=interviews.fields.CompressedTextField(blank=True, editable=True),
+        ),
+        migrations.AddField(
+            model_name='interview',
+            name='resume_text_z',
+            field=interviews.fields.CompressedTextField(blank=True, editable=True),
+        ),
+        migrations.AddField(
+            model_name='interview',
+            name='ai_review_z',
+            field=interviews.fields.CompressedJSONField(blank=True, editable=True, null=True),
+        ),
+        migrations.RunPython(compress_existing, decompress_existing),
+        migrations.RemoveField(model_name='interview', name='job_description'),
+        migrations.RemoveField(model_name='interview', name='resume_text'),
+        migrations.RemoveField(model_name='interview', name='ai_review'),
+        migrations.RenameField(model_name='interview', old_name='job_description_z', new_name='job_description'),
+        migrations.RenameField(model_name='interview', old_name='resume_text_z', new_name='resume_text'),
+        migrations.RenameField(model_name='interview', old_name='ai_review_z', new_name='ai_review'),
+        migrations.AlterField(
+            model_name='interview',
+            name='resume_text',
+            field=interviews.fields.CompressedTextField(blank=True, editable=True, help_text='Full resume text for AI question generation'),
+        ),
+        migrations.AlterField(
+            model_name='interview',
+            name='ai_review',
+            field=interviews.fields.CompressedJSONField(blank=True, editable=True, help_text='AI-generated full interview review payload', null=True),
+        ),
+    ]
@@ -0,0 +1,58 @@
+# Generated by Django 5.0.1 on 2026-10-19 09:07
+
+import django.db.models.deletion
+import interviews.fields
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('interviews', '0013_compress_interview_documents'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ArchivedInterview',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('interview_id', models.BigIntegerField(help_text='Primary key of the archived Interview', unique=True)),
+                ('clerk_user_id', models.CharField(blank=True, default='', max_length=200)),
+                ('job_title', models.CharField(max_length=200)),
+                ('difficulty', models.CharField(max_length=20)),
+                ('status', models.CharField(max_length=20)),
+                ('overall_score', models.IntegerField(default=0)),
+                ('ai_final_score', models.FloatField(default=0)),
+                ('ai_review_generated_at', models.DateTimeField(blank=True, null=True)),
+                ('created_at', models.DateTimeField()),
+                ('updated_at', models.DateTimeField()),
+                ('archived_at', models.DateTimeField(auto_now_add=True)),
+                ('detail', interviews.fields.CompressedJSONField(editable=True, help_text='InterviewSerializer payload')),
+                ('detail_etag', models.CharField(max_length=64)),
+                ('results', interviews.fields.CompressedJSONField(editable=True, help_text='results payload')),
+                ('results_etag', models.CharField(max_length=64)),
+            ],
+            options={
+                'ordering': ['-created_at'],
+            },
+        ),
+        migrations.AddIndex(
+            model_name='interview',
+            index=models.Index(fields=['status', 'updated_at'], name='interview_status_updated_idx'),
+        ),
+        migrations.AddField(
+            model_name='archivedinterview',
+            name='share_link',
+            field=models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='archived_attempts', to='interviews.interviewsharelink'),
+        ),
+        migrations.AddIndex(
+            model_name='archivedinterview',
+            index=models.Index(fields=['clerk_user_id', '-created_at', 'id'], name='archived_user_created_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='archivedinterview',
+            index=models.Index(fields=['share_link', '-created_at', 'id'], name='archived_link_created_idx'),
+        ),
+    ]
@@ -0,0 +1,76 @@
+# Generated by Django 5.0.1 on 2026-10-19 09:11
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+def backfill_completed_at(apps, schema_editor):
+    # Last activity is the best available estimate for attempts completed
+    # before completed_at was recorded.
+    for model_name in ('Interview', 'ArchivedInterview'):
+        model = apps.get_model('interviews', model_name)
+        model.objects.filter(status='completed', completed_at__isnull=True).update(
+            completed_at=models.F('updated_at'),
+        )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('interviews', '0014_interview_archive'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='CreatorRollup',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('attempts_total', models.PositiveIntegerField(default=0)),
+                ('attempts_completed', models.PositiveIntegerField(default=0)),
+                ('reviewed_total', models.PositiveIntegerField(default=0)),
+                ('score_total', models.FloatField(default=0)),
+                ('score_histogram', models.JSONField(default=list, help_text='Reviewed attempts per final-score bucket')),
+                ('recommendations', models.JSONField(default=dict, help_text='Reviewed attempts per hire recommendation')),
+                ('duration_histogram', models.JSONField(default=list, help_text='Completed attempts per time-to-complete bucket')),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+                ('clerk_user_id', models.CharField(max_length=200, unique=True)),
+            ],
+            options={
+                'abstract': False,
+            },
+        ),
+        migrations.AddField(
+            model_name='archivedinterview',
+            name='completed_at',
+            field=models.DateTimeField(blank=True, null=True),
+        ),
+        migrations.AddField(
+            model_name='interview',
+            name='completed_at',
+            field=models.DateTimeField(blank=True, null=True),
+        ),
+        migrations.AddField(
+            model_name='interview',
+            name='rollup_contribution',
+            field=models.JSONField(blank=True, editable=False, help_text='What this attempt currently adds to its share-link and creator rollups', null=True),
+        ),
+        migrations.CreateModel(
+            name='ShareLinkRollup',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('attempts_total', models.PositiveIntegerField(default=0)),
+                ('attempts_completed', models.PositiveIntegerField(default=0)),
+                ('reviewed_total', models.PositiveIntegerField(default=0)),
+                ('score_total', models.FloatField(default=0)),
+                ('score_histogram', models.JSONField(default=list, help_text='Reviewed attempts per final-score bucket')),
+                ('recommendations', models.JSONField(default=dict, help_text='Reviewed attempts per hire recommendation')),
+                ('duration_histogram', models.JSONField(default=list, help_text='Completed attempts per time-to-complete bucket')),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+                ('share_link', models.OneToOneField(on_delete=django.db.models.deletion.CASCADE, related_name='rollup', to='interviews.interviewsharelink')),
+            ],
+            options={
+                'abstract': False,
+            },
+        ),
+        migrations.RunPython(backfill_completed_at, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,29 @@
+# Generated by Django 5.0.1 on 2026-10-19 09:13
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('interviews', '0015_attempt_rollups'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='BankQuestion',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('text', models.TextField()),
+                ('text_hash', models.CharField(help_text='sha256 of the normalized text', max_length=64, unique=True)),
+                ('role', models.CharField(blank=True, default='', max_length=200)),
+                ('skills', models.TextField(blank=True, default='', help_text='Normalized, comma-separated skills')),
+                ('difficulty', models.CharField(max_length=20)),
+                ('question_type', models.CharField(choices=[('basic', 'Basic'), ('technical', 'Technical'), ('behavioral', 'Behavioral'), ('situational', 'Situational')], max_length=20)),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+            ],
+            options={
+                'indexes': [models.Index(fields=['difficulty', 'question_type'], name='bankquestion_partition_idx')],
+            },
+        ),
+    ]
@@ -0,0 +1,29 @@
+# Generated by Django 5.0.1 on 2026-10-19 09:23
+
+import django.utils.timezone
+import interviews.fields
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('interviews', '0016_question_bank'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ResumeParseCache',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('content_hash', models.CharField(help_text='sha256 of the file bytes', max_length=64, unique=True)),
+                ('file_size', models.PositiveIntegerField()),
+                ('extraction', interviews.fields.CompressedJSONField(editable=True, help_text='text, truncated, reason, pages and the limits used')),
+                ('parsed', interviews.fields.CompressedJSONField(blank=True, editable=True, help_text='ResumeParser.parse_resume output', null=True)),
+                ('payload_size', models.PositiveIntegerField(default=0)),
+                ('hits', models.PositiveIntegerField(default=0)),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('last_used_at', models.DateTimeField(db_index=True, default=django.utils.timezone.now)),
+            ],
+        ),
+    ]
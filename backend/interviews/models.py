@@ -3,6 +3,8 @@ from django.conf import settings
 from django.utils import timezone
 import uuid
 
+from .fields import CompressedJSONField, CompressedTextField
+
 
 class Interview(models.Model):
     STATUS_CHOICES = [
@@ -21,28 +23,69 @@ class Interview(models.Model):
         null=True, blank=True, related_name='interview_attempts',
     )
     job_title = models.CharField(max_length=200)
-    job_description = models.TextField(blank=True)
+    job_description = CompressedTextField(blank=True)
     skills = models.TextField(help_text='Comma-separated skills', blank=True, default='')
     difficulty = models.CharField(
         max_length=20,
         choices=[('beginner', 'Beginner'), ('intermediate', 'Intermediate'), ('advanced', 'Advanced')],
         default='intermediate',
     )
-    resume_text = models.TextField(blank=True, help_text='Full resume text for AI question generation')
+    resume_text = CompressedTextField(blank=True, help_text='Full resume text for AI question generation')
     status = models.CharField(max_length=20, choices=STATUS_CHOICES, default='pending')
     overall_score = models.IntegerField(default=0, help_text='Average score across all answers')
-    ai_review = models.JSONField(null=True, blank=True, help_text='AI-generated full interview review payload')
+    ai_review = CompressedJSONField(null=True, blank=True, help_text='AI-generated full interview review payload')
     ai_final_score = models.FloatField(default=0, help_text='Final AI score for the interview')
     ai_review_generated_at = models.DateTimeField(null=True, blank=True)
+    current_question_order = models.PositiveIntegerField(
+        default=0, help_text='All questions before this order are answered; drives next_question',
+    )
+    completed_at = models.DateTimeField(null=True, blank=True)
+    rollup_contribution = models.JSONField(
+        null=True, blank=True, editable=False,
+        help_text='What this attempt currently adds to its share-link and creator rollups',
+    )
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
 
     class Meta:
         ordering = ['-created_at']
+        indexes = [
+            # Cursor pagination keys: (-created_at, id), optionally scoped to a user or share link.
+            models.Index(fields=['-created_at', 'id'], name='interview_created_idx'),
+            models.Index(fields=['clerk_user_id', '-created_at', 'id'], name='interview_user_created_idx'),
+            models.Index(fields=['share_link', '-created_at', 'id'], name='interview_link_created_idx'),
+            # Attempt counters aggregate per share link filtered by status.
+            models.Index(fields=['share_link', 'status'], name='interview_link_status_idx'),
+            # archive_interviews picks completed interviews by last activity.
+            models.Index(fields=['status', 'updated_at'], name='interview_status_updated_idx'),
+        ]
 
     def __str__(self):
         return f"{self.clerk_user_id} - {self.job_title}"
 
+    def sync_question_cursor(self) -> int:
+        """Point `current_question_order` at the first unanswered question.
+
+        Callers run this inside the transaction that wrote the answer, after
+        locking the interview row, so concurrent submissions serialize.
+        When every question is answered the cursor moves past the last one.
+        """
+        first_unanswered = (
+            self.questions
+            .filter(models.Q(answer__isnull=True) | models.Q(answer__answer_text__regex=r'^\s*$'))
+            .order_by('order')
+            .values_list('order', flat=True)
+            .first()
+        )
+        if first_unanswered is None:
+            last = self.questions.aggregate(last=models.Max('order'))['last'] or 0
+            first_unanswered = last + 1
+
+        if first_unanswered != self.current_question_order:
+            Interview.objects.filter(pk=self.pk).update(current_question_order=first_unanswered)
+            self.current_question_order = first_unanswered
+        return first_unanswered
+
 
 class InterviewShareLink(models.Model):
     """Public share link for an interview template created by an interviewer.
@@ -72,6 +115,10 @@ class InterviewShareLink(models.Model):
 
     class Meta:
         ordering = ['-created_at']
+        indexes = [
+            models.Index(fields=['-created_at', 'id'], name='sharelink_created_idx'),
+            models.Index(fields=['created_by_clerk_user_id', '-created_at', 'id'], name='sharelink_creator_created_idx'),
+        ]
 
     def __str__(self):
         return f"ShareLink {self.token} ({self.role})"
@@ -99,11 +146,143 @@ class Question(models.Model):
 
     class Meta:
         ordering = ['order']
+        constraints = [
+            # Also serves next_question/results, which read an interview's questions in order.
+            models.UniqueConstraint(fields=['interview', 'order'], name='question_interview_order_uniq'),
+        ]
 
     def __str__(self):
         return f"Q{self.order}: {self.question_text[:50]}..."
 
 
+class BankQuestion(models.Model):
+    """Deduplicated, tagged question served from the local question bank."""
+
+    text = models.TextField()
+    text_hash = models.CharField(max_length=64, unique=True, help_text='sha256 of the normalized text')
+    role = models.CharField(max_length=200, blank=True, default='')
+    skills = models.TextField(blank=True, default='', help_text='Normalized, comma-separated skills')
+    difficulty = models.CharField(max_length=20)
+    question_type = models.CharField(max_length=20, choices=Question.QUESTION_TYPES)
+    created_at = models.DateTimeField(auto_now_add=True)
+
+    class Meta:
+        indexes = [
+            models.Index(fields=['difficulty', 'question_type'], name='bankquestion_partition_idx'),
+        ]
+
+    def __str__(self):
+        return f"[{self.difficulty}/{self.question_type}] {self.text[:50]}"
+
+
+class ResumeParseCache(models.Model):
+    """Extracted text and structured parse of an uploaded resume, keyed by file content.
+
+    `payload_size` is the approximate uncompressed size of the cached data;
+    the least recently used rows are evicted once the total passes
+    RESUME_CACHE_MAX_MB.
+    """
+
+    content_hash = models.CharField(max_length=64, unique=True, help_text='sha256 of the file bytes')
+    file_size = models.PositiveIntegerField()
+    extraction = CompressedJSONField(help_text='text, truncated, reason, pages and the limits used')
+    parsed = CompressedJSONField(null=True, blank=True, help_text='ResumeParser.parse_resume output')
+    payload_size = models.PositiveIntegerField(default=0)
+    hits = models.PositiveIntegerField(default=0)
+    created_at = models.DateTimeField(auto_now_add=True)
+    last_used_at = models.DateTimeField(default=timezone.now, db_index=True)
+
+    def __str__(self):
+        return f"Resume {self.content_hash[:12]} ({self.file_size} bytes)"
+
+
+class InterviewResultsSnapshot(models.Model):
+    """Immutable `results` payload built once the AI review has completed.
+
+    Rows are never updated: reattempt, completion and forced re-evaluation
+    delete the snapshot and a new one is built when the next review finishes.
+    """
+
+    interview = models.OneToOneField(Interview, on_delete=models.CASCADE, related_name='results_snapshot')
+    version = models.PositiveIntegerField(help_text='Payload format version')
+    payload = models.JSONField()
+    etag = models.CharField(max_length=64)
+    created_at = models.DateTimeField(auto_now_add=True)
+
+    def __str__(self):
+        return f"Results v{self.version} for interview {self.interview_id}"
+
+
+class ArchivedInterview(models.Model):
+    """Cold copy of a completed interview moved out of the hot tables.
+
+    Keeps the attempt summary columns for listing plus the compressed
+    `retrieve` and `results` payloads as they were served at archive time;
+    the interview's questions, answers and snapshot rows are deleted.
+    """
+
+    interview_id = models.BigIntegerField(unique=True, help_text='Primary key of the archived Interview')
+    clerk_user_id = models.CharField(max_length=200, blank=True, default='')
+    share_link = models.ForeignKey(
+        InterviewShareLink, on_delete=models.SET_NULL,
+        null=True, blank=True, related_name='archived_attempts',
+    )
+    job_title = models.CharField(max_length=200)
+    difficulty = models.CharField(max_length=20)
+    status = models.CharField(max_length=20)
+    overall_score = models.IntegerField(default=0)
+    ai_final_score = models.FloatField(default=0)
+    ai_review_generated_at = models.DateTimeField(null=True, blank=True)
+    created_at = models.DateTimeField()
+    updated_at = models.DateTimeField()
+    completed_at = models.DateTimeField(null=True, blank=True)
+    archived_at = models.DateTimeField(auto_now_add=True)
+    detail = CompressedJSONField(help_text='InterviewSerializer payload')
+    detail_etag = models.CharField(max_length=64)
+    results = CompressedJSONField(help_text='results payload')
+    results_etag = models.CharField(max_length=64)
+
+    class Meta:
+        ordering = ['-created_at']
+        indexes = [
+            models.Index(fields=['clerk_user_id', '-created_at', 'id'], name='archived_user_created_idx'),
+            models.Index(fields=['share_link', '-created_at', 'id'], name='archived_link_created_idx'),
+        ]
+
+    def __str__(self):
+        return f"Archived interview {self.interview_id} ({self.job_title})"
+
+
+class AttemptRollup(models.Model):
+    """Attempt analytics kept up to date as attempts change; see interviews.rollups."""
+
+    attempts_total = models.PositiveIntegerField(default=0)
+    attempts_completed = models.PositiveIntegerField(default=0)
+    reviewed_total = models.PositiveIntegerField(default=0)
+    score_total = models.FloatField(default=0)
+    score_histogram = models.JSONField(default=list, help_text='Reviewed attempts per final-score bucket')
+    recommendations = models.JSONField(default=dict, help_text='Reviewed attempts per hire recommendation')
+    duration_histogram = models.JSONField(default=list, help_text='Completed attempts per time-to-complete bucket')
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        abstract = True
+
+
+class ShareLinkRollup(AttemptRollup):
+    share_link = models.OneToOneField(InterviewShareLink, on_delete=models.CASCADE, related_name='rollup')
+
+    def __str__(self):
+        return f"Rollup for share link {self.share_link_id}"
+
+
+class CreatorRollup(AttemptRollup):
+    clerk_user_id = models.CharField(max_length=200, unique=True)
+
+    def __str__(self):
+        return f"Rollup for creator {self.clerk_user_id}"
+
+
 class Answer(models.Model):
     question = models.OneToOneField(Question, on_delete=models.CASCADE, related_name='answer')
     answer_text = models.TextField()
@@ -113,5 +292,10 @@ class Answer(models.Model):
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
 
+    class Meta:
+        indexes = [
+            models.Index(fields=['-created_at', 'id'], name='answer_created_idx'),
+        ]
+
     def __str__(self):
         return f"Answer to Q{self.question.order}"
@@ -0,0 +1,35 @@
+from django.conf import settings
+from rest_framework.pagination import CursorPagination
+
+
+class CreatedAtCursorPagination(CursorPagination):
+    """Keyset pagination over `(-created_at, id)`.
+
+    Cursors encode the last seen `created_at` plus an offset for ties, so pages
+    stay stable while new rows are inserted at the head of the list. Every
+    list response is a page of at most PAGE_SIZE rows (or `page_size`, capped
+    at API_MAX_PAGE_SIZE); clients follow `next` for more.
+    """
+
+    ordering = ('-created_at', 'id')
+    page_size_query_param = 'page_size'
+
+    @property
+    def max_page_size(self):
+        return getattr(settings, 'API_MAX_PAGE_SIZE', 200)
+
+
+class QuestionCursorPagination(CreatedAtCursorPagination):
+    """Questions of one interview are read in interview order.
+
+    Cursors key on the first ordering field and fall back to an offset
+    (capped at `offset_cutoff`) for ties. `order` is only unique within an
+    interview, so the unscoped listing pages by `id` instead.
+    """
+
+    ordering = ('id',)
+
+    def get_ordering(self, request, queryset, view):
+        if request.query_params.get('interview_id'):
+            return ('order', 'id')
+        return self.ordering
@@ -0,0 +1,228 @@
+"""Local question bank built from previously generated questions.
+
+Questions from interviews without a resume are deduplicated by normalized
+text, tagged with role, skills, difficulty and type, and ranked with BM25 so
+common role/difficulty combinations can be served without an LLM call.
+The index is built in process memory on first use and rebuilt when the
+bank changes (checked at most every QUESTION_BANK_REFRESH_SECONDS).
+"""
+import hashlib
+import logging
+import math
+import random
+import re
+import threading
+import time
+from collections import Counter, defaultdict
+
+from django.conf import settings
+from django.db import models
+
+from .models import BankQuestion, Question
+
+logger = logging.getLogger(__name__)
+
+# Questions per interview, by type, in the order they are asked.
+QUESTION_PLAN = (('basic', 5), ('technical', 10))
+
+_TOKEN_RE = re.compile(r'[a-z0-9][a-z0-9+#]*(?:\.[a-z0-9]+)*')
+_STOPWORDS = frozenset(
+    'a an and are as at be by can could describe do does explain for from have how i if in is it '
+    'its me of on or our please should tell that the their this to up us was we what when where '
+    'which while who why will with would you your'.split()
+)
+
+
+def normalize_text(text: str) -> str:
+    return ' '.join(re.sub(r'[^\w\s+#]', ' ', (text or '').lower()).split())
+
+
+def text_hash(text: str) -> str:
+    return hashlib.sha256(normalize_text(text).encode('utf-8')).hexdigest()
+
+
+def tokenize(text: str) -> list[str]:
+    return [t for t in _TOKEN_RE.findall((text or '').lower()) if t not in _STOPWORDS]
+
+
+def _normalize_skills(skills: str) -> str:
+    return ','.join(sorted({s.strip().lower() for s in (skills or '').split(',') if s.strip()}))
+
+
+class BM25Index:
+    """Okapi BM25 over pre-tokenized documents, with an inverted index."""
+
+    def __init__(self, docs: list[list[str]], k1: float = 1.5, b: float = 0.75):
+        self.k1 = k1
+        self.b = b
+        self.doc_len = [len(d) for d in docs]
+        self.avgdl = (sum(self.doc_len) / len(docs)) if docs else 0.0
+        self.postings: dict[str, list[tuple[int, int]]] = defaultdict(list)
+        for i, doc in enumerate(docs):
+            for term, tf in Counter(doc).items():
+                self.postings[term].append((i, tf))
+        n = len(docs)
+        self.idf = {
+            term: math.log(1 + (n - len(p) + 0.5) / (len(p) + 0.5))
+            for term, p in self.postings.items()
+        }
+
+    def scores(self, query: list[str]) -> dict[int, float]:
+        out: dict[int, float] = defaultdict(float)
+        for term in set(query):
+            postings = self.postings.get(term)
+            if not postings:
+                continue
+            idf = self.idf[term]
+            for i, tf in postings:
+                norm = self.k1 * (1 - self.b + self.b * self.doc_len[i] / (self.avgdl or 1))
+                out[i] += idf * tf * (self.k1 + 1) / (tf + norm)
+        return out
+
+
+class _Partition:
+    """Bank questions of one (difficulty, type) with their BM25 index."""
+
+    def __init__(self, entries):
+        self.entries = entries
+        for e in entries:
+            e['tags'] = frozenset(tokenize(f"{e['role']} {e['skills'].replace(',', ' ')}"))
+        # Role and skills are repeated so they outweigh incidental words in the text.
+        self.index = BM25Index([
+            tokenize(f"{e['role']} {e['role']} {e['skills'].replace(',', ' ')} {e['text']}")
+            for e in entries
+        ])
+
+    def search(self, query, min_match, exclude=frozenset()):
+        """Entries whose role/skill tags cover `min_match` of the query terms, best BM25 first.
+
+        BM25 only ranks: terms shared by a whole partition score near zero,
+        so relevance is decided on tag overlap instead of an absolute score.
+        """
+        terms = set(query)
+        scored = self.index.scores(query)
+        ranked = sorted(scored.items(), key=lambda item: item[1], reverse=True)
+        return [
+            self.entries[i] for i, _score in ranked
+            if self.entries[i]['hash'] not in exclude
+            and len(terms & self.entries[i]['tags']) >= min_match * len(terms)
+        ]
+
+
+class QuestionBankIndex:
+    def __init__(self, rows):
+        grouped = defaultdict(list)
+        for row in rows:
+            grouped[(row['difficulty'], row['question_type'])].append(row)
+        self.partitions = {key: _Partition(entries) for key, entries in grouped.items()}
+        self.size = sum(len(p.entries) for p in self.partitions.values())
+
+    def search(self, difficulty, question_type, query, min_match, exclude=frozenset()):
+        partition = self.partitions.get((difficulty, question_type))
+        return partition.search(query, min_match, exclude) if partition else []
+
+
+_index: QuestionBankIndex | None = None
+_index_version = None
+_index_checked_at = 0.0
+_index_lock = threading.Lock()
+
+
+def _bank_version():
+    stats = BankQuestion.objects.aggregate(count=models.Count('id'), last=models.Max('id'))
+    return stats['count'], stats['last']
+
+
+def get_bank_index() -> QuestionBankIndex:
+    global _index, _index_version, _index_checked_at
+    with _index_lock:
+        now = time.monotonic()
+        if _index is not None and now - _index_checked_at < settings.QUESTION_BANK_REFRESH_SECONDS:
+            return _index
+        version = _bank_version()
+        if _index is None or version != _index_version:
+            start = time.perf_counter()
+            rows = list(BankQuestion.objects.values('text', 'text_hash', 'role', 'skills', 'difficulty', 'question_type'))
+            for row in rows:
+                row['hash'] = row.pop('text_hash')
+            _index = QuestionBankIndex(rows)
+            _index_version = version
+            logger.info(f"Question bank index built: {_index.size} questions in {(time.perf_counter() - start) * 1000:.0f}ms")
+        _index_checked_at = now
+        return _index
+
+
+def reset_bank_index():
+    global _index, _index_version
+    with _index_lock:
+        _index = None
+        _index_version = None
+
+
+def _seen_hashes(clerk_user_id) -> set[str]:
+    """Hashes of every question this candidate has already been asked."""
+    if not clerk_user_id:
+        return set()
+    texts = Question.objects.filter(interview__clerk_user_id=clerk_user_id).values_list('question_text', flat=True)
+    return {text_hash(t) for t in texts}
+
+
+def assemble_from_bank(interview, rng=None) -> list[dict] | None:
+    """Pick a 5 basic + 10 technical set for `interview`, or None if coverage is thin.
+
+    Each type needs QUESTION_BANK_POOL_FACTOR times as many relevant unseen
+    questions as it uses, relevant meaning their role/skill tags cover at
+    least QUESTION_BANK_MIN_MATCH of the query terms. The set is sampled from
+    that pool so repeat requests get different questions.
+    """
+    rng = rng or random.Random()
+    index = get_bank_index()
+    if not index.size:
+        return None
+    query = tokenize(f"{interview.job_title} {interview.job_title} {interview.skills.replace(',', ' ')}")
+    if not query:
+        return None
+    exclude = _seen_hashes(interview.clerk_user_id)
+
+    picked = []
+    for question_type, count in QUESTION_PLAN:
+        ranked = index.search(interview.difficulty, question_type, query, settings.QUESTION_BANK_MIN_MATCH, exclude)
+        pool = ranked[:count * settings.QUESTION_BANK_POOL_FACTOR]
+        if len(pool) < count * settings.QUESTION_BANK_POOL_FACTOR:
+            logger.info(
+                f"Question bank coverage too thin for interview {interview.id}: "
+                f"{len(pool)} {question_type} candidates"
+            )
+            return None
+        # Sample, then keep the chosen questions in relevance order.
+        chosen = sorted(rng.sample(range(len(pool)), count))
+        picked.extend({'question_text': pool[i]['text'], 'question_type': question_type} for i in chosen)
+    return picked
+
+
+def bank_entries_for(interview, questions) -> list[BankQuestion]:
+    """Unsaved BankQuestion rows for an interview's generated questions."""
+    role = normalize_text(interview.job_title)
+    skills = _normalize_skills(interview.skills)
+    entries = {}
+    for q in questions:
+        text = (q.question_text or '').strip()
+        if not text or q.question_type not in dict(QUESTION_PLAN):
+            continue
+        entries.setdefault(text_hash(text), BankQuestion(
+            text=text,
+            text_hash=text_hash(text),
+            role=role,
+            skills=skills,
+            difficulty=interview.difficulty,
+            question_type=q.question_type,
+        ))
+    return list(entries.values())
+
+
+def add_to_bank(interview, questions) -> int:
+    """Store freshly generated questions in the bank (duplicates are skipped)."""
+    entries = bank_entries_for(interview, questions)
+    if entries:
+        BankQuestion.objects.bulk_create(entries, ignore_conflicts=True)
+    return len(entries)
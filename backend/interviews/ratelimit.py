@@ -0,0 +1,28 @@
+import multiprocessing
+import time
+
+
+class SharedRateLimiter:
+    """Spaces calls to at most `rate` per second across processes and threads.
+
+    Each acquire() reserves the next free time slot in a shared double and
+    sleeps until it. Pass the limiter to worker processes when they are
+    created (e.g. via a pool initializer); the shared value cannot be sent
+    with individual tasks.
+    """
+
+    def __init__(self, rate: float, context=None):
+        if rate <= 0:
+            raise ValueError('rate must be positive')
+        context = context or multiprocessing.get_context()
+        self.interval = 1.0 / rate
+        self._next_slot = context.Value('d', 0.0)
+
+    def acquire(self):
+        with self._next_slot.get_lock():
+            now = time.monotonic()
+            slot = max(now, self._next_slot.value)
+            self._next_slot.value = slot + self.interval
+        delay = slot - time.monotonic()
+        if delay > 0:
+            time.sleep(delay)
@@ -0,0 +1,54 @@
+"""Worker side of `manage.py reevaluate`.
+
+Runs in pool processes, so Django is set up by the initializer and models
+are imported inside the functions rather than at module level.
+"""
+import time
+
+FAILED_ITEM_PREFIX = 'AI evaluation failed'
+
+
+def init_worker(rate_limiter):
+    import django
+    django.setup()
+
+    from .services import AIQuestionGenerator
+    AIQuestionGenerator.rate_limiter = rate_limiter
+
+
+def reevaluate_interview(interview_id):
+    """Re-run the full AI review of one interview and store it.
+
+    Returns (interview_id, status, seconds, detail) where status is `done`,
+    `partial` (some questions could not be evaluated), `failed` or `missing`.
+    """
+    from django.db import close_old_connections
+
+    from .models import Interview
+    from .services import AIQuestionGenerator
+    from .views import store_interview_review, store_review_error
+
+    close_old_connections()
+    start = time.monotonic()
+    try:
+        interview = Interview.objects.get(pk=interview_id)
+    except Interview.DoesNotExist:
+        return interview_id, 'missing', 0.0, None
+
+    try:
+        review = AIQuestionGenerator().evaluate_full_interview(interview)
+        failed = sum(
+            1 for item in (review or {}).get('per_question', [])
+            if str(item.get('strategy_to_improve', '')).startswith(FAILED_ITEM_PREFIX)
+        )
+        store_interview_review(interview, review)
+    except Exception as e:
+        # Don't leave the interview on a 'processing' review the results page polls forever.
+        try:
+            store_review_error(interview, e)
+        except Exception as store_error:
+            return interview_id, 'failed', time.monotonic() - start, f'{e}; storing the error failed: {store_error}'
+        return interview_id, 'failed', time.monotonic() - start, str(e)
+    if failed:
+        return interview_id, 'partial', time.monotonic() - start, f'{failed} questions failed'
+    return interview_id, 'done', time.monotonic() - start, None
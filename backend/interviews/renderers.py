@@ -0,0 +1,102 @@
+import codecs
+
+from django.conf import settings
+from rest_framework.exceptions import ParseError
+from rest_framework.parsers import JSONParser
+from rest_framework.renderers import JSONRenderer
+from rest_framework.utils.encoders import JSONEncoder
+
+from .timing import timed
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional speedup
+    orjson = None
+
+# Datetimes are passed through to DRF's encoder so the output matches the
+# stock renderer byte for byte ('Z' suffix for UTC, same precision).
+_ORJSON_OPTIONS = (orjson.OPT_NON_STR_KEYS | orjson.OPT_PASSTHROUGH_DATETIME) if orjson else 0
+
+_encoder = JSONEncoder()
+
+
+def _needs_stock_encoding(data) -> bool:
+    """True if `data` holds a float orjson writes differently from the stdlib.
+
+    orjson writes NaN and infinities as null where the stock renderer rejects
+    them (or writes NaN/Infinity without STRICT_JSON), and formats exponents
+    its own way (`1e16` for `1e+16`, `0.00001` for `1e-05`). Both agree for
+    0 and 1e-4 <= |x| < 1e16.
+    """
+    stack = [data]
+    while stack:
+        obj = stack.pop()
+        if isinstance(obj, dict):
+            stack.extend(obj.values())
+        elif isinstance(obj, (list, tuple)):
+            stack.extend(obj)
+        elif isinstance(obj, float) and obj != 0.0 and not 1e-4 <= abs(obj) < 1e16:
+            return True
+    return False
+
+
+def _default(obj):
+    value = _encoder.default(obj)
+    if _needs_stock_encoding(value):
+        raise TypeError('needs the stock encoder')
+    return value
+
+
+class FastJSONRenderer(JSONRenderer):
+    """JSONRenderer backed by orjson, falling back to the stdlib encoder.
+
+    Types orjson doesn't handle natively (datetimes, Decimals, lazy strings,
+    querysets, ...) go through DRF's JSONEncoder.default. Indented output
+    (e.g. `Accept: application/json; indent=4`), payloads with floats orjson
+    formats differently and anything else orjson can't encode (such as
+    integers over 64 bits) use the stock path, so the output is always the
+    stock renderer's, byte for byte, and stored ETags stay valid.
+    """
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        with timed('render'):
+            return self._render(data, accepted_media_type, renderer_context)
+
+    def _render(self, data, accepted_media_type, renderer_context):
+        if orjson is None or data is None:
+            return super().render(data, accepted_media_type, renderer_context)
+
+        if self.get_indent(accepted_media_type, renderer_context or {}) is not None:
+            return super().render(data, accepted_media_type, renderer_context)
+
+        if _needs_stock_encoding(data):
+            return super().render(data, accepted_media_type, renderer_context)
+        try:
+            ret = orjson.dumps(data, default=_default, option=_ORJSON_OPTIONS)
+        except orjson.JSONEncodeError:
+            return super().render(data, accepted_media_type, renderer_context)
+
+        # Same JavaScript-safety escaping as JSONRenderer: U+2028/U+2029.
+        if b'\xe2\x80\xa8' in ret or b'\xe2\x80\xa9' in ret:
+            ret = ret.replace(b'\xe2\x80\xa8', b'\\u2028').replace(b'\xe2\x80\xa9', b'\\u2029')
+        return ret
+
+
+class FastJSONParser(JSONParser):
+    """JSONParser backed by orjson, falling back to the stdlib decoder."""
+
+    renderer_class = FastJSONRenderer
+
+    def parse(self, stream, media_type=None, parser_context=None):
+        if orjson is None:
+            return super().parse(stream, media_type, parser_context)
+
+        parser_context = parser_context or {}
+        encoding = parser_context.get('encoding', settings.DEFAULT_CHARSET)
+        try:
+            raw = stream.read()
+            if codecs.lookup(encoding).name != 'utf-8':
+                raw = raw.decode(encoding)
+            return orjson.loads(raw)
+        except (ValueError, UnicodeDecodeError) as exc:
+            raise ParseError('JSON parse error - %s' % str(exc))
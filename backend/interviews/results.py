@@ -0,0 +1,139 @@
+import hashlib
+import json
+import logging
+
+from django.db import transaction
+
+from .models import Interview, InterviewResultsSnapshot, Question
+from .renderers import FastJSONRenderer
+from .serializers import QuestionSerializer
+
+logger = logging.getLogger(__name__)
+
+# Bump when the shape of the results payload changes; snapshots with another
+# version are rebuilt on first read.
+RESULTS_SNAPSHOT_VERSION = 1
+
+
+def build_results_payload(interview, questions=None):
+    """Build the `results` payload for an interview.
+
+    `questions` should be the interview's questions in order with `answer`
+    joined in; they are loaded in one query when omitted.
+    """
+    if questions is None:
+        questions = list(
+            Question.objects.filter(interview=interview).select_related('answer').order_by('order')
+        )
+    question_data = QuestionSerializer(questions, many=True).data
+
+    # Merge AI review data into questions if available
+    if interview.ai_review and isinstance(interview.ai_review, dict):
+        per_question_map = {}
+        for item in interview.ai_review.get('per_question', []):
+            order = item.get('order')
+            if order is not None:
+                per_question_map[order] = item
+
+        for q in question_data:
+            order = q.get('order')
+            if order in per_question_map:
+                review_item = per_question_map[order]
+                q['ai_answer'] = review_item.get('ai_answer', '')
+                q['strategy_to_improve'] = review_item.get('strategy_to_improve', '')
+                q['improvements_needed'] = review_item.get('improvements_needed', [])
+                q['ai_score'] = review_item.get('score', None)
+
+    answers = [q.answer for q in questions if hasattr(q, 'answer')]
+    total_answered = len(answers)
+    total_questions = len(questions)
+    total_score_value = sum(a.score for a in answers)
+    average_score = (total_score_value / total_questions) if total_questions > 0 else 0
+
+    return {
+        'interview': {
+            'id': interview.id,
+            'job_title': interview.job_title,
+            'difficulty': interview.difficulty,
+            'status': interview.status,
+            'overall_score': interview.overall_score,
+            'ai_final_score': interview.ai_final_score,
+            'ai_review_generated_at': interview.ai_review_generated_at,
+            'ai_review': {
+                'status': interview.ai_review.get('status') if isinstance(interview.ai_review, dict) else None,
+                'current_step': interview.ai_review.get('current_step') if isinstance(interview.ai_review, dict) else None,
+                'per_question': interview.ai_review.get('per_question', []) if isinstance(interview.ai_review, dict) else [],
+                'final': interview.ai_review.get('final') if isinstance(interview.ai_review, dict) else None,
+                'error': interview.ai_review.get('error') if isinstance(interview.ai_review, dict) else None,
+            } if interview.ai_review else None,
+            'created_at': interview.created_at,
+        },
+        'questions': question_data,
+        'summary': {
+            'total_questions': total_questions,
+            'total_answered': total_answered,
+            'average_score': average_score,
+        },
+    }
+
+
+def render_payload(payload) -> bytes:
+    """The JSON bytes the API sends for `payload`."""
+    return FastJSONRenderer().render(payload)
+
+
+def payload_etag(payload, version=RESULTS_SNAPSHOT_VERSION) -> str:
+    """Content hash of a JSON payload, used as a strong ETag."""
+    return encoded_etag(render_payload(payload), version)
+
+
+def encoded_etag(encoded: bytes, version=RESULTS_SNAPSHOT_VERSION) -> str:
+    """ETag of an already rendered payload; same value as payload_etag."""
+    return hashlib.sha256(b'%d:' % version + encoded).hexdigest()
+
+
+def review_is_final(interview) -> bool:
+    return isinstance(interview.ai_review, dict) and interview.ai_review.get('status') == 'completed'
+
+
+def get_results_snapshot(interview):
+    """Return the interview's current snapshot, or None if missing or outdated."""
+    try:
+        snapshot = interview.results_snapshot
+    except InterviewResultsSnapshot.DoesNotExist:
+        return None
+    if snapshot.version != RESULTS_SNAPSHOT_VERSION:
+        return None
+    return snapshot
+
+
+def refresh_results_snapshot(interview):
+    """Build the immutable results snapshot once the AI review has completed.
+
+    Any previous snapshot is replaced. Returns None while the review is still
+    pending, processing or failed.
+    """
+    if not review_is_final(interview):
+        return None
+
+    payload = build_results_payload(interview)
+    encoded = render_payload(payload)
+    with transaction.atomic():
+        InterviewResultsSnapshot.objects.filter(interview=interview).delete()
+        snapshot = InterviewResultsSnapshot.objects.create(
+            interview=interview,
+            version=RESULTS_SNAPSHOT_VERSION,
+            payload=json.loads(encoded),
+            etag=encoded_etag(encoded),
+        )
+    logger.info(f"Results snapshot v{snapshot.version} stored for interview {interview.id}")
+    return snapshot
+
+
+def invalidate_results_snapshot(interview):
+    """Drop the snapshot when answers or the review are about to change."""
+    InterviewResultsSnapshot.objects.filter(interview=interview).delete()
+    # Forget a snapshot cached by select_related on this instance.
+    related = Interview.results_snapshot.related
+    if related.is_cached(interview):
+        related.delete_cached_value(interview)
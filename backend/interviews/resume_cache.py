@@ -0,0 +1,141 @@
+"""Resume extraction/parse cache keyed by the SHA-256 of the uploaded file.
+
+Candidates upload the same resume for every interview and share-link
+attempt, so extracted text and the structured parse are kept in
+ResumeParseCache and reused without touching PyPDF2 or python-docx. Entries
+record the extraction limits and skills taxonomy they were built with and
+are ignored when those change. Once the cached payloads pass
+RESUME_CACHE_MAX_MB the least recently used entries are evicted.
+"""
+import hashlib
+import json
+import logging
+import os
+
+from django.conf import settings
+from django.db import models
+from django.utils import timezone
+
+from .db import run_write
+from .models import ResumeParseCache
+
+logger = logging.getLogger(__name__)
+
+CHUNK_SIZE = 1024 * 1024
+# Truncation for these reasons depends only on the file and the limits, so it is cacheable.
+CACHEABLE_REASONS = (None, 'pages', 'chars')
+# Eviction frees space down to this fraction of the budget, so it doesn't run on every store.
+EVICT_TO = 0.9
+
+
+def file_digest(source) -> tuple[str, int]:
+    """(sha256 hex digest, size) of a file path, byte buffer, uploaded file or file-like object."""
+    if isinstance(source, (bytes, bytearray, memoryview)):
+        return hashlib.sha256(source).hexdigest(), len(source)
+    digest = hashlib.sha256()
+    size = 0
+    if isinstance(source, (str, os.PathLike)):
+        with open(source, 'rb') as f:
+            for chunk in iter(lambda: f.read(CHUNK_SIZE), b''):
+                digest.update(chunk)
+                size += len(chunk)
+    elif hasattr(source, 'chunks'):
+        for chunk in source.chunks(CHUNK_SIZE):
+            digest.update(chunk)
+            size += len(chunk)
+        source.seek(0)
+    else:
+        for chunk in iter(lambda: source.read(CHUNK_SIZE), b''):
+            digest.update(chunk)
+            size += len(chunk)
+        source.seek(0)
+    return digest.hexdigest(), size
+
+
+def extraction_limits() -> list:
+    return [settings.RESUME_MAX_PAGES, settings.RESUME_MAX_CHARS]
+
+
+def _touch(pk):
+    ResumeParseCache.objects.filter(pk=pk).update(hits=models.F('hits') + 1, last_used_at=timezone.now())
+
+
+def lookup(digest: str):
+    """The cache entry for `digest` if it is still valid under the current limits, else None."""
+    entry = ResumeParseCache.objects.filter(content_hash=digest).first()
+    if entry is None:
+        return None
+    extraction = entry.extraction
+    if extraction.get('truncated') and extraction.get('limits') != extraction_limits():
+        return None
+    run_write(_touch, entry.pk)
+    return entry
+
+
+def cached_extraction(entry):
+    if entry is None:
+        return None
+    return {key: value for key, value in entry.extraction.items() if key != 'limits'}
+
+
+def cached_parse(entry, taxonomy: str):
+    """The cached parse_resume output if it was built with `taxonomy`, else None."""
+    if entry is None or not entry.parsed or entry.parsed.get('taxonomy') != taxonomy:
+        return None
+    return entry.parsed['result']
+
+
+def _payload_size(*payloads) -> int:
+    return sum(len(json.dumps(p, separators=(',', ':'))) for p in payloads if p is not None)
+
+
+def _store_extraction(digest, file_size, extraction):
+    ResumeParseCache.objects.update_or_create(
+        content_hash=digest,
+        defaults={
+            'file_size': file_size,
+            'extraction': extraction,
+            'parsed': None,
+            'payload_size': _payload_size(extraction),
+            'last_used_at': timezone.now(),
+        },
+    )
+    evict(settings.RESUME_CACHE_MAX_MB * 1024 * 1024)
+
+
+def store_extraction(digest: str, file_size: int, result: dict):
+    """Cache an extraction result unless it was cut short by a transient limit."""
+    if result is None or result.get('reason') not in CACHEABLE_REASONS:
+        return
+    run_write(_store_extraction, digest, file_size, {**result, 'limits': extraction_limits()})
+
+
+def _store_parse(digest, parsed):
+    entry = ResumeParseCache.objects.filter(content_hash=digest).first()
+    if entry is None:
+        return
+    entry.parsed = parsed
+    entry.payload_size = _payload_size(entry.extraction, parsed)
+    entry.save(update_fields=['parsed', 'payload_size'])
+
+
+def store_parse(digest: str, result: dict, taxonomy: str):
+    """Attach parse_resume output to an existing entry for `digest`."""
+    run_write(_store_parse, digest, {'taxonomy': taxonomy, 'result': result})
+
+
+def evict(max_bytes: int) -> int:
+    """Delete least recently used entries once the total payload passes `max_bytes`."""
+    total = ResumeParseCache.objects.aggregate(total=models.Sum('payload_size'))['total'] or 0
+    if total <= max_bytes:
+        return 0
+    excess = total - int(max_bytes * EVICT_TO)
+    doomed = []
+    for pk, size in ResumeParseCache.objects.order_by('last_used_at').values_list('pk', 'payload_size').iterator():
+        doomed.append(pk)
+        excess -= size
+        if excess <= 0:
+            break
+    ResumeParseCache.objects.filter(pk__in=doomed).delete()
+    logger.info(f"Resume cache evicted {len(doomed)} entries ({total} bytes over a {max_bytes} byte budget)")
+    return len(doomed)
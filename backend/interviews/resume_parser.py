@@ -1,32 +1,20 @@
-import PyPDF2
-import docx
 import logging
 import re
 from typing import Dict, List, Optional
 
+from django.conf import settings
+
+from .extraction import extract_bounded, extract_document, source_name
+from .resume_cache import (
+    cached_extraction, cached_parse, file_digest, lookup, store_extraction, store_parse,
+)
+from .skills import get_skill_matcher
+
 logger = logging.getLogger(__name__)
 
 
 class ResumeParser:
     def __init__(self):
-        self.skills_keywords = [
-            'python', 'java', 'javascript', 'typescript', 'react', 'django', 'flask',
-            'sql', 'nosql', 'mongodb', 'postgresql', 'mysql', 'redis',
-            'docker', 'kubernetes', 'aws', 'azure', 'gcp', 'git',
-            'machine learning', 'ai', 'artificial intelligence', 'deep learning',
-            'nlp', 'natural language processing', 'computer vision',
-            'data science', 'data analysis', 'statistics', 'pandas', 'numpy',
-            'tensorflow', 'pytorch', 'scikit-learn', 'keras',
-            'rest api', 'graphql', 'microservices', 'devops', 'ci/cd',
-            'agile', 'scrum', 'jira', 'confluence', 'slack',
-            'html', 'css', 'sass', 'tailwind', 'bootstrap', 'next.js', 'vue.js',
-            'node.js', 'express', 'spring boot', 'angular', 'django rest framework',
-            'linux', 'unix', 'bash', 'shell scripting', 'powershell',
-            'git', 'github', 'gitlab', 'bitbucket', 'version control',
-            'testing', 'unit testing', 'integration testing', 'jest', 'pytest',
-            'cypress', 'selenium', 'junit', 'mocha', 'chai'
-        ]
-        
         self.experience_patterns = [
             r'(\d+)\+?\s*years?\s*(of\s+)?experience',
             r'experience\s*(?:in|with|as)\s*([^.]+)',
@@ -40,13 +28,25 @@ class ResumeParser:
             r'(?:degree|certificate|diploma)\s*(?:in\s+)?([^.]+)'
         ]
 
-    def parse_resume(self, file_path: str) -> Dict[str, any]:
-        """Parse resume file and extract relevant information"""
-        logger.info(f"Parsing resume: {file_path}")
+    def parse_resume(self, source, name: Optional[str] = None) -> Dict[str, any]:
+        """Parse resume file and extract relevant information
+
+        `source` is a file path, a byte buffer or a binary file object such
+        as a Django upload; `name` overrides the name used to detect the format.
+        """
+        logger.info(f"Parsing resume: {name or source_name(source) or 'upload'}")
         
         try:
+            key, entry = self._cache_entry(source)
+            taxonomy = get_skill_matcher().signature
+            cached = cached_parse(entry, taxonomy)
+            if cached is not None:
+                logger.info(f"Resume parse served from cache: {key[0][:12]}")
+                return cached
+
             # Extract text from file
-            text = self._extract_text(file_path)
+            extracted = self._extract_with_cache(source, name, key, entry)
+            text = extracted['text'] if extracted else None
             
             if not text:
                 logger.error("Failed to extract text from resume")
@@ -61,8 +61,11 @@ class ResumeParser:
                 'skills': skills,
                 'experience': experience,
                 'education': education,
-                'full_text': text[:1000]  # Store first 1000 chars for context
+                'full_text': text[:1000],  # Store first 1000 chars for context
+                'truncated': extracted['truncated'],
             }
+            if key:
+                store_parse(key[0], result, taxonomy)
             
             logger.info(f"Successfully parsed resume. Skills: {skills}, Experience: {len(experience)}, Education: {len(education)}")
             return result
@@ -71,54 +74,57 @@ class ResumeParser:
             logger.error(f"Error parsing resume: {e}")
             return {}
 
-    def _extract_text(self, file_path: str) -> Optional[str]:
-        """Extract text from PDF or DOCX file"""
+    def extract_text(self, source, name: Optional[str] = None) -> Optional[Dict[str, any]]:
+        """Extract text from a PDF or DOCX path, byte buffer or file object within the configured limits.
+
+        Returns the extraction result (`text`, `truncated`, `reason`, `pages`),
+        or None for unsupported formats. Results are cached by file content.
+        """
         try:
-            if file_path.lower().endswith('.pdf'):
-                return self._extract_pdf_text(file_path)
-            elif file_path.lower().endswith('.docx'):
-                return self._extract_docx_text(file_path)
-            else:
-                logger.error(f"Unsupported file format: {file_path}")
-                return None
+            key, entry = self._cache_entry(source)
+            return self._extract_with_cache(source, name, key, entry)
         except Exception as e:
             logger.error(f"Error extracting text: {e}")
             return None
 
-    def _extract_pdf_text(self, file_path: str) -> Optional[str]:
+    def _cache_entry(self, source):
+        """((digest, size), cache entry or None), or (None, None) with the cache disabled."""
+        if not settings.RESUME_CACHE_ENABLED:
+            return None, None
+        key = file_digest(source)
+        return key, lookup(key[0])
+
+    def _extract_with_cache(self, source, name, key, entry):
+        cached = cached_extraction(entry)
+        if cached is not None:
+            return cached
+        result = extract_bounded(source, name)
+        if key:
+            store_extraction(key[0], key[1], result)
+        return result
+
+    def _extract_text(self, source, name: Optional[str] = None) -> Optional[str]:
+        """Extract text from PDF or DOCX file"""
+        result = self.extract_text(source, name)
+        return result['text'] if result else None
+
+    def _extract_pdf_text(self, source) -> Optional[str]:
         """Extract text from PDF file"""
-        try:
-            with open(file_path, 'rb') as file:
-                pdf_reader = PyPDF2.PdfReader(file)
-                text = ""
-                for page in pdf_reader.pages:
-                    text += page.extract_text()
-                return text
-        except Exception as e:
-            logger.error(f"Error extracting PDF text: {e}")
-            return None
+        result = extract_document(source, '.pdf', *self._limits())
+        return result['text'] if result['reason'] != 'error' or result['text'] else None
 
-    def _extract_docx_text(self, file_path: str) -> Optional[str]:
+    def _extract_docx_text(self, source) -> Optional[str]:
         """Extract text from DOCX file"""
-        try:
-            doc = docx.Document(file_path)
-            text = ""
-            for paragraph in doc.paragraphs:
-                text += paragraph.text + "\n"
-            return text
-        except Exception as e:
-            logger.error(f"Error extracting DOCX text: {e}")
-            return None
+        result = extract_document(source, '.docx', *self._limits())
+        return result['text'] if result['reason'] != 'error' or result['text'] else None
+
+    @staticmethod
+    def _limits():
+        return settings.RESUME_MAX_PAGES, settings.RESUME_MAX_CHARS, settings.RESUME_EXTRACT_TIMEOUT
 
     def _extract_skills(self, text: str) -> List[str]:
         """Extract skills from resume text"""
-        text_lower = text.lower()
-        found_skills = []
-        
-        for skill in self.skills_keywords:
-            if skill.lower() in text_lower:
-                found_skills.append(skill)
-        
+        found_skills = get_skill_matcher().find(text)
         logger.info(f"Found skills: {found_skills}")
         return found_skills
 
@@ -0,0 +1,300 @@
+"""Per-share-link and per-creator attempt analytics, maintained incrementally.
+
+Every share-link attempt records the contribution it last added to the
+rollups (`Interview.rollup_contribution`). `sync_attempt_rollup` recomputes
+it from the current row and applies only the difference, so it is safe to
+call after any change and cheap when nothing relevant changed. Archived
+attempts keep their contribution: archiving never touches the rollups.
+"""
+import logging
+
+from django.db import models, transaction
+
+from .db import iter_keyset
+from .models import ArchivedInterview, CreatorRollup, Interview, InterviewShareLink, ShareLinkRollup
+
+logger = logging.getLogger(__name__)
+
+# Final scores are 0-10; bucket i holds scores in [i, i + 1), 10 joins the last.
+SCORE_BUCKETS = 10
+# Upper bounds, in minutes, of the time-to-complete buckets; one overflow bucket follows.
+DURATION_BOUNDS = [5, 10, 15, 20, 30, 45, 60, 90, 120, 180, 240]
+
+
+def _score_bucket(score: float) -> int:
+    return min(SCORE_BUCKETS - 1, max(0, int(score)))
+
+
+def _duration_bucket(seconds: float) -> int:
+    minutes = seconds / 60
+    for i, bound in enumerate(DURATION_BOUNDS):
+        if minutes < bound:
+            return i
+    return len(DURATION_BOUNDS)
+
+
+def contribution(*, share_link_id, status, review, ai_final_score, created_at, completed_at):
+    """What one attempt adds to its rollups, or None if it adds nothing."""
+    if not share_link_id:
+        return None
+    completed = status == 'completed'
+    duration_bucket = None
+    if completed and created_at and completed_at and completed_at >= created_at:
+        duration_bucket = _duration_bucket((completed_at - created_at).total_seconds())
+    reviewed = completed and isinstance(review, dict) and review.get('status') == 'completed'
+    final = (review.get('final') if reviewed else None) or {}
+    score = float(ai_final_score or 0) if reviewed else None
+    return {
+        'share_link': share_link_id,
+        'completed': completed,
+        'duration_bucket': duration_bucket,
+        'reviewed': reviewed,
+        'score': score,
+        'score_bucket': _score_bucket(score) if reviewed else None,
+        'recommendation': (final.get('hire_recommendation') or 'unknown') if reviewed else None,
+    }
+
+
+def interview_contribution(interview):
+    return contribution(
+        share_link_id=interview.share_link_id,
+        status=interview.status,
+        review=interview.ai_review,
+        ai_final_score=interview.ai_final_score,
+        created_at=interview.created_at,
+        completed_at=interview.completed_at,
+    )
+
+
+def archived_contribution(archived):
+    return contribution(
+        share_link_id=archived.share_link_id,
+        status=archived.status,
+        review=(archived.results.get('interview') or {}).get('ai_review'),
+        ai_final_score=archived.ai_final_score,
+        created_at=archived.created_at,
+        completed_at=archived.completed_at,
+    )
+
+
+def _bump(counts: list, index: int, delta: int):
+    if len(counts) <= index:
+        counts.extend([0] * (index + 1 - len(counts)))
+    counts[index] += delta
+
+
+def add_contribution(rollup, c, sign=1):
+    """Add (sign=1) or remove (sign=-1) one attempt's contribution in memory."""
+    rollup.attempts_total += sign
+    if c['completed']:
+        rollup.attempts_completed += sign
+        if c['duration_bucket'] is not None:
+            _bump(rollup.duration_histogram, c['duration_bucket'], sign)
+    if c['reviewed']:
+        rollup.reviewed_total += sign
+        rollup.score_total += sign * c['score']
+        _bump(rollup.score_histogram, c['score_bucket'], sign)
+        recommendation = c['recommendation']
+        rollup.recommendations[recommendation] = rollup.recommendations.get(recommendation, 0) + sign
+        if not rollup.recommendations[recommendation]:
+            del rollup.recommendations[recommendation]
+
+
+def merge_rollup(target, source, sign=1):
+    """Add (or subtract) every counter of `source` into `target` in memory."""
+    for field in ('attempts_total', 'attempts_completed', 'reviewed_total', 'score_total'):
+        setattr(target, field, getattr(target, field) + sign * getattr(source, field))
+    for field in ('score_histogram', 'duration_histogram'):
+        counts = getattr(target, field)
+        for index, count in enumerate(getattr(source, field)):
+            _bump(counts, index, sign * count)
+    for key, count in source.recommendations.items():
+        target.recommendations[key] = target.recommendations.get(key, 0) + sign * count
+        if not target.recommendations[key]:
+            del target.recommendations[key]
+
+
+def _apply(c, sign):
+    # The creator is read from the link at apply time; a deleted link's
+    # totals were already taken out of its creator's rollup.
+    creator = (
+        InterviewShareLink.objects.filter(pk=c['share_link'])
+        .values_list('created_by_clerk_user_id', flat=True)
+        .first()
+    )
+    if creator is None:
+        return
+    rollup, _ = ShareLinkRollup.objects.select_for_update().get_or_create(share_link_id=c['share_link'])
+    add_contribution(rollup, c, sign)
+    rollup.save()
+    if creator:
+        rollup, _ = CreatorRollup.objects.select_for_update().get_or_create(clerk_user_id=creator)
+        add_contribution(rollup, c, sign)
+        rollup.save()
+
+
+def sync_attempt_rollup(interview):
+    """Bring the rollups in line with the interview's current state.
+
+    Call after an attempt is created, completed, reviewed or reset; use
+    `remove_attempt_rollup` before deleting one.
+    """
+    with transaction.atomic():
+        current = Interview.objects.select_for_update().filter(pk=interview.pk).first()
+        if current is None:
+            return None
+        after = interview_contribution(current)
+        before = current.rollup_contribution
+        if before == after:
+            return after
+        if before:
+            _apply(before, -1)
+        if after:
+            _apply(after, 1)
+        Interview.objects.filter(pk=current.pk).update(rollup_contribution=after)
+    interview.rollup_contribution = after
+    return after
+
+
+def remove_attempt_rollup(interview):
+    """Take a deleted attempt's contribution out of its rollups."""
+    with transaction.atomic():
+        before = (
+            Interview.objects.select_for_update()
+            .filter(pk=interview.pk)
+            .values_list('rollup_contribution', flat=True)
+            .first()
+        )
+        if before:
+            _apply(before, -1)
+            Interview.objects.filter(pk=interview.pk).update(rollup_contribution=None)
+
+
+def detach_share_link_rollup(link, creator=None):
+    """Subtract a share link's totals from its creator's rollup.
+
+    Used when the link is deleted or handed to another creator; `creator`
+    is the creator the totals were counted under (defaults to the link's).
+    """
+    creator = link.created_by_clerk_user_id if creator is None else creator
+    link_rollup = ShareLinkRollup.objects.filter(share_link=link).first()
+    if link_rollup is None or not creator:
+        return
+    creator_rollup = CreatorRollup.objects.select_for_update().filter(clerk_user_id=creator).first()
+    if creator_rollup is not None:
+        merge_rollup(creator_rollup, link_rollup, -1)
+        creator_rollup.save()
+
+
+def attach_share_link_rollup(link):
+    """Add a share link's totals to its (new) creator's rollup."""
+    link_rollup = ShareLinkRollup.objects.filter(share_link=link).first()
+    if link_rollup is None or not link.created_by_clerk_user_id:
+        return
+    creator_rollup, _ = CreatorRollup.objects.select_for_update().get_or_create(
+        clerk_user_id=link.created_by_clerk_user_id,
+    )
+    merge_rollup(creator_rollup, link_rollup)
+    creator_rollup.save()
+
+
+def rebuild_rollups(batch_size=500):
+    """Recompute every rollup from the live and archived attempts.
+
+    For backfills and repairs; runs in one transaction, so schedule it
+    outside busy periods. Returns (share-link rollups, creator rollups).
+    """
+    creators = dict(InterviewShareLink.objects.values_list('pk', 'created_by_clerk_user_id'))
+    link_rollups = {}
+    creator_rollups = {}
+
+    def add(c):
+        if c is None or c['share_link'] not in creators:
+            return
+        link_rollup = link_rollups.setdefault(c['share_link'], ShareLinkRollup(share_link_id=c['share_link']))
+        add_contribution(link_rollup, c)
+        creator = creators[c['share_link']]
+        if creator:
+            add_contribution(creator_rollups.setdefault(creator, CreatorRollup(clerk_user_id=creator)), c)
+
+    with transaction.atomic():
+        archived = ArchivedInterview.objects.filter(share_link__isnull=False).defer('detail')
+        for attempt in iter_keyset(archived, batch_size):
+            add(archived_contribution(attempt))
+
+        live = (
+            Interview.objects
+            .filter(models.Q(share_link__isnull=False) | models.Q(rollup_contribution__isnull=False))
+            .defer('job_description', 'resume_text')
+        )
+        changed = []
+        for interview in iter_keyset(live, batch_size):
+            c = interview_contribution(interview) if interview.share_link_id in creators else None
+            add(c)
+            if interview.rollup_contribution != c:
+                interview.rollup_contribution = c
+                changed.append(interview)
+            if len(changed) >= batch_size:
+                Interview.objects.bulk_update(changed, ['rollup_contribution'])
+                changed = []
+        if changed:
+            Interview.objects.bulk_update(changed, ['rollup_contribution'])
+
+        ShareLinkRollup.objects.all().delete()
+        CreatorRollup.objects.all().delete()
+        ShareLinkRollup.objects.bulk_create(link_rollups.values(), batch_size=batch_size)
+        CreatorRollup.objects.bulk_create(creator_rollups.values(), batch_size=batch_size)
+    logger.info(f"Rebuilt {len(link_rollups)} share-link and {len(creator_rollups)} creator rollups")
+    return len(link_rollups), len(creator_rollups)
+
+
+def _median_minutes(histogram):
+    total = sum(histogram)
+    if total <= 0:
+        return None
+    half = total / 2
+    seen = 0
+    lower = 0
+    for index, count in enumerate(histogram):
+        upper = DURATION_BOUNDS[index] if index < len(DURATION_BOUNDS) else None
+        if count and seen + count >= half:
+            if upper is None:
+                return lower
+            # Interpolate linearly within the bucket.
+            return round(lower + (upper - lower) * (half - seen) / count, 1)
+        seen += count
+        if upper is not None:
+            lower = upper
+    return lower
+
+
+def rollup_payload(rollup):
+    """Analytics response body for a share-link or creator rollup (None = no attempts yet)."""
+    if rollup is None:
+        rollup = ShareLinkRollup()
+    completed = rollup.attempts_completed
+    score_histogram = list(rollup.score_histogram) + [0] * (SCORE_BUCKETS - len(rollup.score_histogram))
+    duration_histogram = list(rollup.duration_histogram) + [0] * (len(DURATION_BOUNDS) + 1 - len(rollup.duration_histogram))
+    duration_labels = []
+    lower = 0
+    for bound in DURATION_BOUNDS:
+        duration_labels.append(f'{lower}-{bound}')
+        lower = bound
+    duration_labels.append(f'{lower}+')
+    return {
+        'attempts_total': rollup.attempts_total,
+        'attempts_completed': completed,
+        'attempts_pending': rollup.attempts_total - completed,
+        'completion_rate': round(completed / rollup.attempts_total, 4) if rollup.attempts_total else 0,
+        'reviewed': rollup.reviewed_total,
+        'average_score': round(rollup.score_total / rollup.reviewed_total, 2) if rollup.reviewed_total else None,
+        'score_histogram': [
+            {'range': f'{i}-{i + 1}', 'count': count} for i, count in enumerate(score_histogram)
+        ],
+        'hire_recommendations': dict(rollup.recommendations),
+        'median_minutes_to_complete': _median_minutes(duration_histogram),
+        'time_to_complete_histogram': [
+            {'minutes': label, 'count': count} for label, count in zip(duration_labels, duration_histogram)
+        ],
+        'updated_at': rollup.updated_at if rollup.pk else None,
+    }
@@ -1,18 +1,57 @@
 from rest_framework import serializers
-from .models import Interview, InterviewShareLink, Question, Answer
+from .models import ArchivedInterview, Interview, InterviewShareLink, Question, Answer
+from .timing import timed
 import logging
 
 logger = logging.getLogger(__name__)
 
 
-class AnswerSerializer(serializers.ModelSerializer):
+def _prefetched_questions(obj):
+    cache = getattr(obj, '_prefetched_objects_cache', None) or {}
+    if 'questions' in cache:
+        return obj.questions.all()
+    return None
+
+
+def _total_questions(obj):
+    # InterviewViewSet.get_queryset either annotates the counts (list) or
+    # prefetches questions with their answers (detail actions); fall back to a
+    # query for instances loaded elsewhere (e.g. after complete/reattempt).
+    count = getattr(obj, 'total_questions_count', None)
+    if count is not None:
+        return count
+    questions = _prefetched_questions(obj)
+    if questions is not None:
+        return len(questions)
+    return obj.questions.count()
+
+
+def _answered_questions(obj):
+    count = getattr(obj, 'answered_questions_count', None)
+    if count is not None:
+        return count
+    questions = _prefetched_questions(obj)
+    if questions is not None:
+        return sum(1 for q in questions if hasattr(q, 'answer'))
+    return Answer.objects.filter(question__interview=obj).count()
+
+
+class TimedModelSerializer(serializers.ModelSerializer):
+    """Counts output building as `serialize` time in the request's Server-Timing."""
+
+    def to_representation(self, instance):
+        with timed('serialize'):
+            return super().to_representation(instance)
+
+
+class AnswerSerializer(TimedModelSerializer):
     class Meta:
         model = Answer
         fields = ['id', 'answer_text', 'feedback', 'score', 'created_at', 'updated_at']
         read_only_fields = ['id', 'created_at', 'updated_at']
 
 
-class QuestionSerializer(serializers.ModelSerializer):
+class QuestionSerializer(TimedModelSerializer):
     answer = AnswerSerializer(read_only=True)
 
     class Meta:
@@ -21,11 +60,14 @@ class QuestionSerializer(serializers.ModelSerializer):
         read_only_fields = ['id', 'created_at']
 
 
-class InterviewSerializer(serializers.ModelSerializer):
+class InterviewSerializer(TimedModelSerializer):
     questions = QuestionSerializer(many=True, read_only=True)
     skills_list = serializers.SerializerMethodField()
     total_questions = serializers.SerializerMethodField()
     answered_questions = serializers.SerializerMethodField()
+    # Compressed columns map to BinaryField; expose them as their logical types.
+    job_description = serializers.CharField(required=False, allow_blank=True)
+    ai_review = serializers.JSONField(required=False, allow_null=True)
 
     class Meta:
         model = Interview
@@ -43,14 +85,14 @@ class InterviewSerializer(serializers.ModelSerializer):
         return []
 
     def get_total_questions(self, obj):
-        return obj.questions.count()
+        return _total_questions(obj)
 
     def get_answered_questions(self, obj):
-        return Answer.objects.filter(question__interview=obj).count()
+        return _answered_questions(obj)
 
 
-class InterviewListSerializer(serializers.ModelSerializer):
-    """Lighter serializer for list views (no nested questions)."""
+class InterviewListSerializer(TimedModelSerializer):
+    """Lighter serializer for list views (no nested questions or large documents)."""
     skills_list = serializers.SerializerMethodField()
     total_questions = serializers.SerializerMethodField()
     answered_questions = serializers.SerializerMethodField()
@@ -60,7 +102,7 @@ class InterviewListSerializer(serializers.ModelSerializer):
         fields = [
             'id', 'clerk_user_id', 'job_title', 'skills', 'skills_list',
             'difficulty', 'status', 'overall_score', 'total_questions',
-            'answered_questions', 'ai_review', 'ai_final_score', 'ai_review_generated_at',
+            'answered_questions', 'ai_final_score', 'ai_review_generated_at',
             'created_at', 'updated_at',
         ]
         read_only_fields = ['id', 'created_at', 'updated_at']
@@ -71,19 +113,21 @@ class InterviewListSerializer(serializers.ModelSerializer):
         return []
 
     def get_total_questions(self, obj):
-        return obj.questions.count()
+        return _total_questions(obj)
 
     def get_answered_questions(self, obj):
-        return Answer.objects.filter(question__interview=obj).count()
+        return _answered_questions(obj)
 
 
-class CreateInterviewSerializer(serializers.ModelSerializer):
+class CreateInterviewSerializer(TimedModelSerializer):
+    job_description = serializers.CharField(required=False, allow_blank=True)
+    resume_text = serializers.CharField(required=False, allow_blank=True)
+
     class Meta:
         model = Interview
         fields = ['id', 'job_title', 'job_description', 'skills', 'difficulty', 'resume_text', 'clerk_user_id']
         extra_kwargs = {
             'job_title': {'required': False, 'allow_blank': True},
-            'job_description': {'required': False, 'allow_blank': True},
             'skills': {'required': False, 'allow_blank': True},
             'clerk_user_id': {'required': False, 'allow_blank': True},
         }
@@ -96,7 +140,7 @@ class CreateInterviewSerializer(serializers.ModelSerializer):
         return interview
 
 
-class InterviewShareLinkSerializer(serializers.ModelSerializer):
+class InterviewShareLinkSerializer(TimedModelSerializer):
     is_expired = serializers.SerializerMethodField()
     attempts_total = serializers.SerializerMethodField()
     attempts_completed = serializers.SerializerMethodField()
@@ -117,21 +161,37 @@ class InterviewShareLinkSerializer(serializers.ModelSerializer):
     def get_is_expired(self, obj):
         return bool(getattr(obj, 'is_expired', False))
 
+    # ShareLinkViewSet annotates attempts_total_count/attempts_completed_count;
+    # the per-link queries below only run for instances loaded elsewhere.
+    # Archived attempts are always completed and count towards both.
+
     def get_attempts_total(self, obj):
-        return getattr(obj, 'interview_attempts', None).count() if hasattr(obj, 'interview_attempts') else 0
+        count = getattr(obj, 'attempts_total_count', None)
+        if count is not None:
+            return count
+        if not hasattr(obj, 'interview_attempts'):
+            return 0
+        return obj.interview_attempts.count() + obj.archived_attempts.count()
 
     def get_attempts_completed(self, obj):
+        count = getattr(obj, 'attempts_completed_count', None)
+        if count is not None:
+            return count
         if not hasattr(obj, 'interview_attempts'):
             return 0
-        return obj.interview_attempts.filter(status='completed').count()
+        return obj.interview_attempts.filter(status='completed').count() + obj.archived_attempts.count()
 
     def get_attempts_pending(self, obj):
+        total = getattr(obj, 'attempts_total_count', None)
+        completed = getattr(obj, 'attempts_completed_count', None)
+        if total is not None and completed is not None:
+            return total - completed
         if not hasattr(obj, 'interview_attempts'):
             return 0
         return obj.interview_attempts.exclude(status='completed').count()
 
 
-class InterviewAttemptSerializer(serializers.ModelSerializer):
+class InterviewAttemptSerializer(TimedModelSerializer):
     class Meta:
         model = Interview
         fields = [
@@ -143,7 +203,26 @@ class InterviewAttemptSerializer(serializers.ModelSerializer):
         read_only_fields = fields
 
 
-class CreateInterviewShareLinkSerializer(serializers.ModelSerializer):
+class ArchivedInterviewSerializer(TimedModelSerializer):
+    """Summary row for an archived interview, keyed by its original id."""
+    id = serializers.IntegerField(source='interview_id', read_only=True)
+    archived = serializers.SerializerMethodField()
+
+    class Meta:
+        model = ArchivedInterview
+        fields = [
+            'id', 'clerk_user_id',
+            'job_title', 'difficulty', 'status',
+            'overall_score', 'ai_final_score', 'ai_review_generated_at',
+            'created_at', 'updated_at', 'archived_at', 'archived',
+        ]
+        read_only_fields = fields
+
+    def get_archived(self, obj):
+        return True
+
+
+class CreateInterviewShareLinkSerializer(TimedModelSerializer):
     class Meta:
         model = InterviewShareLink
         fields = [
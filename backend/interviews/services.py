@@ -6,22 +6,38 @@ from datetime import datetime
 import re
 import ast
 import concurrent.futures
+from django.conf import settings
+from .db import run_write
 from .models import Question
-from .resume_parser import ResumeParser
+from .question_bank import add_to_bank, assemble_from_bank
+from .timing import timed
 
 logger = logging.getLogger(__name__)
 
 
 class AIQuestionGenerator:
+    # Optional object with an acquire() method, called before every upstream
+    # request; set by `manage.py reevaluate` to enforce a global rate limit.
+    rate_limiter = None
+
     def __init__(self):
         self.api_url = os.getenv('AI_API_URL', 'https://llama-8b.lokeshhlohar80.workers.dev')
         self.api_path = os.getenv('AI_API_PATH', '/chat')
         if not self.api_path.startswith('/'):
             self.api_path = f'/{self.api_path}'
         self.chat_endpoint = f'{self.api_url}{self.api_path}'
+        from .resume_parser import ResumeParser
+
         self.resume_parser = ResumeParser()
         logger.info(f"AIQuestionGenerator initialized with API URL: {self.chat_endpoint}")
 
+    def _post(self, url, **kwargs):
+        """POST to the AI worker; every upstream call goes through here."""
+        if self.rate_limiter is not None:
+            self.rate_limiter.acquire()
+        with timed('ai'):
+            return requests.post(url, **kwargs)
+
     def _extract_json_array_text(self, text: str) -> str | None:
         if not text:
             return None
@@ -132,7 +148,14 @@ class AIQuestionGenerator:
         
         # Check if resume text is provided
         resume_text = getattr(interview, 'resume_text', None)
-        
+
+        # Resume-based questions are personal; everything else can come from the bank.
+        use_bank = not resume_text and settings.QUESTION_BANK_ENABLED
+        if use_bank:
+            banked = self._questions_from_bank(interview)
+            if banked:
+                return banked
+
         # Build prompt with or without resume text
         if resume_text:
             prompt = self._build_prompt_with_resume_text(interview, resume_text)
@@ -157,7 +180,7 @@ class AIQuestionGenerator:
         
         try:
             logger.info("Sending request to AI endpoint...")
-            response = requests.post(self.chat_endpoint, json=payload, timeout=60)
+            response = self._post(self.chat_endpoint, json=payload, timeout=60)
             
             logger.info(f"Response status code: {response.status_code}")
             
@@ -216,18 +239,24 @@ class AIQuestionGenerator:
                             logger.warning(f"Skipping invalid question data at index {idx}: {q_data}")
                             continue
 
-                        question = Question.objects.create(
+                        questions.append(Question(
                             interview=interview,
                             question_text=str(q_data['question_text']),
                             question_type=str(q_data.get('question_type') or 'technical'),
                             order=len(questions) + 1,
-                        )
-                        questions.append(question)
+                        ))
 
                     if not questions:
                         last_error = Exception("Parsed JSON array but no valid questions were found")
                         continue
 
+                    questions = run_write(Question.objects.bulk_create, questions)
+                    if use_bank:
+                        try:
+                            run_write(add_to_bank, interview, questions)
+                        except Exception as e:
+                            logger.warning(f"Could not add questions to the question bank: {e}")
+
                     logger.info(f"Successfully created {len(questions)} questions")
                     logger.info("=" * 80)
                     logger.info("AI question generation completed successfully")
@@ -258,6 +287,29 @@ class AIQuestionGenerator:
             logger.error("=" * 80)
             raise
 
+    def _questions_from_bank(self, interview):
+        """Create the interview's questions from the local bank; None to fall back to the LLM."""
+        try:
+            picked = assemble_from_bank(interview)
+        except Exception as e:
+            logger.warning(f"Question bank lookup failed, falling back to the LLM: {e}")
+            return None
+        if not picked:
+            return None
+
+        questions = [
+            Question(
+                interview=interview,
+                question_text=q['question_text'],
+                question_type=q['question_type'],
+                order=order,
+            )
+            for order, q in enumerate(picked, start=1)
+        ]
+        questions = run_write(Question.objects.bulk_create, questions)
+        logger.info(f"Served {len(questions)} questions for interview {interview.id} from the question bank")
+        return questions
+
     def _build_prompt_with_resume_text(self, interview, resume_text):
         """Build prompt with resume text for more targeted questions"""
         prompt = f"""Generate 15 interview questions for a {interview.job_title} position.
@@ -382,7 +434,7 @@ Return ONLY valid JSON object (no extra text):
 
         logger.info(f"Evaluating answer via AI endpoint: {self.chat_endpoint}")
 
-        response = requests.post(self.chat_endpoint, json=payload, timeout=60)
+        response = self._post(self.chat_endpoint, json=payload, timeout=60)
         if response.status_code != 200:
             logger.error(f"AI endpoint returned error status during evaluation: {response.status_code}")
             logger.error(f"Response body: {response.text}")
@@ -512,7 +564,7 @@ Return ONLY valid JSON object (no extra text):
                 'max_tokens': 2048,
                 'temperature': 0.7
             }
-            resp = requests.post(self.chat_endpoint.replace('/chat', '/complete'), json=payload, timeout=timeout)
+            resp = self._post(self.chat_endpoint.replace('/chat', '/complete'), json=payload, timeout=timeout)
             if resp.status_code != 200:
                 raise Exception(f"AI endpoint error: {resp.status_code}")
             out = resp.text
@@ -546,7 +598,7 @@ Return ONLY valid JSON object (no extra text):
                 '_generated_at': datetime.utcnow().isoformat() + 'Z',
             }
             interview.ai_review = data
-            interview.save(update_fields=['ai_review'])
+            run_write(interview.save, update_fields=['ai_review'])
             return data
 
         def _evaluate_one(q: Question):
@@ -637,7 +689,7 @@ Return ONLY valid JSON object (no extra text):
                         '_generated_at': datetime.utcnow().isoformat() + 'Z'
                     }
                     interview.ai_final_score = float(interim_score or 0)
-                    interview.save(update_fields=['ai_review', 'ai_final_score'])
+                    run_write(interview.save, update_fields=['ai_review', 'ai_final_score'])
 
         per_question = sorted(per_question, key=lambda x: int(x.get('order') or 0))
 
@@ -713,5 +765,5 @@ Return ONLY valid JSON object (no extra text):
         }
         # Update one last time
         interview.ai_review = data
-        interview.save(update_fields=['ai_review'])
+        run_write(interview.save, update_fields=['ai_review'])
         return data
@@ -0,0 +1,134 @@
+"""Two-tier cache for resolving public share-link tokens.
+
+Candidates hit `ShareLinkViewSet.public` and `start_from_link` by token, often
+thousands of times during a campus drive. Resolution goes process memory ->
+Django cache backend -> database. Entries hold the public link config plus
+the expiry timestamp, so expiry is still enforced on every request.
+
+Writes (update, regenerate, destroy) invalidate both tiers in this process
+and the shared backend once their transaction commits, so a concurrent read
+can't re-cache the row being replaced. Other processes may serve their memory copy for up to
+SHARE_LINK_MEMORY_CACHE_TTL seconds, so keep that tier short. Without a shared
+backend (no REDIS_URL, so LocMemCache) the backend tier is per process as
+well and its TTL is capped at the memory tier's.
+"""
+import threading
+import time
+
+from django.conf import settings
+from django.core.cache import DEFAULT_CACHE_ALIAS, cache, caches
+from django.core.cache.backends.locmem import LocMemCache
+from django.core.exceptions import ValidationError
+from django.db import transaction
+from django.utils import timezone
+
+from .models import InterviewShareLink
+from .results import payload_etag
+
+_MISSING = {'missing': True}
+
+_memory: dict[str, tuple[float, dict]] = {}
+_memory_lock = threading.Lock()
+# Bound the memory tier against token scans; the backend tier still has everything.
+_MEMORY_MAX_ENTRIES = 10000
+
+
+def _memory_ttl() -> int:
+    return getattr(settings, 'SHARE_LINK_MEMORY_CACHE_TTL', 10)
+
+
+def _backend_is_shared() -> bool:
+    return not isinstance(caches[DEFAULT_CACHE_ALIAS], LocMemCache)
+
+
+def _backend_ttl() -> int:
+    ttl = getattr(settings, 'SHARE_LINK_CACHE_TTL', 300)
+    if not _backend_is_shared():
+        # Invalidation can't reach other processes' copies.
+        ttl = min(ttl, _memory_ttl())
+    return ttl
+
+
+def _key(token) -> str:
+    return f'share-link:{token}'
+
+
+def _build_entry(link: InterviewShareLink) -> dict:
+    public = {
+        'id': link.id,
+        'token': str(link.token),
+        'role': link.role,
+        'job_description': link.job_description,
+        'experience': link.experience,
+        'difficulty': link.difficulty,
+        'expires_at': link.expires_at,
+        'is_active': link.is_active,
+        'is_expired': False,
+    }
+    return {
+        'public': public,
+        'etag': payload_etag(public),
+    }
+
+
+def resolve_share_link(token) -> dict | None:
+    """Return the cached entry for `token`, or None if no such link exists.
+
+    The entry is `{'public': <response payload>, 'etag': <str>}`; callers
+    check `is_active` and expiry with `share_link_state`.
+    """
+    key = _key(token)
+    now = time.monotonic()
+
+    with _memory_lock:
+        hit = _memory.get(key)
+    if hit is not None and hit[0] > now:
+        entry = hit[1]
+    else:
+        entry = cache.get(key)
+        if entry is None:
+            try:
+                link = InterviewShareLink.objects.get(token=token)
+            except (InterviewShareLink.DoesNotExist, ValidationError):
+                entry = _MISSING
+            else:
+                entry = _build_entry(link)
+            cache.set(key, entry, _backend_ttl())
+        with _memory_lock:
+            if len(_memory) >= _MEMORY_MAX_ENTRIES:
+                _memory.clear()
+            _memory[key] = (now + _memory_ttl(), entry)
+
+    if entry is _MISSING or entry.get('missing'):
+        return None
+    return entry
+
+
+def share_link_state(entry: dict) -> str:
+    """'active', 'disabled' or 'expired' for a resolved entry."""
+    public = entry['public']
+    if not public['is_active']:
+        return 'disabled'
+    expires_at = public['expires_at']
+    if expires_at and timezone.now() >= expires_at:
+        return 'expired'
+    return 'active'
+
+
+def seconds_until_expiry(entry: dict) -> int | None:
+    expires_at = entry['public']['expires_at']
+    if not expires_at:
+        return None
+    return max(0, int((expires_at - timezone.now()).total_seconds()))
+
+
+def _invalidate(token):
+    key = _key(token)
+    with _memory_lock:
+        _memory.pop(key, None)
+    cache.delete(key)
+
+
+def invalidate_share_link(token):
+    """Drop `token` from both tiers after the current transaction commits (at once outside one)."""
+    transaction.on_commit(lambda: _invalidate(token))
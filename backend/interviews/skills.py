@@ -0,0 +1,157 @@
+"""Skill extraction with an Aho-Corasick automaton over a skills taxonomy.
+
+The taxonomy is a JSON list of {"name": ..., "aliases": [...]} entries
+(SKILLS_TAXONOMY_PATH, the bundled data/skills_taxonomy.json by default).
+Every name and alias is compiled into one automaton per process, so a scan
+is linear in the text length however large the taxonomy is. Matches count
+only on word boundaries: `ai` does not match inside `maintain`.
+A name or alias may belong to one skill only; SkillMatcher raises
+ValueError for a taxonomy that maps the same form to two skills.
+"""
+import hashlib
+import json
+import logging
+import threading
+import time
+from collections import deque
+from pathlib import Path
+
+from django.conf import settings
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_TAXONOMY_PATH = Path(__file__).resolve().parent / 'data' / 'skills_taxonomy.json'
+
+
+def normalize(text: str) -> str:
+    """Lowercase and collapse whitespace, so `Machine\\nLearning` matches `machine learning`."""
+    return ' '.join((text or '').lower().split())
+
+
+def _is_word_char(ch: str) -> bool:
+    return ch.isalnum() or ch == '_'
+
+
+class SkillMatcher:
+    """Aho-Corasick matcher mapping every name/alias to its canonical skill name."""
+
+    def __init__(self, taxonomy: list[dict]):
+        # Identifies the taxonomy, e.g. to tell whether a cached parse is stale.
+        self.signature = hashlib.sha256(json.dumps(taxonomy, sort_keys=True).encode('utf-8')).hexdigest()[:16]
+        self.skills: list[str] = []
+        # Trie nodes: transitions, failure link, and (pattern length, skill id)
+        # outputs including those inherited through failure links.
+        self._goto: list[dict[str, int]] = [{}]
+        self._fail: list[int] = [0]
+        self._out: list[list[tuple[int, int]]] = [[]]
+
+        # Each surface form belongs to exactly one skill, or one mention would
+        # be reported as several skills.
+        owners: dict[str, int] = {}
+        conflicts = []
+        for entry in taxonomy:
+            name = normalize(entry['name'])
+            if not name:
+                continue
+            skill_id = len(self.skills)
+            self.skills.append(name)
+            for pattern in [name, *entry.get('aliases', ())]:
+                pattern = normalize(pattern)
+                if not pattern:
+                    continue
+                owner = owners.get(pattern)
+                if owner is None:
+                    owners[pattern] = skill_id
+                    self._add(pattern, skill_id)
+                elif owner != skill_id:
+                    conflicts.append(f'{pattern!r} ({self.skills[owner]}, {name})')
+        if conflicts:
+            raise ValueError(f"Skills taxonomy maps a name or alias to more than one skill: {'; '.join(conflicts)}")
+        self.patterns = len(owners)
+        self._build_failure_links()
+
+    def _add(self, pattern: str, skill_id: int):
+        node = 0
+        for ch in pattern:
+            nxt = self._goto[node].get(ch)
+            if nxt is None:
+                nxt = len(self._goto)
+                self._goto[node][ch] = nxt
+                self._goto.append({})
+                self._fail.append(0)
+                self._out.append([])
+            node = nxt
+        self._out[node].append((len(pattern), skill_id))
+
+    def _build_failure_links(self):
+        queue = deque(self._goto[0].values())
+        while queue:
+            node = queue.popleft()
+            for ch, child in self._goto[node].items():
+                queue.append(child)
+                fail = self._fail[node]
+                while fail and ch not in self._goto[fail]:
+                    fail = self._fail[fail]
+                target = self._goto[fail].get(ch, 0)
+                self._fail[child] = target if target != child else 0
+                self._out[child].extend(self._out[self._fail[child]])
+
+    @staticmethod
+    def _starts_word(text: str, start: int) -> bool:
+        # `js` in `react.js` is not a word of its own; `ml` in `ai/ml` is.
+        prev = text[start - 1]
+        if prev == '.':
+            return start < 2 or not _is_word_char(text[start - 2])
+        return not _is_word_char(prev)
+
+    def find(self, text: str) -> list[str]:
+        """Canonical names of the skills in `text`, in order of first mention."""
+        text = normalize(text)
+        goto, fail, out = self._goto, self._fail, self._out
+        found: dict[int, None] = {}
+        node = 0
+        last = len(text) - 1
+        for i, ch in enumerate(text):
+            while node and ch not in goto[node]:
+                node = fail[node]
+            node = goto[node].get(ch, 0)
+            if not out[node]:
+                continue
+            # Only a letter/digit edge needs a boundary: `c++` and `.net` end or start in punctuation.
+            if i < last and _is_word_char(ch) and _is_word_char(text[i + 1]):
+                continue
+            for length, skill_id in out[node]:
+                start = i - length + 1
+                if skill_id in found:
+                    continue
+                if start > 0 and _is_word_char(text[start]) and not self._starts_word(text, start):
+                    continue
+                found[skill_id] = None
+        return [self.skills[skill_id] for skill_id in found]
+
+
+def load_taxonomy(path) -> list[dict]:
+    with open(path, encoding='utf-8') as f:
+        data = json.load(f)
+    return data['skills'] if isinstance(data, dict) else data
+
+
+_matchers: dict[str, SkillMatcher] = {}
+_matchers_lock = threading.Lock()
+
+
+def get_skill_matcher(path=None) -> SkillMatcher:
+    """The process-wide matcher for `path` (default SKILLS_TAXONOMY_PATH), built on first use."""
+    path = str(path or settings.SKILLS_TAXONOMY_PATH or DEFAULT_TAXONOMY_PATH)
+    matcher = _matchers.get(path)
+    if matcher is None:
+        with _matchers_lock:
+            matcher = _matchers.get(path)
+            if matcher is None:
+                start = time.perf_counter()
+                matcher = _matchers[path] = SkillMatcher(load_taxonomy(path))
+                logger.info(
+                    f"Skill matcher built: {len(matcher.skills)} skills, {matcher.patterns} patterns "
+                    f"in {(time.perf_counter() - start) * 1000:.0f}ms"
+                )
+    return matcher
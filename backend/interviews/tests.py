@@ -0,0 +1,522 @@
+import json
+import os
+import subprocess
+import sys
+import threading
+import time
+import uuid
+from datetime import date, datetime, timedelta, timezone as dt_timezone
+from decimal import Decimal
+from pathlib import Path
+from unittest import mock
+
+from django.conf import settings
+from django.core.cache import cache
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.db import connection, transaction
+from django.test import SimpleTestCase, TestCase, override_settings
+from django.utils import timezone
+from django.utils.translation import gettext_lazy
+from rest_framework.renderers import JSONRenderer
+from rest_framework.settings import api_settings
+
+from interviews.archive import archive_batch, archive_batch_queryset
+from interviews import extraction
+from interviews.extraction import ExtractionPool, PoolBusy, extract_bounded
+from interviews.management.commands.benchmark_cold_start import LAZY_MODULES, run_child
+from interviews.management.commands.benchmark_resume_parser import build_pdf
+from interviews.management.commands.check_query_plans import full_scan_plan, query_shapes
+from interviews.models import Answer, ArchivedInterview, Interview, InterviewResultsSnapshot, InterviewShareLink, Question
+from interviews.reevaluation import reevaluate_interview
+from interviews.renderers import FastJSONRenderer
+from interviews.results import encoded_etag
+from interviews.serializers import InterviewSerializer
+from interviews.share_link_cache import _backend_ttl
+from interviews.skills import DEFAULT_TAXONOMY_PATH, SkillMatcher, load_taxonomy
+
+
+PAGE_SIZE = api_settings.PAGE_SIZE
+
+
+def make_interview(n_questions=4, answered=2, **fields):
+    fields.setdefault('clerk_user_id', 'user-1')
+    fields.setdefault('job_title', 'Backend engineer')
+    interview = Interview.objects.create(**fields)
+    for order in range(1, n_questions + 1):
+        question = Question.objects.create(interview=interview, question_text=f'Question {order}', order=order)
+        if order <= answered:
+            Answer.objects.create(question=question, answer_text=f'Answer {order}', score=6)
+    return interview
+
+
+# Background writes normally go through the SQLite writer thread, which can't
+# see rows inside a test transaction.
+@override_settings(SQLITE_SERIALIZE_BACKGROUND_WRITES=False)
+class InterviewListQueryCountTests(TestCase):
+    """Listing interviews costs the same number of queries for any number of rows."""
+
+    def assert_list_queries(self, url, sizes, queries):
+        created = 0
+        for size in sizes:
+            while created < size:
+                make_interview()
+                created += 1
+            with self.assertNumQueries(queries):
+                response = self.client.get(url)
+            self.assertEqual(response.status_code, 200)
+
+    def test_list(self):
+        self.assert_list_queries('/api/interviews/interviews/?clerk_user_id=user-1', [2, 25], 1)
+
+    def test_list_paginated(self):
+        self.assert_list_queries('/api/interviews/interviews/?clerk_user_id=user-1&page_size=50', [2, 25], 1)
+
+    def test_list_is_paged_by_default(self):
+        Interview.objects.bulk_create(
+            [Interview(clerk_user_id='user-1', job_title='Backend engineer') for _ in range(PAGE_SIZE + 5)]
+        )
+        body = self.client.get('/api/interviews/interviews/?clerk_user_id=user-1').json()
+        self.assertEqual(len(body['results']), PAGE_SIZE)
+        self.assertEqual(len(self.client.get(body['next']).json()['results']), 5)
+
+    def test_list_counts(self):
+        make_interview(n_questions=5, answered=3)
+        make_interview(n_questions=0, answered=0)
+        rows = self.client.get('/api/interviews/interviews/?clerk_user_id=user-1').json()['results']
+        self.assertEqual(
+            sorted((row['total_questions'], row['answered_questions']) for row in rows),
+            [(0, 0), (5, 3)],
+        )
+
+
+@override_settings(SQLITE_SERIALIZE_BACKGROUND_WRITES=False)
+class ShareLinkListQueryCountTests(TestCase):
+    def make_link(self, attempts=3, completed=1):
+        link = InterviewShareLink.objects.create(created_by_clerk_user_id='creator', role='Backend engineer')
+        for i in range(attempts):
+            make_interview(share_link=link, status='completed' if i < completed else 'in_progress')
+        return link
+
+    def test_list(self):
+        url = '/api/interviews/share-links/?clerk_user_id=creator'
+        for size in (2, 15):
+            while InterviewShareLink.objects.count() < size:
+                self.make_link()
+            with self.assertNumQueries(1):
+                response = self.client.get(url)
+            self.assertEqual(len(response.json()['results']), size)
+
+    def test_list_counts(self):
+        self.make_link(attempts=4, completed=3)
+        self.make_link(attempts=0, completed=0)
+        rows = self.client.get('/api/interviews/share-links/?clerk_user_id=creator').json()['results']
+        self.assertEqual(
+            sorted((row['attempts_total'], row['attempts_completed'], row['attempts_pending']) for row in rows),
+            [(0, 0, 0), (4, 3, 1)],
+        )
+
+
+class QuestionPaginationTests(TestCase):
+    def page_through(self, url):
+        seen = []
+        while url:
+            body = self.client.get(url).json()
+            seen.extend(row['id'] for row in body['results'])
+            url = body['next']
+            self.assertLess(len(seen), 10000, 'cursor stopped advancing')
+        return seen
+
+    def test_unscoped_listing_pages_past_repeated_orders(self):
+        # Every interview has a question with order=1; more ties than offset_cutoff.
+        questions = [
+            Question(interview=interview, question_text='Question 1', order=1)
+            for interview in Interview.objects.bulk_create(
+                [Interview(clerk_user_id='user-1', job_title='Backend engineer') for _ in range(1200)]
+            )
+        ]
+        Question.objects.bulk_create(questions)
+        seen = self.page_through('/api/interviews/questions/?page_size=100')
+        self.assertEqual(len(seen), 1200)
+        self.assertEqual(seen, sorted(set(seen)))
+
+    def test_page_loads_answers_with_questions(self):
+        for size in (3, 30):
+            interview = make_interview(n_questions=size, answered=size)
+            with self.assertNumQueries(1):
+                body = self.client.get(f'/api/interviews/questions/?interview_id={interview.pk}&page_size=100').json()
+            self.assertEqual(len(body['results']), size)
+            self.assertTrue(all(row['answer'] for row in body['results']))
+
+    def test_interview_listing_follows_question_order(self):
+        interview = make_interview(n_questions=5, answered=0)
+        Question.objects.filter(interview=interview, order=1).update(order=9)
+        seen = self.page_through(f'/api/interviews/questions/?interview_id={interview.pk}&page_size=2')
+        orders = dict(Question.objects.filter(interview=interview).values_list('id', 'order'))
+        self.assertEqual([orders[pk] for pk in seen], [2, 3, 4, 5, 9])
+
+
+@override_settings(SQLITE_SERIALIZE_BACKGROUND_WRITES=False)
+class InterviewDetailQueryCountTests(TestCase):
+    """Detail actions load each interview's questions and answers in one prefetch."""
+
+    sizes = (3, 12)
+
+    def make(self, n_questions, **fields):
+        interview = make_interview(n_questions=n_questions, answered=n_questions // 2, **fields)
+        interview.sync_question_cursor()
+        return interview
+
+    def assert_action_queries(self, action, queries, **fields):
+        for size in self.sizes:
+            interview = self.make(size, **fields)
+            with self.assertNumQueries(queries):
+                response = self.client.get(f'/api/interviews/interviews/{interview.pk}/{action}')
+            self.assertEqual(response.status_code, 200)
+
+    def test_retrieve(self):
+        self.assert_action_queries('', 2)
+
+    def test_questions(self):
+        self.assert_action_queries('questions/', 2)
+
+    def test_next_question(self):
+        self.assert_action_queries('next_question/', 2)
+
+    def test_next_question_done(self):
+        for size in self.sizes:
+            interview = make_interview(n_questions=size, answered=size)
+            interview.sync_question_cursor()
+            with self.assertNumQueries(2):
+                body = self.client.get(f'/api/interviews/interviews/{interview.pk}/next_question/').json()
+            self.assertTrue(body['done'])
+
+    def test_results_in_progress(self):
+        self.assert_action_queries('results/', 2, status='in_progress')
+
+    def test_results_from_snapshot(self):
+        review = {'status': 'completed', 'final': {'final_score': 7}, 'per_question': []}
+        for size in self.sizes:
+            interview = self.make(size, status='completed', ai_review=review)
+            url = f'/api/interviews/interviews/{interview.pk}/results/'
+            first = self.client.get(url)
+            self.assertTrue(InterviewResultsSnapshot.objects.filter(interview=interview).exists())
+            with self.assertNumQueries(1):
+                second = self.client.get(url)
+            self.assertEqual(second.json(), first.json())
+
+
+@override_settings(SQLITE_SERIALIZE_BACKGROUND_WRITES=False)
+class ConditionalResponseTests(TestCase):
+    """Uncached payloads are rendered once, and the ETag is the hash of the bytes sent."""
+
+    def assert_rendered_once(self, url):
+        with (
+            mock.patch.object(FastJSONRenderer, 'render', autospec=True, side_effect=FastJSONRenderer.render) as fast,
+            mock.patch.object(JSONRenderer, 'render', autospec=True, side_effect=JSONRenderer.render) as stock,
+        ):
+            response = self.client.get(url)
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(fast.call_count + stock.call_count, 1)
+        self.assertEqual(response['ETag'], f'"{encoded_etag(response.content)}"')
+        self.assertEqual(self.client.get(url, HTTP_IF_NONE_MATCH=response['ETag']).status_code, 304)
+
+    def test_retrieve(self):
+        interview = make_interview()
+        self.assert_rendered_once(f'/api/interviews/interviews/{interview.pk}/')
+
+    def test_results_in_progress(self):
+        interview = make_interview(status='in_progress')
+        self.assert_rendered_once(f'/api/interviews/interviews/{interview.pk}/results/')
+
+    def test_etags_match_stock_renderer(self):
+        # ETags stored by earlier snapshots and archives were hashed from JSONRenderer output.
+        interview = make_interview(job_title='Ingénieur — backend')
+        data = InterviewSerializer(interview).data
+        self.assertEqual(FastJSONRenderer().render(data), JSONRenderer().render(data))
+
+
+class RendererParityTests(SimpleTestCase):
+    """FastJSONRenderer writes exactly what JSONRenderer writes, so ETags don't change with the renderer."""
+
+    payloads = {
+        'scores': {'final_score': 7.333333333333333, 'scores': [0, 0.0, -0.0, 1.5, 6, 1e-4, 9999999999999998.0]},
+        'exponents': {'tiny': 2.5e-05, 'huge': 1e16, 'nested': [{'value': -1.2345678901234568e+17}]},
+        'big integer': {'id': 2**70},
+        'text': {'job_title': 'Ingénieur — backend', 'notes': 'line\u2028separator', 'emoji': '🚀', 'keys': {1: 'int key'}},
+        'types': {
+            'at': datetime(2026, 1, 2, 3, 4, 5, 678901, tzinfo=dt_timezone.utc),
+            'day': date(2026, 1, 2),
+            'amount': Decimal('12.50'),
+            'token': uuid.UUID('12345678-1234-5678-1234-567812345678'),
+            'label': gettext_lazy('Backend engineer'),
+            'tags': ('a', 'b'),
+            'missing': None,
+        },
+    }
+
+    def test_same_bytes(self):
+        for name, payload in self.payloads.items():
+            with self.subTest(name):
+                self.assertEqual(FastJSONRenderer().render(payload), JSONRenderer().render(payload))
+
+    def test_non_finite_floats_are_rejected_by_both(self):
+        for value in (float('nan'), float('inf'), float('-inf')):
+            for renderer in (JSONRenderer(), FastJSONRenderer()):
+                with self.subTest(value=value, renderer=type(renderer).__name__):
+                    with self.assertRaises(ValueError):
+                        renderer.render({'score': value})
+
+
+@override_settings(SQLITE_SERIALIZE_BACKGROUND_WRITES=False)
+class ShareLinkInvalidationTests(TestCase):
+    """Cached share links are dropped when the write commits, not before."""
+
+    def setUp(self):
+        cache.clear()
+        self.link = InterviewShareLink.objects.create(created_by_clerk_user_id='creator', role='Backend engineer')
+        self.public_url = f'/api/interviews/share-links/public/{self.link.token}/'
+        self.assertEqual(self.client.get(self.public_url).status_code, 200)
+
+    def assert_invalidated_on_commit(self, write, token=None):
+        key = f'share-link:{token or self.link.token}'
+        with self.captureOnCommitCallbacks() as callbacks:
+            write()
+            # A read racing the write could only re-cache the old row before this point.
+            self.assertIsNotNone(cache.get(key))
+        self.assertTrue(callbacks)
+        for callback in callbacks:
+            callback()
+        self.assertIsNone(cache.get(key))
+
+    def test_update(self):
+        self.assert_invalidated_on_commit(lambda: self.client.patch(
+            f'/api/interviews/share-links/{self.link.pk}/', {'is_active': False}, content_type='application/json',
+        ))
+        self.assertEqual(self.client.get(self.public_url).status_code, 410)
+
+    def test_destroy(self):
+        self.assert_invalidated_on_commit(lambda: self.client.delete(
+            f'/api/interviews/share-links/{self.link.pk}/?clerk_user_id=creator',
+        ))
+        self.assertEqual(self.client.get(self.public_url).status_code, 404)
+
+
+@override_settings(SQLITE_SERIALIZE_BACKGROUND_WRITES=False)
+class SubmitAnswersValidationTests(TestCase):
+    def test_rejects_non_object_bodies(self):
+        interview = make_interview(answered=0)
+        url = f'/api/interviews/interviews/{interview.pk}/submit_answers/'
+        for body in ('[1, 2]', '"answers"', '3', 'null', '{}', '{"answers": []}'):
+            response = self.client.post(url, body, content_type='application/json')
+            self.assertEqual(response.status_code, 400, body)
+            self.assertEqual(response.json(), {'error': 'answers must be a non-empty list'})
+
+
+class SkillMatcherTests(SimpleTestCase):
+    def test_bundled_taxonomy_maps_each_form_to_one_skill(self):
+        matcher = SkillMatcher(load_taxonomy(DEFAULT_TAXONOMY_PATH))
+        self.assertEqual(matcher.find('Natural Language Processing and NLP'), ['nlp'])
+        self.assertEqual(matcher.find('AI and artificial intelligence'), ['artificial intelligence'])
+
+    def test_rejects_forms_shared_by_two_skills(self):
+        taxonomy = [
+            {'name': 'NLP', 'aliases': ['natural language processing']},
+            {'name': 'Natural Language Processing'},
+            {'name': 'Python', 'aliases': ['python', 'py']},
+        ]
+        with self.assertRaisesMessage(ValueError, "'natural language processing' (nlp, natural language processing)"):
+            SkillMatcher(taxonomy)
+
+
+class ExtractionPoolTests(SimpleTestCase):
+    def make_pool(self, workers, queue):
+        pool = ExtractionPool(workers, queue, memory_mb=1024)
+        self.addCleanup(pool.close)
+        return pool
+
+    def run_in_thread(self, pool, fn, args, timeout):
+        outcome = {}
+
+        def target():
+            try:
+                outcome['value'] = pool.run(fn, args, timeout)
+            except Exception as e:
+                outcome['error'] = e
+
+        thread = threading.Thread(target=target)
+        thread.start()
+        self.addCleanup(thread.join)
+        return thread, outcome
+
+    def test_deadline_starts_when_a_worker_picks_the_job_up(self):
+        pool = self.make_pool(workers=1, queue=1)
+        thread, first = self.run_in_thread(pool, time.sleep, (1.0,), 1.5)
+        time.sleep(0.1)
+        # Waits about a second for the worker, then runs well within its own deadline.
+        self.assertIsNone(pool.run(time.sleep, (1.0,), 1.5))
+        thread.join()
+        self.assertEqual(first, {'value': None})
+
+    def test_only_the_runaway_worker_is_killed(self):
+        pool = self.make_pool(workers=2, queue=0)
+        thread, healthy = self.run_in_thread(pool, time.sleep, (1.0,), 5)
+        time.sleep(0.1)
+        with self.assertRaises(TimeoutError):
+            pool.run(time.sleep, (30,), 0.3)
+        thread.join()
+        self.assertEqual(healthy, {'value': None})
+        self.assertEqual(pool.run(abs, (-3,), 5), 3)
+
+    def test_full_queue_is_turned_away(self):
+        pool = self.make_pool(workers=1, queue=0)
+        thread, first = self.run_in_thread(pool, time.sleep, (1.0,), 5)
+        time.sleep(0.1)
+        with self.assertRaises(PoolBusy):
+            pool.run(abs, (-3,), 5)
+        thread.join()
+        self.assertEqual(first, {'value': None})
+
+
+@override_settings(SQLITE_SERIALIZE_BACKGROUND_WRITES=False)
+class ArchiveBatchTests(TestCase):
+    def test_locks_only_interview_rows(self):
+        # SQLite ignores FOR UPDATE; compile as a backend with FOR UPDATE OF
+        # (Postgres) would, which rejects locking the outer-joined snapshot.
+        features = {'has_select_for_update': True, 'has_select_for_update_of': True}
+        with transaction.atomic(), mock.patch.multiple(connection.features, **features):
+            query = archive_batch_queryset(timezone.now(), 10).query
+            sql, _ = query.get_compiler(connection=connection).as_sql()
+        self.assertIn('LEFT OUTER JOIN', sql)
+        self.assertTrue(sql.endswith(f'FOR UPDATE OF {connection.ops.quote_name(Interview._meta.db_table)}'), sql)
+
+    def test_archives_completed_interviews(self):
+        interview = make_interview(status='completed')
+        make_interview(status='in_progress')
+        Interview.objects.update(updated_at=timezone.now() - timedelta(days=400))
+        self.assertEqual(archive_batch(timezone.now(), 10), 1)
+        self.assertEqual(list(ArchivedInterview.objects.values_list('interview_id', flat=True)), [interview.pk])
+        self.assertFalse(Interview.objects.filter(pk=interview.pk).exists())
+
+
+@override_settings(SQLITE_SERIALIZE_BACKGROUND_WRITES=False)
+@mock.patch('interviews.views.generate_questions_async')
+class StartFromLinkTests(TestCase):
+    """Starting an attempt re-checks the link row, whatever the cache still holds."""
+
+    def setUp(self):
+        cache.clear()
+        self.link = InterviewShareLink.objects.create(created_by_clerk_user_id='creator', role='Backend engineer')
+        self.url = f'/api/interviews/share-links/public/{self.link.token}/start/'
+        # Cache the link, then change the row behind the cache's back.
+        self.assertEqual(self.client.get(f'/api/interviews/share-links/public/{self.link.token}/').status_code, 200)
+
+    def start(self):
+        return self.client.post(self.url, {'clerk_user_id': 'candidate'}, content_type='application/json')
+
+    def test_starts_attempt(self, generate):
+        response = self.start()
+        self.assertEqual(response.status_code, 201)
+        self.assertEqual(Interview.objects.get(pk=response.json()['interview_id']).share_link_id, self.link.pk)
+
+    def test_deleted_link(self, generate):
+        InterviewShareLink.objects.filter(pk=self.link.pk).delete()
+        self.assertEqual(self.start().status_code, 404)
+        self.assertFalse(Interview.objects.exists())
+
+    def test_disabled_link(self, generate):
+        InterviewShareLink.objects.filter(pk=self.link.pk).update(is_active=False)
+        self.assertEqual(self.start().status_code, 410)
+        self.assertFalse(Interview.objects.exists())
+
+
+class ShareLinkCacheTTLTests(SimpleTestCase):
+    @override_settings(SHARE_LINK_CACHE_TTL=300, SHARE_LINK_MEMORY_CACHE_TTL=10)
+    def test_per_process_backend_is_capped_at_memory_ttl(self):
+        # The test settings use LocMemCache, which invalidation can't clear in other processes.
+        self.assertEqual(_backend_ttl(), 10)
+
+
+class QueryPlanTests(TestCase):
+    """The hot query shapes stay on their indexes (see `manage.py check_query_plans`)."""
+
+    def test_hot_queries_use_indexes(self):
+        for name, qs in query_shapes().items():
+            with self.subTest(name):
+                full_scans, plan = full_scan_plan(qs)
+                self.assertEqual(full_scans, [], plan)
+
+    def test_detects_full_scans(self):
+        full_scans, _ = full_scan_plan(Interview.objects.filter(job_title='Backend engineer'))
+        self.assertEqual(full_scans, [Interview._meta.db_table])
+
+
+class ColdStartImportTests(SimpleTestCase):
+    """Starting the app and serving health/ doesn't import the resume parsing or AI stacks."""
+
+    def test_serverless_entry(self):
+        report, _ = run_child(Path(settings.BASE_DIR).parent / 'api' / 'index.py', LAZY_MODULES)
+        self.assertTrue(report['status'].startswith('200'), report['status'])
+        self.assertEqual(report['lazy_loaded'], [])
+
+    def test_wsgi_application(self):
+        code = (
+            # Loading the URLconf imports every view module, as the first request would.
+            'import json, sys; import config.wsgi; from django.urls import get_resolver; get_resolver().url_patterns; '
+            f'print(json.dumps([name for name in {list(LAZY_MODULES)!r} if name in sys.modules]))'
+        )
+        proc = subprocess.run(
+            [sys.executable, '-c', code], capture_output=True, text=True, cwd=settings.BASE_DIR, check=True,
+        )
+        self.assertEqual(json.loads(proc.stdout.strip().splitlines()[-1]), [])
+
+
+class ResumeExtractionLimitTests(SimpleTestCase):
+    def pdf(self, pages):
+        return build_pdf([[f'Page {page} line {line} python django kubernetes' for line in range(50)] for page in range(pages)], 'single')
+
+    @override_settings(
+        RESUME_EXTRACT_WORKERS=1, RESUME_EXTRACT_TIMEOUT=30, RESUME_MAX_PAGES=10**6, RESUME_MAX_CHARS=10**9,
+        RESUME_MAX_UPLOAD_MB=100,
+    )
+    def test_hard_timeout_keeps_pages_read(self):
+        # The worker's own deadline is 30s; kill it after 1s.
+        with mock.patch.object(extraction, '_pool', None), mock.patch.object(extraction, 'HARD_TIMEOUT_GRACE', -29):
+            self.addCleanup(lambda: extraction._pool and extraction._pool.close())
+            result = extract_bounded(self.pdf(3000), 'long.pdf')
+        self.assertEqual((result['truncated'], result['reason']), (True, 'timeout'))
+        self.assertGreater(result['pages'], 0)
+        self.assertTrue(result['text'].startswith('Page 0 line 0'))
+        self.assertIn(f"Page {result['pages'] - 1} line 49", result['text'])
+
+    @override_settings(RESUME_MAX_UPLOAD_MB=0.01)
+    def test_oversized_upload_is_refused(self):
+        pdf = self.pdf(20)
+        self.assertEqual(extract_bounded(pdf, 'big.pdf')['reason'], 'size')
+        response = self.client.post('/api/interviews/parse-resume/', {'resume': SimpleUploadedFile('big.pdf', pdf)})
+        self.assertEqual(response.status_code, 413)
+
+    def test_in_process_extraction_requires_debug(self):
+        env = {**os.environ, 'DEBUG': 'False', 'RESUME_EXTRACT_WORKERS': '0', 'VERCEL': '', 'AWS_LAMBDA_FUNCTION_NAME': ''}
+        proc = subprocess.run(
+            [sys.executable, '-c', 'import django; django.setup()'],
+            capture_output=True, text=True, cwd=settings.BASE_DIR, env={**env, 'DJANGO_SETTINGS_MODULE': 'config.settings'},
+        )
+        self.assertNotEqual(proc.returncode, 0)
+        self.assertIn('ImproperlyConfigured: RESUME_EXTRACT_WORKERS=0', proc.stderr)
+
+
+@override_settings(SQLITE_SERIALIZE_BACKGROUND_WRITES=False)
+class ReevaluateTests(TestCase):
+    def test_failure_replaces_processing_review(self):
+        interview = make_interview(status='completed', ai_review={'status': 'processing', 'per_question': []})
+
+        def fail_midway(generator, interview):
+            interview.ai_review = {'status': 'processing', 'per_question': [{'order': 1, 'score': 5}]}
+            interview.save(update_fields=['ai_review'])
+            raise RuntimeError('upstream unavailable')
+
+        with mock.patch('interviews.services.AIQuestionGenerator.evaluate_full_interview', fail_midway):
+            _, outcome, _, detail = reevaluate_interview(interview.pk)
+        self.assertEqual((outcome, detail), ('failed', 'upstream unavailable'))
+        interview.refresh_from_db()
+        self.assertEqual(interview.ai_review, {'error': True, 'status': 'failed', 'message': 'upstream unavailable'})
@@ -0,0 +1,149 @@
+"""Per-request timing: Server-Timing headers and a log line for every request.
+
+ServerTimingMiddleware records wall time and every SQL query run on the
+request's connection. Code that wants its own bucket wraps itself in
+`timed(name)`: serializers ('serialize'), the JSON renderer ('render') and
+the AI client ('ai'). Spans of the same name don't nest, and spans overlap
+with DB time (a serializer that triggers a query counts it in both).
+
+Work on other threads (background generation and evaluation) and the body
+of streaming responses are not part of the request and aren't counted.
+Requests slower than REQUEST_SLOW_MS are logged as warnings with their
+slowest SQL statements.
+"""
+import heapq
+import logging
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from functools import partial
+
+from django.conf import settings
+from django.core.exceptions import MiddlewareNotUsed
+from django.db import connection
+from django.utils.cache import patch_vary_headers
+
+logger = logging.getLogger(__name__)
+
+# Slowest statements kept per request for the slow-request warning.
+SLOWEST_QUERIES = 3
+SQL_LOG_CHARS = 500
+# Spans reported as call counts in Server-Timing; the others are per-object.
+COUNTED_SPANS = ('ai',)
+
+_current = ContextVar('request_timing', default=None)
+
+
+def new_timing() -> dict:
+    return {'spans': {}, 'active': set(), 'queries': 0, 'db': 0.0, 'slowest': []}
+
+
+@contextmanager
+def timed(name: str):
+    """Add the time spent in the block to span `name` of the current request, if any."""
+    timing = _current.get()
+    if timing is None or name in timing['active']:
+        yield
+        return
+    timing['active'].add(name)
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        timing['active'].discard(name)
+        span = timing['spans'].setdefault(name, [0, 0.0])
+        span[0] += 1
+        span[1] += time.perf_counter() - start
+
+
+def _record_query(timing, execute, sql, params, many, context):
+    start = time.perf_counter()
+    try:
+        return execute(sql, params, many, context)
+    finally:
+        elapsed = time.perf_counter() - start
+        timing['queries'] += 1
+        timing['db'] += elapsed
+        # Statements without their parameters, so logs don't carry user data.
+        entry = (elapsed, timing['queries'], sql)
+        if len(timing['slowest']) < SLOWEST_QUERIES:
+            heapq.heappush(timing['slowest'], entry)
+        else:
+            heapq.heappushpop(timing['slowest'], entry)
+
+
+def timing_fields(request, response, timing, total) -> dict:
+    fields = {
+        'method': request.method,
+        'path': request.path,
+        'status': response.status_code,
+        'total_ms': round(total * 1000, 1),
+        'db_ms': round(timing['db'] * 1000, 1),
+        'db_queries': timing['queries'],
+    }
+    for name, (count, seconds) in sorted(timing['spans'].items()):
+        fields[f'{name}_ms'] = round(seconds * 1000, 1)
+        if name in COUNTED_SPANS:
+            fields[f'{name}_calls'] = count
+    return fields
+
+
+def server_timing_header(timing, total) -> str:
+    queries = timing['queries']
+    metrics = [f'db;dur={timing["db"] * 1000:.1f};desc="{queries} {"query" if queries == 1 else "queries"}"']
+    for name, (count, seconds) in sorted(timing['spans'].items()):
+        metric = f'{name};dur={seconds * 1000:.1f}'
+        if name in COUNTED_SPANS:
+            metric += f';desc="{count} {"call" if count == 1 else "calls"}"'
+        metrics.append(metric)
+    metrics.append(f'total;dur={total * 1000:.1f}')
+    return ', '.join(metrics)
+
+
+def timing_allow_origin(request) -> str | None:
+    """The request's Origin when CORS allows it, so the frontend's devtools can show the timings."""
+    origin = request.headers.get('Origin')
+    if origin and (settings.CORS_ALLOW_ALL_ORIGINS or origin in settings.CORS_ALLOWED_ORIGINS):
+        return origin
+    return None
+
+
+class ServerTimingMiddleware:
+    """Adds Server-Timing (db, serialize, render, ai, total) and logs each request's timings."""
+
+    def __init__(self, get_response):
+        if not settings.REQUEST_TIMING_ENABLED:
+            raise MiddlewareNotUsed
+        self.get_response = get_response
+
+    def __call__(self, request):
+        timing = new_timing()
+        token = _current.set(timing)
+        start = time.perf_counter()
+        try:
+            with connection.execute_wrapper(partial(_record_query, timing)):
+                response = self.get_response(request)
+        finally:
+            _current.reset(token)
+        total = time.perf_counter() - start
+
+        response['Server-Timing'] = server_timing_header(timing, total)
+        origin = timing_allow_origin(request)
+        if origin:
+            response['Timing-Allow-Origin'] = origin
+            patch_vary_headers(response, ('Origin',))
+
+        fields = timing_fields(request, response, timing, total)
+        logger.info('request ' + ' '.join(f'{key}={value}' for key, value in fields.items()), extra={'timing': fields})
+        if total * 1000 >= settings.REQUEST_SLOW_MS:
+            slowest = [
+                {'ms': round(elapsed * 1000, 1), 'sql': sql[:SQL_LOG_CHARS]}
+                for elapsed, _, sql in sorted(timing['slowest'], reverse=True)
+            ]
+            logger.warning(
+                f"Slow request {request.method} {request.path}: {fields['total_ms']} ms, "
+                f"db_queries={timing['queries']} db_ms={fields['db_ms']}; slowest SQL: "
+                + ('; '.join(f"{q['ms']} ms {q['sql']}" for q in slowest) or 'none'),
+                extra={'timing': fields, 'slow_queries': slowest},
+            )
+        return response
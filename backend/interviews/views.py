@@ -2,42 +2,89 @@ import logging
 from rest_framework import viewsets, status
 from rest_framework.decorators import action, api_view
 from rest_framework.response import Response
-from rest_framework.parsers import MultiPartParser, FormParser, JSONParser
+from rest_framework.parsers import MultiPartParser, FormParser
 from django.conf import settings
-from django.db import models
+from django.core.files.storage import default_storage
+from django.db import models, transaction
+from django.db.models.functions import Coalesce
+from django.http import Http404, HttpResponse, StreamingHttpResponse
 from django.utils import timezone
+from django.utils.cache import get_conditional_response, patch_cache_control
+from django.utils.http import http_date, quote_etag
 import os
 import threading
-from .models import Interview, Question, Answer
+from .archive import get_archived_interview
+from .db import run_write
+from .exports import EXPORT_FORMATS, iter_attempt_rows, stream_csv, stream_jsonl
+from .models import ArchivedInterview, CreatorRollup, Interview, Question, Answer
 from .serializers import (
     InterviewSerializer, InterviewListSerializer, QuestionSerializer,
     AnswerSerializer, CreateInterviewSerializer,
     InterviewShareLinkSerializer, CreateInterviewShareLinkSerializer,
-    InterviewAttemptSerializer,
+    InterviewAttemptSerializer, ArchivedInterviewSerializer,
+)
+from .pagination import QuestionCursorPagination
+from .renderers import FastJSONParser
+from .rollups import (
+    attach_share_link_rollup, detach_share_link_rollup, remove_attempt_rollup,
+    rollup_payload, sync_attempt_rollup,
+)
+from .results import (
+    build_results_payload, get_results_snapshot, invalidate_results_snapshot,
+    encoded_etag, refresh_results_snapshot, render_payload, review_is_final,
+)
+from .share_link_cache import (
+    invalidate_share_link, resolve_share_link, seconds_until_expiry, share_link_state,
 )
-from .services import AIQuestionGenerator
-from .resume_parser import ResumeParser
+
+# services (AI client, question bank) and resume_parser are imported where
+# they are used, so cold starts and health checks don't load them.
 
 logger = logging.getLogger(__name__)
 
+# Upper bound on answers accepted by one submit_answers request.
+MAX_BATCH_ANSWERS = 100
+
 
 def generate_questions_async(interview, resume_file_path=None):
-    """Generate questions in a background thread."""
+    """Generate questions in a background thread.
+
+    Database writes go through `run_write` so that, on SQLite, background
+    threads don't contend with each other for the write lock.
+    """
+    from .services import AIQuestionGenerator
+
     try:
         logger.info(f"Starting AI question generation for interview {interview.id}")
         generator = AIQuestionGenerator()
         questions = generator.generate_questions(interview, resume_file_path)
         interview.status = 'in_progress'
-        interview.save()
+        run_write(interview.save)
         logger.info(f"Generated {len(questions)} questions for interview {interview.id}")
     except Exception as e:
         logger.error(f"Error generating questions for interview {interview.id}: {e}")
         interview.status = 'pending'
-        interview.save()
+        run_write(interview.save)
+
+
+def store_interview_review(interview, review):
+    """Save a finished AI review and refresh the results snapshot and rollups."""
+    interview.ai_review = review
+    try:
+        interview.ai_final_score = float((review or {}).get('final', {}).get('final_score', 0) or 0)
+    except (TypeError, ValueError):
+        interview.ai_final_score = 0
+    interview.ai_review_generated_at = timezone.now()
+    run_write(interview.save, update_fields=['ai_review', 'ai_final_score', 'ai_review_generated_at', 'updated_at'])
+    logger.info(f"Full interview evaluation stored for interview {interview.id}")
+    run_write(refresh_results_snapshot, interview)
+    run_write(sync_attempt_rollup, interview)
 
 
 def evaluate_interview_async(interview_id: int):
     """Evaluate an interview in a background thread and store the AI review."""
+    from .services import AIQuestionGenerator
+
     try:
         interview = Interview.objects.get(id=interview_id)
     except Interview.DoesNotExist:
@@ -47,30 +94,94 @@ def evaluate_interview_async(interview_id: int):
         logger.info(f"Starting full interview evaluation for interview {interview.id}")
         generator = AIQuestionGenerator()
         review = generator.evaluate_full_interview(interview)
-
-        interview.ai_review = review
-        try:
-            interview.ai_final_score = float((review or {}).get('final', {}).get('final_score', 0) or 0)
-        except (TypeError, ValueError):
-            interview.ai_final_score = 0
-        interview.ai_review_generated_at = timezone.now()
-        interview.save(update_fields=['ai_review', 'ai_final_score', 'ai_review_generated_at', 'updated_at'])
-        logger.info(f"Full interview evaluation stored for interview {interview.id}")
+        store_interview_review(interview, review)
     except Exception as e:
         logger.error(f"Error evaluating interview {interview.id}: {e}")
-        interview.ai_review = {
-            'error': True,
-            'message': str(e),
-        }
-        interview.ai_final_score = 0
-        interview.ai_review_generated_at = timezone.now()
-        interview.save(update_fields=['ai_review', 'ai_final_score', 'ai_review_generated_at', 'updated_at'])
+        store_review_error(interview, e)
+
+
+def store_review_error(interview, error):
+    """Replace a pending or partial AI review with a failed one, so clients stop polling."""
+    interview.ai_review = {
+        'error': True,
+        'status': 'failed',
+        'message': str(error),
+    }
+    interview.ai_final_score = 0
+    interview.ai_review_generated_at = timezone.now()
+    run_write(interview.save, update_fields=['ai_review', 'ai_final_score', 'ai_review_generated_at', 'updated_at'])
+    run_write(sync_attempt_rollup, interview)
+
+
+def _conditional_response(request, payload, etag=None, last_modified=None, **cache_control):
+    """Serve `payload` with a strong ETag, answering 304 when the client has it.
+
+    Without a stored `etag` the payload is rendered once and the ETag is the
+    hash of the bytes that are sent.
+
+    Defaults to `Cache-Control: no-cache`; pass `cache_control` kwargs (as for
+    `patch_cache_control`) for responses that may be reused without revalidation.
+    """
+    encoded = None
+    if etag is None:
+        encoded = render_payload(payload)
+        etag = encoded_etag(encoded)
+    etag = quote_etag(etag)
+    last_modified_ts = int(last_modified.timestamp()) if last_modified else None
+    response = get_conditional_response(request, etag=etag, last_modified=last_modified_ts)
+    if response is None and encoded is not None:
+        response = HttpResponse(encoded, content_type='application/json')
+    elif response is None:
+        response = Response(payload, status=status.HTTP_200_OK)
+    response['ETag'] = etag
+    if last_modified_ts is not None:
+        response['Last-Modified'] = http_date(last_modified_ts)
+    # By default cacheable, but always revalidated: reattempt can invalidate at any time.
+    patch_cache_control(response, **(cache_control or {'no_cache': True}))
+    return response
+
+
+def _question_at_cursor(interview):
+    return (
+        interview.questions.select_related('answer')
+        .filter(order__gte=interview.current_question_order)
+        .order_by('order')
+        .first()
+    )
+
+
+def _is_answered(question) -> bool:
+    ans = getattr(question, 'answer', None)
+    return bool(ans and getattr(ans, 'answer_text', '').strip())
+
+
+def _with_attempt_counts(qs):
+    """Annotate share links with attempt counters in the same query.
+
+    Archived attempts (always completed) are counted with a subquery so they
+    don't multiply the joined live rows.
+    """
+    archived = Coalesce(models.Subquery(
+        ArchivedInterview.objects.filter(share_link=models.OuterRef('pk'))
+        .order_by().values('share_link')
+        .annotate(count=models.Count('pk')).values('count'),
+    ), 0)
+    return qs.annotate(
+        attempts_total_count=models.Count('interview_attempts') + archived,
+        attempts_completed_count=models.Count(
+            'interview_attempts', filter=models.Q(interview_attempts__status='completed'),
+        ) + archived,
+    )
+
+
+def _wants_archived(request) -> bool:
+    return request.query_params.get('archived') in ('1', 'true')
 
 
 class InterviewViewSet(viewsets.ModelViewSet):
     queryset = Interview.objects.all()
     serializer_class = InterviewSerializer
-    parser_classes = [MultiPartParser, FormParser, JSONParser]
+    parser_classes = [MultiPartParser, FormParser, FastJSONParser]
 
     def get_serializer_class(self):
         if self.action == 'create':
@@ -81,6 +192,21 @@ class InterviewViewSet(viewsets.ModelViewSet):
 
     def get_queryset(self):
         qs = Interview.objects.all()
+        if self.action == 'list':
+            # The list serializer never reads the large compressed documents.
+            qs = qs.defer('job_description', 'resume_text', 'ai_review').annotate(
+                total_questions_count=models.Count('questions', distinct=True),
+                answered_questions_count=models.Count('questions__answer', distinct=True),
+            )
+        elif self.action in ('retrieve', 'questions'):
+            # One extra query loads every question with its answer joined in.
+            qs = qs.prefetch_related(models.Prefetch(
+                'questions',
+                queryset=Question.objects.select_related('answer').order_by('order'),
+            ))
+        elif self.action == 'results':
+            # Completed reviews are served straight from the snapshot.
+            qs = qs.select_related('results_snapshot')
         clerk_user_id = self.request.query_params.get('clerk_user_id')
         if clerk_user_id:
             qs = qs.filter(clerk_user_id=clerk_user_id)
@@ -90,42 +216,89 @@ class InterviewViewSet(viewsets.ModelViewSet):
         interview = serializer.save()
         logger.info(f"Interview {interview.id} created: {interview.job_title}")
 
-        # Handle resume file if uploaded
+        # Resume uploads are only kept on disk when RESUME_PERSIST_UPLOADS is set.
         resume_file = self.request.FILES.get('resume')
         resume_file_path = None
 
-        if resume_file:
-            upload_dir = os.path.join(settings.MEDIA_ROOT, 'resumes')
-            os.makedirs(upload_dir, exist_ok=True)
-            resume_filename = f"resume_{interview.id}_{resume_file.name}"
-            resume_file_path = os.path.join(upload_dir, resume_filename)
-            with open(resume_file_path, 'wb+') as destination:
-                for chunk in resume_file.chunks():
-                    destination.write(chunk)
+        if resume_file and settings.RESUME_PERSIST_UPLOADS:
+            name = default_storage.save(
+                f"resumes/resume_{interview.id}_{os.path.basename(resume_file.name)}", resume_file,
+            )
+            resume_file_path = default_storage.path(name)
 
         # Generate questions in background
         thread = threading.Thread(target=generate_questions_async, args=(interview, resume_file_path))
         thread.daemon = True
         thread.start()
 
+    # Share-link attempts feed the interviewer rollups; keep them in step with
+    # direct edits and deletes as well as the actions below.
+
+    def perform_update(self, serializer):
+        interview = serializer.save()
+        sync_attempt_rollup(interview)
+
+    @transaction.atomic
+    def perform_destroy(self, instance):
+        remove_attempt_rollup(instance)
+        instance.delete()
+
+    def _get_archived_or_404(self):
+        archived = get_archived_interview(self.kwargs.get('pk'), self.request.query_params.get('clerk_user_id'))
+        if archived is None:
+            raise Http404
+        return archived
+
+    def list(self, request, *args, **kwargs):
+        """List interviews; `?archived=true` lists the archived ones instead."""
+        if not _wants_archived(request):
+            return super().list(request, *args, **kwargs)
+        qs = ArchivedInterview.objects.all()
+        clerk_user_id = request.query_params.get('clerk_user_id')
+        if clerk_user_id:
+            qs = qs.filter(clerk_user_id=clerk_user_id)
+        qs = qs.defer('detail', 'results')
+        page = self.paginate_queryset(qs)
+        if page is not None:
+            return self.get_paginated_response(ArchivedInterviewSerializer(page, many=True).data)
+        return Response(ArchivedInterviewSerializer(qs, many=True).data)
+
+    def retrieve(self, request, *args, **kwargs):
+        try:
+            interview = self.get_object()
+        except Http404:
+            # Completed interviews moved out by archive_interviews keep their URL.
+            archived = self._get_archived_or_404()
+            return _conditional_response(request, archived.detail, archived.detail_etag)
+        data = self.get_serializer(interview).data
+        return _conditional_response(request, data)
+
     @action(detail=True, methods=['get'])
     def questions(self, request, pk=None):
         interview = self.get_object()
-        questions = interview.questions.all().order_by('order')
-        serializer = QuestionSerializer(questions, many=True)
+        serializer = QuestionSerializer(interview.questions.all(), many=True)
         return Response(serializer.data)
 
     @action(detail=True, methods=['get'])
     def next_question(self, request, pk=None):
-        """Return the next unanswered question (one question at a time)."""
+        """Return the next unanswered question (one question at a time).
+
+        Reads the question at the interview's cursor with a single indexed
+        lookup; submit_answer and reattempt keep the cursor current.
+        """
         interview = self.get_object()
 
-        questions = interview.questions.all().order_by('order')
-        for q in questions:
-            ans = getattr(q, 'answer', None)
-            if not ans or not getattr(ans, 'answer_text', '').strip():
-                serializer = QuestionSerializer(q)
-                return Response({'done': False, 'question': serializer.data}, status=status.HTTP_200_OK)
+        q = _question_at_cursor(interview)
+        if q is not None and _is_answered(q):
+            # Cursor predates this answer (e.g. interviews created before the
+            # cursor existed); re-sync once and read again.
+            with transaction.atomic():
+                interview.sync_question_cursor()
+            q = _question_at_cursor(interview)
+
+        if q is not None:
+            serializer = QuestionSerializer(q)
+            return Response({'done': False, 'question': serializer.data}, status=status.HTTP_200_OK)
 
         return Response({'done': True, 'question': None}, status=status.HTTP_200_OK)
 
@@ -140,13 +313,94 @@ class InterviewViewSet(viewsets.ModelViewSet):
         except Question.DoesNotExist:
             return Response({'error': 'Question not found'}, status=status.HTTP_404_NOT_FOUND)
 
-        answer, _created = Answer.objects.update_or_create(
-            question=question,
-            defaults={'answer_text': answer_text},
-        )
+        with transaction.atomic():
+            interview = Interview.objects.select_for_update().get(pk=interview.pk)
+            answer, _created = Answer.objects.update_or_create(
+                question=question,
+                defaults={'answer_text': answer_text},
+            )
+            interview.sync_question_cursor()
+            if interview.status == 'completed':
+                invalidate_results_snapshot(interview)
         serializer = AnswerSerializer(answer)
         return Response(serializer.data, status=status.HTTP_201_CREATED)
 
+    @action(detail=True, methods=['post'])
+    def submit_answers(self, request, pk=None):
+        """Save many answers in one request: `{"answers": [{"question_id", "answer"}, ...]}`.
+
+        Questions are validated against the interview in one query and every
+        valid answer is upserted with one bulk statement in one transaction.
+        Returns a result per item, in request order; invalid items don't stop
+        the valid ones from being saved. A question repeated in the batch keeps
+        its last answer.
+        """
+        items = request.data.get('answers') if isinstance(request.data, dict) else None
+        if not isinstance(items, list) or not items:
+            return Response({'error': 'answers must be a non-empty list'}, status=status.HTTP_400_BAD_REQUEST)
+        if len(items) > MAX_BATCH_ANSWERS:
+            return Response(
+                {'error': f'At most {MAX_BATCH_ANSWERS} answers per request'},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+
+        interview = self.get_object()
+        results = [None] * len(items)
+        latest = {}
+        for index, item in enumerate(items):
+            question_id = item.get('question_id') if isinstance(item, dict) else None
+            answer_text = item.get('answer', '') if isinstance(item, dict) else None
+            try:
+                question_id = int(question_id)
+            except (TypeError, ValueError):
+                results[index] = {'index': index, 'question_id': question_id, 'status': 'error', 'error': 'Invalid question_id'}
+                continue
+            if not isinstance(answer_text, str):
+                results[index] = {'index': index, 'question_id': question_id, 'status': 'error', 'error': 'answer must be a string'}
+                continue
+            if question_id in latest:
+                superseded = latest[question_id][0]
+                results[superseded] = {'index': superseded, 'question_id': question_id, 'status': 'superseded'}
+            latest[question_id] = (index, answer_text)
+
+        # Which questions belong to this interview, and which already have an answer.
+        existing = dict(
+            Question.objects.filter(interview=interview, id__in=latest)
+            .values_list('id', 'answer__id')
+        )
+        for question_id, (index, _text) in list(latest.items()):
+            if question_id not in existing:
+                results[index] = {'index': index, 'question_id': question_id, 'status': 'error', 'error': 'Question not found'}
+                del latest[question_id]
+
+        if latest:
+            with transaction.atomic():
+                interview = Interview.objects.select_for_update().get(pk=interview.pk)
+                Answer.objects.bulk_create(
+                    [Answer(question_id=question_id, answer_text=text) for question_id, (_index, text) in latest.items()],
+                    update_conflicts=True,
+                    unique_fields=['question'],
+                    update_fields=['answer_text', 'updated_at'],
+                )
+                interview.sync_question_cursor()
+                if interview.status == 'completed':
+                    invalidate_results_snapshot(interview)
+            saved = Answer.objects.filter(question_id__in=latest)
+            for answer in saved:
+                index, _text = latest[answer.question_id]
+                results[index] = {
+                    'index': index,
+                    'question_id': answer.question_id,
+                    'status': 'updated' if existing[answer.question_id] else 'created',
+                    'answer': AnswerSerializer(answer).data,
+                }
+
+        return Response({
+            'saved': len(latest),
+            'failed': sum(1 for r in results if r['status'] == 'error'),
+            'results': results,
+        }, status=status.HTTP_200_OK)
+
     @action(detail=True, methods=['post'])
     def evaluate_answer(self, request, pk=None):
         interview = self.get_object()
@@ -173,6 +427,8 @@ class InterviewViewSet(viewsets.ModelViewSet):
         except (TypeError, ValueError):
             followup_count_int = 0
 
+        from .services import AIQuestionGenerator
+
         generator = AIQuestionGenerator()
         result = generator.evaluate_answer(
             interview=interview,
@@ -185,7 +441,9 @@ class InterviewViewSet(viewsets.ModelViewSet):
     @action(detail=True, methods=['post'])
     def complete(self, request, pk=None):
         interview = self.get_object()
+        invalidate_results_snapshot(interview)
         interview.status = 'completed'
+        interview.completed_at = timezone.now()
 
         # Calculate overall score
         total_questions = interview.questions.count()
@@ -198,6 +456,7 @@ class InterviewViewSet(viewsets.ModelViewSet):
         else:
             interview.overall_score = 0
         interview.save()
+        sync_attempt_rollup(interview)
 
         # Kick off AI review asynchronously
         thread = threading.Thread(target=evaluate_interview_async, args=(interview.id,))
@@ -222,10 +481,12 @@ class InterviewViewSet(viewsets.ModelViewSet):
 
         # If forcing re-generation, clear existing review first so clients can poll for fresh data
         if force:
+            invalidate_results_snapshot(interview)
             interview.ai_review = None
             interview.ai_final_score = 0
             interview.ai_review_generated_at = None
             interview.save(update_fields=['ai_review', 'ai_final_score', 'ai_review_generated_at', 'updated_at'])
+            sync_attempt_rollup(interview)
 
         thread = threading.Thread(target=evaluate_interview_async, args=(interview.id,))
         thread.daemon = True
@@ -239,74 +500,47 @@ class InterviewViewSet(viewsets.ModelViewSet):
 
         # Delete answers (OneToOne per question)
         Answer.objects.filter(question__interview=interview).delete()
+        invalidate_results_snapshot(interview)
 
         interview.status = 'in_progress'
         interview.overall_score = 0
         interview.ai_review = None
         interview.ai_final_score = 0
         interview.ai_review_generated_at = None
-        interview.save(update_fields=['status', 'overall_score', 'ai_review', 'ai_final_score', 'ai_review_generated_at', 'updated_at'])
+        interview.current_question_order = 0
+        interview.completed_at = None
+        interview.save(update_fields=[
+            'status', 'overall_score', 'ai_review', 'ai_final_score', 'ai_review_generated_at',
+            'current_question_order', 'completed_at', 'updated_at',
+        ])
+        sync_attempt_rollup(interview)
 
         serializer = InterviewSerializer(interview)
         return Response(serializer.data, status=status.HTTP_200_OK)
 
     @action(detail=True, methods=['get'])
     def results(self, request, pk=None):
-        """Return detailed results for a completed interview."""
-        interview = self.get_object()
-        questions = interview.questions.all().order_by('order')
-        question_data = QuestionSerializer(questions, many=True).data
-
-        # Merge AI review data into questions if available
-        if interview.ai_review and isinstance(interview.ai_review, dict):
-            per_question_map = {}
-            for item in interview.ai_review.get('per_question', []):
-                order = item.get('order')
-                if order is not None:
-                    per_question_map[order] = item
-
-            for q in question_data:
-                order = q.get('order')
-                if order in per_question_map:
-                    review_item = per_question_map[order]
-                    q['ai_answer'] = review_item.get('ai_answer', '')
-                    q['strategy_to_improve'] = review_item.get('strategy_to_improve', '')
-                    q['improvements_needed'] = review_item.get('improvements_needed', [])
-                    q['ai_score'] = review_item.get('score', None)
-
-        total_answered = Answer.objects.filter(question__interview=interview).count()
-        total_questions = questions.count()
-        total_score = Answer.objects.filter(
-            question__interview=interview
-        ).aggregate(total_score=models.Sum('score'))
-        total_score_value = total_score.get('total_score') or 0
-        average_score = (total_score_value / total_questions) if total_questions > 0 else 0
+        """Return detailed results for a completed interview.
 
-        return Response({
-            'interview': {
-                'id': interview.id,
-                'job_title': interview.job_title,
-                'difficulty': interview.difficulty,
-                'status': interview.status,
-                'overall_score': interview.overall_score,
-                'ai_final_score': interview.ai_final_score,
-                'ai_review_generated_at': interview.ai_review_generated_at,
-                'ai_review': {
-                    'status': interview.ai_review.get('status') if isinstance(interview.ai_review, dict) else None,
-                    'current_step': interview.ai_review.get('current_step') if isinstance(interview.ai_review, dict) else None,
-                    'per_question': interview.ai_review.get('per_question', []) if isinstance(interview.ai_review, dict) else [],
-                    'final': interview.ai_review.get('final') if isinstance(interview.ai_review, dict) else None,
-                    'error': interview.ai_review.get('error') if isinstance(interview.ai_review, dict) else None,
-                } if interview.ai_review else None,
-                'created_at': interview.created_at,
-            },
-            'questions': question_data,
-            'summary': {
-                'total_questions': questions.count(),
-                'total_answered': total_answered,
-                'average_score': average_score,
-            },
-        })
+        Once the AI review has completed the payload comes from the immutable
+        results snapshot; either way clients can revalidate with If-None-Match.
+        Archived interviews are served from the archive.
+        """
+        try:
+            interview = self.get_object()
+        except Http404:
+            archived = self._get_archived_or_404()
+            return _conditional_response(request, archived.results, archived.results_etag, archived.archived_at)
+
+        snapshot = get_results_snapshot(interview)
+        if snapshot is None and review_is_final(interview):
+            # Reviews finished before snapshots existed are built on first read.
+            snapshot = refresh_results_snapshot(interview)
+        if snapshot is not None:
+            return _conditional_response(request, snapshot.payload, snapshot.etag, snapshot.created_at)
+
+        payload = build_results_payload(interview)
+        return _conditional_response(request, payload)
 
 
 class ShareLinkViewSet(viewsets.ModelViewSet):
@@ -317,7 +551,11 @@ class ShareLinkViewSet(viewsets.ModelViewSet):
     def get_queryset(self):
         from .models import InterviewShareLink
 
-        qs = InterviewShareLink.objects.all()
+        if self.action == 'analytics':
+            # Served from the incrementally maintained rollup in one query.
+            qs = InterviewShareLink.objects.select_related('rollup')
+        else:
+            qs = _with_attempt_counts(InterviewShareLink.objects.all())
         clerk_user_id = self.request.query_params.get('clerk_user_id')
         created_by_email = self.request.query_params.get('created_by_email')
         if clerk_user_id:
@@ -331,6 +569,16 @@ class ShareLinkViewSet(viewsets.ModelViewSet):
             return CreateInterviewShareLinkSerializer
         return InterviewShareLinkSerializer
 
+    @transaction.atomic
+    def perform_update(self, serializer):
+        old_creator = serializer.instance.created_by_clerk_user_id
+        link = serializer.save()
+        if link.created_by_clerk_user_id != old_creator:
+            # Move the link's totals to the new creator's rollup.
+            detach_share_link_rollup(link, creator=old_creator)
+            attach_share_link_rollup(link)
+        invalidate_share_link(link.token)
+
     def destroy(self, request, *args, **kwargs):
         """Interviewer: delete a share link.
 
@@ -341,7 +589,11 @@ class ShareLinkViewSet(viewsets.ModelViewSet):
         if not str(clerk_user_id).strip() or str(clerk_user_id) != str(link.created_by_clerk_user_id or ''):
             return Response({'error': 'Not authorized'}, status=status.HTTP_403_FORBIDDEN)
 
-        return super().destroy(request, *args, **kwargs)
+        with transaction.atomic():
+            detach_share_link_rollup(link)
+            response = super().destroy(request, *args, **kwargs)
+            invalidate_share_link(link.token)
+        return response
 
     @action(detail=True, methods=['post'])
     def regenerate(self, request, pk=None):
@@ -356,27 +608,35 @@ class ShareLinkViewSet(viewsets.ModelViewSet):
 
         # UUIDField default does not auto-update on save; set explicitly.
         import uuid
+        old_token = link.token
         link.token = uuid.uuid4()
         link.save(update_fields=['token', 'updated_at'])
+        invalidate_share_link(old_token)
 
         return Response(InterviewShareLinkSerializer(link).data, status=status.HTTP_200_OK)
 
     @action(detail=False, methods=['get'], url_path=r'public/(?P<token>[^/]+)')
     def public(self, request, token=None):
-        """Public: fetch share link config by token (enforces active + expiry)."""
-        from .models import InterviewShareLink
+        """Public: fetch share link config by token (enforces active + expiry).
 
-        try:
-            link = InterviewShareLink.objects.get(token=token)
-        except InterviewShareLink.DoesNotExist:
+        Served from the share-link cache with edge-cacheable headers; the
+        interviewer-only fields (creator, attempt counts) are not exposed here.
+        """
+        entry = resolve_share_link(token)
+        if entry is None:
             return Response({'error': 'Link not found'}, status=status.HTTP_404_NOT_FOUND)
 
-        if not link.is_active:
+        link_state = share_link_state(entry)
+        if link_state == 'disabled':
             return Response({'error': 'Link disabled'}, status=status.HTTP_410_GONE)
-        if link.is_expired:
+        if link_state == 'expired':
             return Response({'error': 'Link expired'}, status=status.HTTP_410_GONE)
 
-        return Response(InterviewShareLinkSerializer(link).data, status=status.HTTP_200_OK)
+        max_age = settings.SHARE_LINK_PUBLIC_MAX_AGE
+        remaining = seconds_until_expiry(entry)
+        if remaining is not None:
+            max_age = min(max_age, remaining)
+        return _conditional_response(request, entry['public'], entry['etag'], public=True, max_age=max_age)
 
     @action(detail=False, methods=['post'], url_path=r'public/(?P<token>[^/]+)/start')
     def start_from_link(self, request, token=None):
@@ -385,29 +645,40 @@ class ShareLinkViewSet(viewsets.ModelViewSet):
         Creates a new Interview record (one attempt per student). Optionally accepts
         `clerk_user_id` if the student is signed in.
         """
-        from .models import InterviewShareLink
-
-        try:
-            link = InterviewShareLink.objects.get(token=token)
-        except InterviewShareLink.DoesNotExist:
+        entry = resolve_share_link(token)
+        if entry is None:
             return Response({'error': 'Link not found'}, status=status.HTTP_404_NOT_FOUND)
 
-        if not link.is_active:
+        link_state = share_link_state(entry)
+        if link_state == 'disabled':
             return Response({'error': 'Link disabled'}, status=status.HTTP_410_GONE)
-        if link.is_expired:
+        if link_state == 'expired':
             return Response({'error': 'Link expired'}, status=status.HTTP_410_GONE)
 
         clerk_user_id = (request.data or {}).get('clerk_user_id') or ''
         if not str(clerk_user_id).strip():
             return Response({'error': 'Authentication required'}, status=status.HTTP_401_UNAUTHORIZED)
 
-        interview = Interview.objects.create(
-            clerk_user_id=str(clerk_user_id),
-            share_link=link,
-            job_title=link.role,
-            job_description=link.job_description,
-            difficulty=link.difficulty,
-        )
+        from .models import InterviewShareLink
+
+        with transaction.atomic():
+            # The cached entry may predate a delete or edit in another process;
+            # the row is locked so it can't be deleted before the attempt exists.
+            link = InterviewShareLink.objects.select_for_update().filter(pk=entry['public']['id']).first()
+            if link is None:
+                return Response({'error': 'Link not found'}, status=status.HTTP_404_NOT_FOUND)
+            if not link.is_active:
+                return Response({'error': 'Link disabled'}, status=status.HTTP_410_GONE)
+            if link.expires_at and timezone.now() >= link.expires_at:
+                return Response({'error': 'Link expired'}, status=status.HTTP_410_GONE)
+            interview = Interview.objects.create(
+                clerk_user_id=str(clerk_user_id),
+                share_link=link,
+                job_title=link.role,
+                job_description=link.job_description,
+                difficulty=link.difficulty,
+            )
+        sync_attempt_rollup(interview)
 
         thread = threading.Thread(target=generate_questions_async, args=(interview, None))
         thread.daemon = True
@@ -417,15 +688,68 @@ class ShareLinkViewSet(viewsets.ModelViewSet):
 
     @action(detail=True, methods=['get'])
     def attempts(self, request, pk=None):
-        """Interviewer: list attempts for a given share link."""
+        """Interviewer: list attempts for a given share link.
+
+        `?archived=true` lists the attempts moved out by archive_interviews.
+        """
+        link = self.get_object()
+        if _wants_archived(request):
+            attempts = link.archived_attempts.defer('detail', 'results').order_by('-created_at', 'id')
+            serializer_class = ArchivedInterviewSerializer
+        else:
+            attempts = link.interview_attempts.all().order_by('-created_at', 'id')
+            serializer_class = InterviewAttemptSerializer
+        page = self.paginate_queryset(attempts)
+        if page is not None:
+            return self.get_paginated_response(serializer_class(page, many=True).data)
+        return Response(serializer_class(attempts, many=True).data, status=status.HTTP_200_OK)
+
+    @action(detail=True, methods=['get'])
+    def analytics(self, request, pk=None):
+        """Interviewer: attempt analytics for one share link, from its rollup."""
         link = self.get_object()
-        attempts = link.interview_attempts.all().order_by('-created_at')
-        return Response(InterviewAttemptSerializer(attempts, many=True).data, status=status.HTTP_200_OK)
+        return Response(rollup_payload(getattr(link, 'rollup', None)), status=status.HTTP_200_OK)
+
+    @action(detail=False, methods=['get'], url_path='analytics')
+    def creator_analytics(self, request):
+        """Interviewer: attempt analytics across all links of `clerk_user_id`."""
+        clerk_user_id = request.query_params.get('clerk_user_id') or ''
+        if not clerk_user_id.strip():
+            return Response({'error': 'clerk_user_id is required'}, status=status.HTTP_400_BAD_REQUEST)
+        rollup = CreatorRollup.objects.filter(clerk_user_id=clerk_user_id).first()
+        return Response(rollup_payload(rollup), status=status.HTTP_200_OK)
+
+    @action(detail=True, methods=['get'])
+    def export(self, request, pk=None):
+        """Interviewer: download every attempt for a share link with its review scores.
+
+        `?file_format=csv` (default) or `jsonl`. The file is streamed while
+        attempts are read in fixed-size batches, so memory use does not grow
+        with the number of attempts.
+        """
+        file_format = request.query_params.get('file_format', 'csv')
+        if file_format not in EXPORT_FORMATS:
+            return Response(
+                {'error': f"file_format must be one of: {', '.join(EXPORT_FORMATS)}"},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+        link = self.get_object()
+        rows = iter_attempt_rows(link)
+        if file_format == 'csv':
+            response = StreamingHttpResponse(stream_csv(rows), content_type='text/csv; charset=utf-8')
+        else:
+            response = StreamingHttpResponse(stream_jsonl(rows), content_type='application/x-ndjson; charset=utf-8')
+        response['Content-Disposition'] = f'attachment; filename="share-link-{link.pk}-attempts.{file_format}"'
+        # Let nginx-style proxies pass chunks through as they are produced.
+        response['X-Accel-Buffering'] = 'no'
+        patch_cache_control(response, no_store=True)
+        return response
 
 
 class QuestionViewSet(viewsets.ReadOnlyModelViewSet):
-    queryset = Question.objects.all()
+    queryset = Question.objects.select_related('answer')
     serializer_class = QuestionSerializer
+    pagination_class = QuestionCursorPagination
 
     def get_queryset(self):
         interview_id = self.request.query_params.get('interview_id')
@@ -444,6 +768,30 @@ class AnswerViewSet(viewsets.ModelViewSet):
             return self.queryset.filter(question_id=question_id)
         return self.queryset
 
+    # Direct answer edits bypass submit_answer, so keep the interview's
+    # next-question cursor and results snapshot in step here too.
+
+    @transaction.atomic
+    def perform_create(self, serializer):
+        answer = serializer.save()
+        interview = answer.question.interview
+        interview.sync_question_cursor()
+        invalidate_results_snapshot(interview)
+
+    @transaction.atomic
+    def perform_update(self, serializer):
+        answer = serializer.save()
+        interview = answer.question.interview
+        interview.sync_question_cursor()
+        invalidate_results_snapshot(interview)
+
+    @transaction.atomic
+    def perform_destroy(self, instance):
+        interview = instance.question.interview
+        instance.delete()
+        interview.sync_question_cursor()
+        invalidate_results_snapshot(interview)
+
 
 @api_view(['POST'])
 def parse_resume(request):
@@ -452,26 +800,22 @@ def parse_resume(request):
 
     if not resume_file:
         return Response({'error': 'No resume file provided'}, status=status.HTTP_400_BAD_REQUEST)
+    if resume_file.size > settings.RESUME_MAX_UPLOAD_MB * 1024 * 1024:
+        return Response(
+            {'error': f'Resume is larger than {settings.RESUME_MAX_UPLOAD_MB:g} MB'},
+            status=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+        )
 
-    upload_dir = os.path.join(settings.MEDIA_ROOT, 'temp_resumes')
-    os.makedirs(upload_dir, exist_ok=True)
-
-    temp_path = os.path.join(upload_dir, f"temp_{resume_file.name}")
-
-    with open(temp_path, 'wb+') as destination:
-        for chunk in resume_file.chunks():
-            destination.write(chunk)
+    from .resume_parser import ResumeParser
 
+    # Parsed straight from the upload (memory or Django's temp file); nothing is written to media.
     parser = ResumeParser()
-    resume_text = parser._extract_text(temp_path)
-
-    # Clean up
-    try:
-        os.remove(temp_path)
-    except OSError:
-        pass
+    extracted = parser.extract_text(resume_file)
 
+    # Partial text is still returned when a size or time limit was hit.
     return Response({
         'success': True,
-        'text': resume_text or '',
+        'text': extracted['text'] if extracted else '',
+        'truncated': bool(extracted and extracted['truncated']),
+        'truncated_reason': extracted['reason'] if extracted and extracted['truncated'] else None,
     })
@@ -37,6 +37,26 @@ async function apiFetch<T = any>(path: string, options: FetchOptions = {}): Prom
   return JSON.parse(text) as T;
 }
 
+interface Page<T> {
+  next: string | null;
+  previous: string | null;
+  results: T[];
+}
+
+// List endpoints are cursor-paginated; follow `next` until the last page.
+async function apiFetchAll<T = any>(path: string, options: FetchOptions = {}): Promise<T[]> {
+  const first = await apiFetch<Page<T>>(path, options);
+  const results = [...first.results];
+  let next = first.next;
+  while (next) {
+    // `next` carries the original filters plus the cursor in its query string.
+    const page: Page<T> = await apiFetch(`${path}${new URL(next).search}`);
+    results.push(...page.results);
+    next = page.next;
+  }
+  return results;
+}
+
 export const healthAPI = {
   check: async () => {
     try {
@@ -53,7 +73,7 @@ export const healthAPI = {
 
 export const interviewAPI = {
   list: (clerkUserId: string) =>
-    apiFetch('/interviews/interviews/', { params: { clerk_user_id: clerkUserId } }),
+    apiFetchAll('/interviews/interviews/', { params: { clerk_user_id: clerkUserId } }),
 
   create: (data: {
     job_title: string;
@@ -83,6 +103,12 @@ export const interviewAPI = {
       body: JSON.stringify({ question_id: questionId, answer: answerText }),
     }),
 
+  submitAnswers: (interviewId: number | string, answers: { question_id: number; answer: string }[]) =>
+    apiFetch(`/interviews/interviews/${interviewId}/submit_answers/`, {
+      method: 'POST',
+      body: JSON.stringify({ answers }),
+    }),
+
   evaluateAnswer: (interviewId: number | string, data: {
     question_text: string;
     answer: string;
@@ -136,7 +162,7 @@ export const interviewAPI = {
 
 export const shareLinkAPI = {
   list: (params: { clerk_user_id?: string; created_by_email?: string } = {}) =>
-    apiFetch('/interviews/share-links/', {
+    apiFetchAll('/interviews/share-links/', {
       params: Object.fromEntries(
         Object.entries(params).filter(([_k, v]) => typeof v === 'string' && v.length > 0) as Array<[string, string]>
       ),
@@ -167,7 +193,7 @@ export const shareLinkAPI = {
     }),
 
   attempts: (shareLinkId: number | string) =>
-    apiFetch(`/interviews/share-links/${shareLinkId}/attempts/`),
+    apiFetchAll(`/interviews/share-links/${shareLinkId}/attempts/`),
 
   delete: (shareLinkId: number | string, clerkUserId: string) =>
     apiFetch(`/interviews/share-links/${shareLinkId}/`, {
@@ -194,7 +220,7 @@ export const fileParseAPI = {
       const errorBody = await res.text().catch(() => '');
       throw new Error(`API error ${res.status}: ${errorBody}`);
     }
-    return res.json() as Promise<{ success: boolean; text: string }>;
+    return res.json() as Promise<{ success: boolean; text: string; truncated: boolean; truncated_reason: string | null }>;
   },
 };
 